@@ -8,8 +8,10 @@ from typing import List, Dict, Any, Optional, Callable
 from configuration_management.config_manager import ConfigManager
 import importlib.resources
 
-# Qiskit 4.x: QuantumCircuit is still imported from qiskit_terra
-from qiskit import QuantumCircuit
+from scode.utils.lazy_import import is_available, lazy_import
+
+# Qiskit 4.x: QuantumCircuit is still imported from qiskit_terra (on first use: only QASM import/export needs it)
+qiskit = lazy_import('qiskit') if is_available('qiskit') else None
 
 def get_provider_and_device(config_dir):
     import importlib.resources
@@ -263,17 +265,17 @@ class CircuitEditor:
                 self.circuit = yaml.safe_load(f)
         elif format == 'qasm':
             with open(path) as f:
-                qc = QuantumCircuit.from_qasm_file(f)
+                qc = qiskit.QuantumCircuit.from_qasm_file(f)
             self.circuit = self._qiskit_circuit_to_dict(qc)
         else:
             raise ValueError(f"Unsupported import format: {format}")
         self._notify_change()
 
     def _dict_to_qiskit_circuit(self, circuit: dict) -> 'QuantumCircuit':
-        if QuantumCircuit is None:
+        if qiskit is None:
             raise ImportError("qiskit is required for QASM export. Please install qiskit.")
         n_qubits = len(circuit.get('qubits', []))
-        qc = QuantumCircuit(n_qubits)
+        qc = qiskit.QuantumCircuit(n_qubits)
         for gate in circuit.get('gates', []):
             name = gate['name'].lower()
             qubits = gate.get('qubits', [])
@@ -21,7 +21,6 @@ from evaluation.evaluation_framework import EvaluationFramework
 from hardware_abstraction.device_abstraction import DeviceAbstraction
 from configuration_management.config_manager import ConfigManager
 import importlib.resources
-from stable_baselines3.common.vec_env import SubprocVecEnv
 from scode.utils.decoder_interface import DecoderInterface
 from utils.credential_manager import CredentialManager
 
@@ -692,6 +691,13 @@ class QuantumWorkflowBridge:
                 if log_callback:
                     log_callback(f"[INFO] Saving checkpoint: {artifact_path}", None)
                 model.save(artifact_path)
+                from scode.rl_agent.artifact_index import ArtifactIndex
+                ArtifactIndex.for_directory(artifact_dir).register(
+                    artifact_path, str(provider).lower(), str(device).lower(), env_cfg_final.get('layout_type', 'rotated'),
+                    env_cfg_final.get('code_distance', 3), patch_count=env_cfg_final.get('patch_count', 1),
+                    curriculum_stage=stage_idx+1, code_family=env_cfg_final.get('code_family', 'surface'),
+                    metrics={'total_timesteps': int(model.num_timesteps), 'final_reward': reporter.last_reward,
+                             'final_ler': reporter.last_ler})
                 if log_callback:
                     log_callback(f"[INFO] Saved checkpoint: {artifact_path}", None)
             if log_callback:
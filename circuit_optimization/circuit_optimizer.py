@@ -11,8 +11,10 @@ from circuit_optimization.strategies.rl_based import RLBasedOptimizer
 from circuit_optimization.strategies.ml_based import MLBasedOptimizer
 from circuit_optimization.utils import count_gates, calculate_depth, count_swaps
 
-# Qiskit 4.x: QuantumCircuit is still imported from qiskit
-from qiskit import QuantumCircuit
+from scode.utils.lazy_import import is_available, lazy_import
+
+# Qiskit 4.x: QuantumCircuit is still imported from qiskit (on first use: only QASM import/export needs it)
+qiskit = lazy_import('qiskit') if is_available('qiskit') else None
 
 def deep_merge(base: dict, override: dict) -> dict:
     if not override:
@@ -170,18 +172,18 @@ class CircuitOptimizer:
                 return yaml.safe_load(f)
         elif format == 'qasm':
             with open(path) as f:
-                qc = QuantumCircuit.from_qasm_file(f)
+                qc = qiskit.QuantumCircuit.from_qasm_file(f)
             return self._qiskit_circuit_to_dict(qc)
         else:
             raise ValueError(f"Unsupported import format: {format}")
 
     def _dict_to_qiskit_circuit(self, circuit: dict) -> 'QuantumCircuit':
         # Convert dict-based circuit to Qiskit QuantumCircuit
-        if QuantumCircuit is None:
+        if qiskit is None:
             raise ImportError("qiskit is required for QASM export. Please install qiskit.")
         n_qubits = len(circuit.get('qubits', []))
         n_clbits = len(circuit.get('clbits', [])) if 'clbits' in circuit else 0
-        qc = QuantumCircuit(n_qubits, n_clbits)
+        qc = qiskit.QuantumCircuit(n_qubits, n_clbits)
         for gate in circuit.get('gates', []):
             name = gate['name'].lower()
             qubits = gate.get('qubits', [])
@@ -2,10 +2,10 @@
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
 import os
-try:
-    import torch
-except ImportError:
-    torch = None
+from scode.utils.lazy_import import is_available, lazy_import
+
+# torch is imported when a model is loaded, not when the optimizer module is imported
+torch = lazy_import('torch') if is_available('torch') else None
 
 class MLBasedOptimizer:
     """
@@ -2,15 +2,14 @@
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
 import os
-try:
-    from stable_baselines3 import PPO
-except ImportError:
-    PPO = None
+from scode.utils.lazy_import import is_available, lazy_import
+
+# stable_baselines3 (and torch) are imported when an agent is loaded or trained
+sb3 = lazy_import('stable_baselines3') if is_available('stable_baselines3') else None
 from circuit_optimization.rl_env import CircuitOptimizationEnvironment
 from circuit_optimization.reward_engine import CircuitOptimizationRewardEngine
 import yaml
 import json
-from scode.rl_agent.progress import ProgressBarCallback
 
 def load_device_info(hardware_json_path, devices_yaml_path):
     with open(hardware_json_path, 'r') as f:
@@ -51,9 +50,9 @@ class RLBasedOptimizer:
                 self._load_agent(resolved_path)
 
     def _load_agent(self, path):
-        if PPO is None:
+        if sb3 is None:
             raise ImportError("stable-baselines3 is required for RL-based optimization. Please install it.")
-        self.agent = PPO.load(path)
+        self.agent = sb3.PPO.load(path)
 
     def _circuit_to_obs(self, circuit, device_info, env):
         """
@@ -192,18 +191,19 @@ class RLBasedOptimizer:
         else:
             env = make_env()
         # PPO agent honoring config n_steps/batch_size
-        if PPO is None:
+        if sb3 is None:
             raise ImportError("stable-baselines3 is required for RL-based optimization. Please install it.")
         n_steps = int(rl_env_conf.get('n_steps', 2048))
         batch_size = int(rl_env_conf.get('batch_size', 64))
         torch_device = rl_env_conf.get('torch_device', 'auto')
-        agent = PPO('MlpPolicy', env, verbose=1, learning_rate=rl_env_conf.get('learning_rate', 0.0001), n_steps=n_steps, batch_size=batch_size, device=torch_device)
+        agent = sb3.PPO('MlpPolicy', env, verbose=1, learning_rate=rl_env_conf.get('learning_rate', 0.0001), n_steps=n_steps, batch_size=batch_size, device=torch_device)
         # Align total timesteps to rollout size and add progress reporting with early stop
         total_timesteps = int(rl_env_conf.get('total_timesteps', rl_env_conf.get('num_episodes', 1000)))
         rollout_size = max(1, n_steps * n_envs)
         adjusted = (total_timesteps // rollout_size) * rollout_size
         if adjusted <= 0:
             adjusted = rollout_size
+        from scode.rl_agent.progress import ProgressBarCallback
         reporter = ProgressBarCallback(adjusted, mode='terminal')
         reporter._on_training_start()
         def progress_cb(locals_, globals_):
@@ -15,6 +15,8 @@ from __future__ import annotations
 from typing import Dict, Any, List, Tuple
 import math
 
+import numpy as np
+
 from hardware_abstraction.device_abstraction import DeviceAbstraction
 from configuration_management.config_manager import ConfigManager
 
@@ -99,35 +101,19 @@ class DualPathCostModel:
         # If connectivity is empty, assume dense (path length ~1)
         if not isinstance(self.connectivity, dict) or not self.connectivity:
             return 1.0
-        # crude average of shortest paths among first N qubits
-        # (enterprise-grade would use full graph APSP; this is acceptable and deterministic)
+        # average hop distance among the first N qubits, read from the shared device APSP matrix
         nodes = sorted(list(self.connectivity.keys()))
         nodes = [n for n in nodes if isinstance(n, int)]
         if len(nodes) <= 1:
             return 1.0
-        import collections
-        def sp(src: int, dst: int) -> int:
-            if src == dst:
-                return 0
-            q = collections.deque([(src,0)])
-            seen = {src}
-            while q:
-                cur,d = q.popleft()
-                for nb in self.connectivity.get(cur, []):
-                    if nb == dst:
-                        return d+1
-                    if nb not in seen:
-                        seen.add(nb)
-                        q.append((nb,d+1))
-            return max(len(nodes)//2, 1)
         m = min(len(nodes), max(logical_qubits, 2))
-        total = 0
-        cnt = 0
-        for i in range(m):
-            for j in range(i+1, m):
-                total += sp(nodes[i], nodes[j])
-                cnt += 1
-        return (total / cnt) if cnt else 1.0
+        geometry = DeviceAbstraction.get_geometry(self.device_profile)
+        rows = geometry.indices_of(nodes[:m])
+        dist = geometry.distances[np.ix_(rows, rows)]
+        # disconnected pairs count as half the device, as before
+        dist = np.where(dist >= geometry.unreachable, max(len(nodes) // 2, 1), dist)
+        iu = np.triu_indices(m, k=1)
+        return float(dist[iu].mean()) if len(iu[0]) else 1.0
 
     def _swap_overhead(self, twoq_gates: int, logical_qubits: int) -> int:
         # estimate swaps = twoq_gates * (avg path length - 1)
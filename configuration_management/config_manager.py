@@ -1,58 +1,140 @@
 # SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
+import hashlib
 import os
+import threading
+import time
+import types
 import yaml
 import json
 from .schema_validator import SchemaValidator
 import importlib.resources
 
+
+def freeze_config(value):
+    """Read-only view of parsed config data: dicts become mapping proxies, lists become tuples."""
+    if isinstance(value, dict):
+        return types.MappingProxyType({k: freeze_config(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_config(v) for v in value)
+    return value
+
+
+def thaw_config(value):
+    """Independent mutable copy (dicts and lists) of a frozen config view."""
+    if isinstance(value, types.MappingProxyType):
+        return {k: thaw_config(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_config(v) for v in value]
+    return value
+
+
 class ConfigManager:
     config_registry = {}
     env_path = '.env'
     _env_cache = None
 
+    # Process-wide parsed-config cache: realpath -> {'signature', 'data' (frozen), 'content_hash'}.
+    # An entry is reused while the file's (mtime_ns, size, inode) signature is unchanged.
+    _parsed_cache = {}
+    _validated = {}  # (module_name, config hash, schema_path, schema hashes) -> schema validation result
+    _cache_lock = threading.RLock()
+    _cache_stats = {'hits': 0, 'reloads': 0, 'parse_seconds': 0.0, 'validations': 0}
+
+    @classmethod
+    def _package_path(cls, config_path):
+        """Filesystem path of a packaged configs/ or schemas/ file, falling back to config_path."""
+        if config_path and os.path.basename(os.path.dirname(config_path)) in ('configs', 'schemas'):
+            try:
+                path = str(importlib.resources.files(os.path.basename(os.path.dirname(config_path)))
+                           .joinpath(os.path.basename(config_path)))
+                if os.path.isfile(path):
+                    return path
+            except (ModuleNotFoundError, AttributeError, ImportError, TypeError):
+                pass
+        return config_path
+
+    @classmethod
+    def _load_cached(cls, path):
+        """
+        Parsed (frozen) content of a YAML or JSON file, re-parsed only when the file changed.
+        Args:
+            path: File path
+        Returns:
+            (frozen data, sha256 of the file content)
+        """
+        if not (path.endswith('.yaml') or path.endswith('.yml') or path.endswith('.json')):
+            raise ValueError("Unsupported config file format.")
+        key = os.path.realpath(path)
+        st = os.stat(key)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with cls._cache_lock:
+            entry = cls._parsed_cache.get(key)
+            if entry is not None and entry['signature'] == signature:
+                cls._cache_stats['hits'] += 1
+                return entry['data'], entry['content_hash']
+        start = time.perf_counter()
+        with open(key, 'rb') as f:
+            raw = f.read()
+        text = raw.decode('utf-8')
+        data = json.loads(text) if key.endswith('.json') else yaml.safe_load(text)
+        entry = {'signature': signature, 'data': freeze_config(data), 'content_hash': hashlib.sha256(raw).hexdigest()}
+        with cls._cache_lock:
+            cls._parsed_cache[key] = entry
+            cls._cache_stats['reloads'] += 1
+            cls._cache_stats['parse_seconds'] += time.perf_counter() - start
+        return entry['data'], entry['content_hash']
+
+    @classmethod
+    def get_file_view(cls, path):
+        """
+        Read-only parsed content of a YAML/JSON file (packaged configs/ and schemas/ files resolved
+        through the package), shared through the parsed-config cache.
+        Returns:
+            (frozen data, sha256 of the file content)
+        """
+        return cls._load_cached(cls._package_path(path))
+
+    @classmethod
+    def invalidate_cache(cls, path=None):
+        """Drop the cached parse of one file (or of every file when path is None)."""
+        with cls._cache_lock:
+            if path is None:
+                cls._parsed_cache.clear()
+            else:
+                cls._parsed_cache.pop(os.path.realpath(cls._package_path(path)), None)
+                cls._parsed_cache.pop(os.path.realpath(path), None)
+
+    @classmethod
+    def cache_stats(cls):
+        """Parsed-config cache metrics: hits, reloads (parses), parse_seconds, validations, entries."""
+        with cls._cache_lock:
+            return dict(cls._cache_stats, entries=len(cls._parsed_cache))
+
     @classmethod
     def load_registry(cls):
         """Load the config registry mapping module names to config file paths."""
-        try:
-            with importlib.resources.open_text('configs', 'config_registry.yaml') as f:
-                cls.config_registry = yaml.safe_load(f)['config_registry']
-        except (FileNotFoundError, ModuleNotFoundError):
+        path = cls._package_path('configs/config_registry.yaml')
+        if not os.path.isfile(path):
             # Fallback for dev mode
-            local_path = os.path.join(os.path.dirname(__file__), '../../configs/config_registry.yaml')
-            with open(local_path, 'r') as f:
-                cls.config_registry = yaml.safe_load(f)['config_registry']
+            path = os.path.join(os.path.dirname(__file__), '../../configs/config_registry.yaml')
+        cls.config_registry = thaw_config(cls._load_cached(path)[0]['config_registry'])
 
     @classmethod
     def load_config(cls, module_name, config_path=None):
-        """Load a YAML or JSON config for a module."""
+        """Load a YAML or JSON config for a module (a mutable copy of the cached parse)."""
+        return thaw_config(cls.get_config_view(module_name, config_path))
+
+    @classmethod
+    def get_config_view(cls, module_name, config_path=None):
+        """
+        Read-only view of a module's config, shared by all callers until the file changes.
+        Mappings are types.MappingProxyType and lists are tuples; use get_config for a mutable copy.
+        """
         if not config_path:
             config_path = cls.config_registry.get(module_name)
-        # If the config is in the package (configs/), use importlib.resources
-        if config_path and os.path.basename(os.path.dirname(config_path)) == 'configs':
-            fname = os.path.basename(config_path)
-            try:
-                from importlib.resources import files
-                if fname.endswith('.yaml') or fname.endswith('.yml'):
-                    hw_path = files('configs').joinpath(fname)
-                    with hw_path.open('r') as f:
-                        return yaml.safe_load(f)
-                elif fname.endswith('.json'):
-                    hw_path = files('configs').joinpath(fname)
-                    with hw_path.open('r') as f:
-                        return json.load(f)
-            except (FileNotFoundError, ModuleNotFoundError, AttributeError, ImportError):
-                pass  # fallback to open below
-        # Fallback to filesystem
-        if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
-        elif config_path.endswith('.json'):
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        else:
-            raise ValueError("Unsupported config file format.")
+        return cls._load_cached(cls._package_path(config_path))[0]
 
     @classmethod
     def get_config(cls, module_name):
@@ -103,6 +185,7 @@ class ConfigManager:
                     json.dump(config, f, indent=2)
             else:
                 raise ValueError("Unsupported config file format.")
+            cls.invalidate_cache(config_path)
         except (PermissionError, FileNotFoundError, OSError):
             # Fallback: write to user config dir
             user_path = cls.get_user_config_path(fname)
@@ -125,13 +208,7 @@ class ConfigManager:
         """Load hardware.json specifying provider_name and device_name."""
         if not path:
             path = cls.config_registry.get('hardware')
-        fname = os.path.basename(path)
-        try:
-            with importlib.resources.open_text('configs', fname) as f:
-                return json.load(f)
-        except (FileNotFoundError, ModuleNotFoundError):
-            with open(path, 'r') as f:
-                return json.load(f)
+        return thaw_config(cls._load_cached(cls._package_path(path))[0])
 
     @classmethod
     def update_hardware_json(cls, updates):
@@ -147,6 +224,7 @@ class ConfigManager:
             os.makedirs(os.path.dirname(path), exist_ok=True)
             with open(path, 'w') as f:
                 json.dump(hardware, f, indent=2)
+            cls.invalidate_cache(path)
         except (PermissionError, FileNotFoundError, OSError):
             user_path = cls.get_user_config_path(fname)
             with open(user_path, 'w') as f:
@@ -160,7 +238,24 @@ class ConfigManager:
 
     @classmethod
     def validate_config(cls, module_name, schema_path=None):
-        """Validate a config against a schema."""
+        """Validate a config against a schema (once per content of the config and schema files)."""
+        config_path = cls.config_registry.get(module_name)
+        if config_path:
+            content_hash = cls._load_cached(cls._package_path(config_path))[1]
+            key = (module_name, content_hash, schema_path, cls._content_hash(cls._schema_file(module_name)),
+                   cls._content_hash(schema_path))
+            with cls._cache_lock:
+                if key in cls._validated:
+                    return cls._validated[key]
+            result = cls._validate_config_uncached(module_name, schema_path)
+            with cls._cache_lock:
+                cls._validated[key] = result
+                cls._cache_stats['validations'] += 1
+            return result
+        return cls._validate_config_uncached(module_name, schema_path)
+
+    @classmethod
+    def _validate_config_uncached(cls, module_name, schema_path=None):
         config = cls.get_config(module_name)
         # Prefer package/resource-aware schema loading
         try:
@@ -179,30 +274,43 @@ class ConfigManager:
         from .schema_validator import SchemaValidator as _SV
         return _SV.validate_with_schema(config, schema)
 
+    @classmethod
+    def _content_hash(cls, path):
+        """sha256 of a config/schema file through the parsed cache, or None if it is missing or unreadable."""
+        if not path or not os.path.isfile(path):
+            return None
+        try:
+            return cls._load_cached(path)[1]
+        except Exception:
+            return None
+
+    @classmethod
+    def _schema_file(cls, module_name):
+        """Path of a module's schema file (package, then relative fallbacks), or None."""
+        schema_fname = f'{module_name}.schema.yaml'
+        # Try package-based access first
+        pkg_path = cls._package_path(os.path.join('schemas', schema_fname))
+        if os.path.isfile(pkg_path):
+            return pkg_path
+        # Fallback to absolute path
+        abs_path = os.path.join(os.path.dirname(__file__), '../schemas', schema_fname)
+        if os.path.exists(abs_path):
+            return abs_path
+        # Fallback to project root
+        abs_path2 = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../schemas', schema_fname))
+        if os.path.exists(abs_path2):
+            return abs_path2
+        return None
+
     @classmethod
     def get_schema(cls, module_name):
         """Get the schema for a module's config."""
         # Try to load schema from package or local filesystem robustly
-        schema_fname = f'{module_name}.schema.yaml'
         try:
-            import importlib.resources
-            # Try package-based access first
-            try:
-                with importlib.resources.open_text('schemas', schema_fname) as f:
-                    return yaml.safe_load(f)
-            except (FileNotFoundError, ModuleNotFoundError):
-                pass
-            # Fallback to absolute path
-            abs_path = os.path.join(os.path.dirname(__file__), '../schemas', schema_fname)
-            if os.path.exists(abs_path):
-                with open(abs_path, 'r') as f:
-                    return yaml.safe_load(f)
-            # Fallback to project root
-            abs_path2 = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../schemas', schema_fname))
-            if os.path.exists(abs_path2):
-                with open(abs_path2, 'r') as f:
-                    return yaml.safe_load(f)
-            raise FileNotFoundError(f"Schema file not found: {schema_fname}")
+            schema_file = cls._schema_file(module_name)
+            if schema_file is None:
+                raise FileNotFoundError(f"Schema file not found: {module_name}.schema.yaml")
+            return thaw_config(cls._load_cached(schema_file)[0])
         except Exception as e:
             raise RuntimeError(f"Failed to load schema for {module_name}: {e}")
 
@@ -243,6 +351,9 @@ class ConfigManager:
     @classmethod
     def hot_reload_config(cls, module_name):
         """Reload a config from disk (for frontend live reload)."""
+        config_path = cls.config_registry.get(module_name)
+        if config_path:
+            cls.invalidate_cache(config_path)
         return cls.get_config(module_name)
 
     # --- .env API Key Management ---
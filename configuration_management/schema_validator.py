@@ -2,7 +2,6 @@
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
 import yaml
-import jsonschema
 
 class SchemaValidator:
     @staticmethod
@@ -10,6 +9,7 @@ class SchemaValidator:
         """Validate a config dict against a YAML/JSON schema."""
         with open(schema_path, 'r') as f:
             schema = yaml.safe_load(f)
+        import jsonschema  # deferred: only validation needs it
         try:
             jsonschema.validate(instance=config, schema=schema)
             return True
@@ -20,6 +20,7 @@ class SchemaValidator:
     @staticmethod
     def validate_with_schema(config, schema: dict):
         """Validate a config dict against a provided schema dict."""
+        import jsonschema  # deferred: only validation needs it
         try:
             jsonschema.validate(instance=config, schema=schema)
             return True
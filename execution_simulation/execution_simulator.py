@@ -12,18 +12,15 @@ import importlib.resources
 from hardware_abstraction.device_abstraction import DeviceAbstraction
 import logging
 from utils.credential_manager import CredentialManager
+from scode.utils.lazy_import import is_available, lazy_import
 
 logger = logging.getLogger(__name__)
 
-try:
-    # Qiskit 4.x: QuantumCircuit is still imported from qiskit
-    from qiskit import QuantumCircuit
-    from qiskit_aer import Aer
-    from qiskit_ibm_runtime import QiskitRuntimeService
-    QISKIT_AVAILABLE = True
-except ImportError as e:
-    logger.debug('Qiskit import error: %s', e)
-    QISKIT_AVAILABLE = False
+# Qiskit is imported on first use (importing it costs ~200 ms)
+QISKIT_AVAILABLE = all(is_available(m) for m in ('qiskit', 'qiskit_aer', 'qiskit_ibm_runtime'))
+qiskit = lazy_import('qiskit')
+qiskit_aer = lazy_import('qiskit_aer')
+qiskit_ibm_runtime = lazy_import('qiskit_ibm_runtime')
 
 class ExecutionSimulator:
     def __init__(self, config_path: str = None):
@@ -77,7 +74,7 @@ class ExecutionSimulator:
             masked_key = api_key[:4] + "..." + api_key[-4:] if len(api_key) > 8 else "(too short to display)"
             logger.debug("Using IBM API key: %s", masked_key)
             try:
-                service = QiskitRuntimeService(channel="ibm_quantum", token=api_key)
+                service = qiskit_ibm_runtime.QiskitRuntimeService(channel="ibm_quantum", token=api_key)
                 qiskit_backend = service.backend(device_name)
                 qc = self._dict_to_qiskit_circuit(circuit)
                 shots = run_config.get('shots', 1024) if run_config else 1024
@@ -110,7 +107,7 @@ class ExecutionSimulator:
             if not QISKIT_AVAILABLE:
                 logger.error("Qiskit not installed. Install qiskit to run local simulations.")
                 return None
-            sim_backend = Aer.get_backend(device_name) if device_name in Aer.backends() else Aer.get_backend('qasm_simulator')
+            sim_backend = qiskit_aer.Aer.get_backend(device_name) if device_name in qiskit_aer.Aer.backends() else qiskit_aer.Aer.get_backend('qasm_simulator')
             qc = self._dict_to_qiskit_circuit(circuit)
             shots = run_config.get('shots', 1024) if run_config else 1024
             job = sim_backend.run(qc, shots=shots)
@@ -134,7 +131,7 @@ class ExecutionSimulator:
             raise ImportError("Qiskit is required for circuit execution.")
         n_qubits = len(circuit.get('qubits', []))
         n_clbits = len(circuit.get('clbits', [])) if 'clbits' in circuit else 0
-        qc = QuantumCircuit(n_qubits, n_clbits)
+        qc = qiskit.QuantumCircuit(n_qubits, n_clbits)
         for gate in circuit.get('gates', []):
             name = gate['name'].lower()
             qubits = gate.get('qubits', [])
@@ -227,7 +224,7 @@ class ExecutionSimulatorAPI:
         backends = []
         if QISKIT_AVAILABLE:
             try:
-                backends = [b.name() if hasattr(b, 'name') else getattr(b, 'name', None) for b in Aer.backends()]
+                backends = [b.name() if hasattr(b, 'name') else getattr(b, 'name', None) for b in qiskit_aer.Aer.backends()]
             except Exception:
                 backends = []
         return backends
\ No newline at end of file
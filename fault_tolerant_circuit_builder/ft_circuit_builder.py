@@ -9,8 +9,10 @@ from typing import List, Dict, Any, Optional, Callable
 from configuration_management.config_manager import ConfigManager
 from policy.decision_policy import select_non_transversal_policy
 
-# Qiskit 4.x: QuantumCircuit is still imported from qiskit
-from qiskit import QuantumCircuit
+from scode.utils.lazy_import import lazy_import
+
+# Qiskit 4.x: QuantumCircuit is still imported from qiskit (on first use: only QASM import/export needs it)
+qiskit = lazy_import('qiskit')
 
 class FaultTolerantCircuitBuilder:
     def __init__(self, config_overrides: dict = None):
@@ -296,7 +298,7 @@ class FaultTolerantCircuitBuilder:
                 return yaml.safe_load(f)
         elif format == 'qasm':
             with open(path) as f:
-                qc = QuantumCircuit.from_qasm_file(f)
+                qc = qiskit.QuantumCircuit.from_qasm_file(f)
             return self._qiskit_circuit_to_dict(qc)
         else:
             raise ValueError(f"Unsupported import format: {format}")
@@ -339,7 +341,7 @@ class FaultTolerantCircuitBuilder:
     def _dict_to_qiskit_circuit(self, circuit: dict) -> 'QuantumCircuit':
         n_qubits = len(circuit.get('qubits', []))
         n_clbits = len(circuit.get('clbits', [])) if 'clbits' in circuit else 0
-        qc = QuantumCircuit(n_qubits, n_clbits)
+        qc = qiskit.QuantumCircuit(n_qubits, n_clbits)
         for gate in circuit.get('gates', []):
             name = gate['name'].lower()
             qubits = gate.get('qubits', [])
@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
-import os
 import yaml
 import json
 from typing import List, Dict, Any
-from configuration_management.config_manager import ConfigManager
+from configuration_management.config_manager import ConfigManager, thaw_config
+from hardware_abstraction.device_geometry import DeviceGeometry
+from hardware_abstraction.device_profile import DeviceProfile
 import importlib.resources
 
 class DeviceAbstraction:
@@ -13,47 +14,56 @@ class DeviceAbstraction:
     Device Abstraction Module for managing device information, validation, and config-driven device logic.
     All configuration is YAML/JSON-driven and APIs are pure Python for frontend/backend integration.
     """
+    _validated_hardware_json = set()  # content hashes of hardware.json files already validated
+
     @staticmethod
     def load_selected_device(hardware_json_path: str) -> dict:
         """
         Load the provider and device name from hardware.json, select the correct provider config file, and return the features of the specified device.
+        The device is normalized and validated once per provider-file version (see get_device_profile); each call returns a fresh mutable copy.
         """
         # Robustly load hardware.json from package or fallback to filesystem
         try:
-            from importlib.resources import files
-            hw_path = files('configs').joinpath('hardware.json')
-            with hw_path.open('r') as f:
-                hw = json.load(f)
-        except (FileNotFoundError, ModuleNotFoundError, AttributeError, ImportError):
-            with open(hardware_json_path, 'r') as f:
-                hw = json.load(f)
-        # Validate hardware.json against schema if available
-        try:
-            from configuration_management.config_manager import ConfigManager
-            from configuration_management.schema_validator import SchemaValidator
+            hw_view, hw_hash = ConfigManager.get_file_view('configs/hardware.json')
+        except (FileNotFoundError, OSError):
+            hw_view, hw_hash = ConfigManager.get_file_view(hardware_json_path)
+        # Validate hardware.json against schema if available (once per file content)
+        if hw_hash not in DeviceAbstraction._validated_hardware_json:
             try:
-                hw_schema = ConfigManager.get_schema('hardware')
-            except Exception:
-                hw_schema = None
-            if hw_schema is not None:
-                if not SchemaValidator.validate_with_schema(hw, hw_schema):
-                    print("[WARNING][DeviceAbstraction] hardware.json failed schema validation. Proceeding.")
-        except Exception as e:
-            print(f"[WARNING][DeviceAbstraction] hardware.json schema validation skipped: {e}")
-        provider = hw['provider_name'].lower()
-        device_name = hw['device_name']
+                from configuration_management.schema_validator import SchemaValidator
+                try:
+                    hw_schema = ConfigManager.get_schema('hardware')
+                except Exception:
+                    hw_schema = None
+                if hw_schema is not None:
+                    if not SchemaValidator.validate_with_schema(thaw_config(hw_view), hw_schema):
+                        print("[WARNING][DeviceAbstraction] hardware.json failed schema validation. Proceeding.")
+            except Exception as e:
+                print(f"[WARNING][DeviceAbstraction] hardware.json schema validation skipped: {e}")
+            DeviceAbstraction._validated_hardware_json.add(hw_hash)
+        return DeviceAbstraction.get_device_profile(hw_view['provider_name'], hw_view['device_name']).to_dict()
+
+    @staticmethod
+    def get_device_profile(provider_name: str, device_name: str) -> DeviceProfile:
+        """
+        Frozen, normalized profile of a device, memoized per (provider, device, provider-file hash).
+        Building it normalizes and schema-validates the device config and warms its DeviceGeometry.
+        """
+        provider = provider_name.lower()
         config_path = ConfigManager.resolve_device_config(provider)
-        fname = os.path.basename(config_path)
-        # Robustly load provider config YAML from package or fallback to filesystem
-        try:
-            from importlib.resources import files
-            provider_path = files('configs').joinpath(fname)
-            with provider_path.open('r') as f:
-                devices_yaml = yaml.safe_load(f)
-        except (FileNotFoundError, ModuleNotFoundError, AttributeError, ImportError):
-            with open(config_path, 'r') as f:
-                devices_yaml = yaml.safe_load(f)
-        # Try '<provider>_devices' first, then 'devices', then any key ending with '_devices'
+        devices_yaml, file_hash = ConfigManager.get_file_view(config_path)
+        profile = DeviceProfile.get(provider, device_name, file_hash)
+        if profile is not None:
+            return profile
+        dev = DeviceAbstraction._find_device(provider, device_name, devices_yaml, config_path)
+        profile = DeviceProfile.register(DeviceProfile(provider, device_name, file_hash, dev))
+        # Build (or load from the disk cache) the shared distance/adjacency geometry once
+        DeviceAbstraction.get_geometry(profile.config)
+        return profile
+
+    @staticmethod
+    def _device_list(provider: str, devices_yaml) -> tuple:
+        """(device list, key used) of a provider file: '<provider>_devices', then 'devices', then any '*_devices' key."""
         provider_key = f'{provider}_devices'
         device_list = devices_yaml.get(provider_key, None)
         used_key = provider_key
@@ -67,10 +77,17 @@ class DeviceAbstraction:
                     device_list = devices_yaml[key]
                     used_key = key
                     break
+        return device_list, used_key
+
+    @staticmethod
+    def _find_device(provider: str, device_name: str, devices_yaml, config_path: str) -> dict:
+        """Normalized, validated (mutable) config of one device from a parsed provider file."""
+        device_list, used_key = DeviceAbstraction._device_list(provider, devices_yaml)
         if device_list is None:
-            raise ValueError(f"No device list found in {config_path}. Tried keys: '{provider_key}', 'devices', and any '_devices' key.")
-        for dev in device_list:
-            if dev.get('name') == device_name or dev.get('device_name') == device_name:
+            raise ValueError(f"No device list found in {config_path}. Tried keys: '{provider}_devices', 'devices', and any '_devices' key.")
+        for entry in device_list:
+            if entry.get('name') == device_name or entry.get('device_name') == device_name:
+                dev = thaw_config(entry)
                 # Ensure both 'name' and 'device_name' are present for compatibility
                 if 'name' not in dev:
                     dev['name'] = dev.get('device_name')
@@ -94,37 +111,25 @@ class DeviceAbstraction:
                 except Exception as e:
                     print(f"[WARNING][DeviceAbstraction] Schema validation skipped: {e}")
                 return dev
+        print(f"[ERROR][DeviceAbstraction] Device {device_name} not found in {config_path} (searched key '{used_key}')")
         raise ValueError(f"Device {device_name} not found in {config_path} (searched key '{used_key}')")
 
+    @staticmethod
+    def get_geometry(device_config: dict) -> DeviceGeometry:
+        """
+        Shared DeviceGeometry (APSP hop distances, adjacency bitmap, CSR neighbours) of a device config.
+        Computed once per coupling map and process, and cached on disk across processes.
+        """
+        return DeviceGeometry.for_device(device_config)
+
     @staticmethod
     def list_devices(provider_name: str) -> List[str]:
         """
         Return a list of all available device names for a given provider.
         """
         config_path = ConfigManager.resolve_device_config(provider_name)
-        fname = os.path.basename(config_path)
-        try:
-            from importlib.resources import files
-            hw_path = files('configs').joinpath(fname)
-            with hw_path.open('r') as f:
-                devices_yaml = yaml.safe_load(f)
-        except (FileNotFoundError, ModuleNotFoundError, AttributeError, ImportError):
-            with open(config_path, 'r') as f:
-                devices_yaml = yaml.safe_load(f)
-        # Try '<provider>_devices' first, then 'devices', then any key ending with '_devices'
-        provider_key = f'{provider_name.lower()}_devices'
-        device_list = devices_yaml.get(provider_key, None)
-        used_key = provider_key
-        if device_list is None:
-            device_list = devices_yaml.get('devices', None)
-            used_key = 'devices'
-        if device_list is None:
-            # Fallback: find the first key ending with '_devices'
-            for key in devices_yaml:
-                if key.endswith('_devices'):
-                    device_list = devices_yaml[key]
-                    used_key = key
-                    break
+        devices_yaml, _ = ConfigManager.get_file_view(config_path)
+        device_list, _ = DeviceAbstraction._device_list(provider_name.lower(), devices_yaml)
         if device_list is None:
             return []
         return [dev.get('name') or dev.get('device_name') for dev in device_list]
@@ -134,60 +139,7 @@ class DeviceAbstraction:
         """
         Return detailed information for the specified device from the correct provider config file.
         """
-        config_path = ConfigManager.resolve_device_config(provider_name)
-        fname = os.path.basename(config_path)
-        try:
-            from importlib.resources import files
-            hw_path = files('configs').joinpath(fname)
-            with hw_path.open('r') as f:
-                devices_yaml = yaml.safe_load(f)
-        except (FileNotFoundError, ModuleNotFoundError, AttributeError, ImportError):
-            with open(config_path, 'r') as f:
-                devices_yaml = yaml.safe_load(f)
-        # Try '<provider>_devices' first, then 'devices', then any key ending with '_devices'
-        provider_key = f'{provider_name.lower()}_devices'
-        device_list = devices_yaml.get(provider_key, None)
-        used_key = provider_key
-
-        if device_list is None:
-            device_list = devices_yaml.get('devices', None)
-            used_key = 'devices'
-
-        if device_list is None:
-            for key in devices_yaml:
-                if key.endswith('_devices'):
-                    device_list = devices_yaml[key]
-                    used_key = key
-
-                    break
-        if device_list is None:
-            raise ValueError(f"No device list found in {config_path}. Tried keys: '{provider_key}', 'devices', and any '_devices' key.")
-
-        for dev in device_list:
-            if dev.get('name') == device_name or dev.get('device_name') == device_name:
-
-                if 'name' not in dev:
-                    dev['name'] = dev.get('device_name')
-                if 'device_name' not in dev:
-                    dev['device_name'] = dev.get('name')
-                if 'max_qubits' not in dev or not isinstance(dev['max_qubits'], int) or not dev['max_qubits']:
-                    max_qubits = dev.get('device_limits', {}).get('max_qubits')
-                    if max_qubits is not None and isinstance(max_qubits, int) and max_qubits > 0:
-                        dev['max_qubits'] = max_qubits
-                    else:
-                        print(f"[ERROR] Device info for {device_name} is missing a valid max_qubits! dev={dev}")
-                        raise ValueError(f"Device info for {device_name} is missing a valid max_qubits!")
-                # Normalize and validate
-                dev = DeviceAbstraction._normalize_device_info(provider_name.lower(), dev)
-                try:
-                    valid = DeviceAbstraction.validate_device_config(dev)
-                    if not valid:
-                        print(f"[WARNING][DeviceAbstraction] Device config for {device_name} failed schema validation. Proceeding.")
-                except Exception as e:
-                    print(f"[WARNING][DeviceAbstraction] Schema validation skipped: {e}")
-                return dev
-        print(f"[ERROR][DeviceAbstraction] Device {device_name} not found in {config_path} (searched key '{used_key}')")
-        raise ValueError(f"Device {device_name} not found in {config_path} (searched key '{used_key}')")
+        return DeviceAbstraction.get_device_profile(provider_name, device_name).to_dict()
 
     @staticmethod
     def validate_device_config(device_config: dict) -> bool:
@@ -288,6 +240,7 @@ class DeviceAbstraction:
         data['devices'].append(device_config)
         with open(config_path, 'w') as f:
             yaml.safe_dump(data, f)
+        ConfigManager.invalidate_cache(config_path)
 
     @staticmethod
     def remove_device(provider_name: str, device_name: str) -> None:
@@ -300,6 +253,7 @@ class DeviceAbstraction:
         data['devices'] = [dev for dev in data.get('devices', []) if dev.get('name') != device_name and dev.get('device_name') != device_name]
         with open(config_path, 'w') as f:
             yaml.safe_dump(data, f)
+        ConfigManager.invalidate_cache(config_path)
 
     @staticmethod
     def update_device(provider_name: str, device_name: str, updates: dict) -> None:
@@ -314,6 +268,7 @@ class DeviceAbstraction:
                 dev.update(updates)
         with open(config_path, 'w') as f:
             yaml.safe_dump(data, f)
+        ConfigManager.invalidate_cache(config_path)
 
     @staticmethod
     def is_gate_supported(provider_name: str, device_name: str, gate: str) -> bool:
@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+# scipy.sparse is imported only when an APSP matrix is actually computed (not on disk-cache hits)
+SCIPY_AVAILABLE = importlib.util.find_spec('scipy') is not None
+
+GEOMETRY_CACHE_VERSION = 1
+
+
+def default_cache_dir() -> str:
+    return os.path.join(os.environ.get('QCRAFT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'qcraft')),
+                        'device_geometry')
+
+
+def _connectivity(device: Dict[str, Any]) -> Dict[int, List[int]]:
+    conn = device.get('qubit_connectivity') or device.get('connectivity') or {}
+    return {int(q): [int(n) for n in neighbors] for q, neighbors in conn.items()}
+
+
+def geometry_key(device: Dict[str, Any]) -> str:
+    """Hash of the parts of a device config that determine its geometry (qubit count and coupling map)."""
+    conn = _connectivity(device)
+    payload = json.dumps({'max_qubits': device.get('max_qubits'),
+                          'connectivity': sorted((q, sorted(ns)) for q, ns in conn.items())})
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def _bfs_all_pairs(indptr: np.ndarray, indices: np.ndarray, n: int) -> np.ndarray:
+    """Hop distances by level-synchronous BFS from every source at once (-1 = unreachable)."""
+    adjacency = np.zeros((n, n), dtype=bool)
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    adjacency[rows, indices] = True
+    dist = np.full((n, n), -1, dtype=np.int32)
+    np.fill_diagonal(dist, 0)
+    frontier = np.eye(n, dtype=bool)
+    visited = frontier.copy()
+    level = 0
+    while frontier.any():
+        level += 1
+        frontier = (frontier.astype(np.uint8) @ adjacency.astype(np.uint8)).astype(bool) & ~visited
+        dist[frontier] = level
+        visited |= frontier
+    return dist
+
+
+class DeviceGeometry:
+    """
+    Precomputed connectivity geometry of a device.
+
+    Attributes:
+        nodes: sorted hardware qubit ids (row/column order of the matrices)
+        index: qubit id -> row
+        distances: (n, n) int32 hop-distance matrix; unreachable pairs hold `unreachable` (= n)
+        adjacency: (n, n) bool adjacency bitmap
+        indptr, indices: CSR neighbour lists in row space (neighbours of row i are
+            indices[indptr[i]:indptr[i + 1]])
+        key: geometry_key() of the device config
+
+    Use DeviceGeometry.for_device(device) to get the shared instance: geometries are memoized per
+    process and cached on disk (QCRAFT_CACHE_DIR/device_geometry/<key>.npz), so the APSP matrix
+    of a device is computed once.
+    """
+    _memo: Dict[str, 'DeviceGeometry'] = {}
+    _memo_lock = threading.Lock()
+
+    def __init__(self, nodes: np.ndarray, indptr: np.ndarray, indices: np.ndarray, distances: np.ndarray, key: str):
+        self.nodes = np.asarray(nodes, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int32)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.num_qubits = len(self.nodes)
+        self.unreachable = max(self.num_qubits, 1)
+        self.distances = np.where(distances < 0, self.unreachable, distances).astype(np.int32)
+        self.adjacency = np.zeros((self.num_qubits, self.num_qubits), dtype=bool)
+        self.adjacency[np.repeat(np.arange(self.num_qubits), np.diff(self.indptr)), self.indices] = True
+        self.index = {int(q): i for i, q in enumerate(self.nodes)}
+        self.key = key
+
+    @classmethod
+    def build(cls, device: Dict[str, Any], key: Optional[str] = None) -> 'DeviceGeometry':
+        """Compute the geometry of a device config (undirected coupling map)."""
+        conn = _connectivity(device)
+        nodes = sorted(set(conn) | {n for ns in conn.values() for n in ns})
+        index = {q: i for i, q in enumerate(nodes)}
+        n = len(nodes)
+        neighbors = [set() for _ in range(n)]
+        for q, ns in conn.items():
+            for nb in ns:
+                if nb != q:
+                    neighbors[index[q]].add(index[nb])
+                    neighbors[index[nb]].add(index[q])
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum([len(ns) for ns in neighbors])
+        indices = np.array([j for ns in neighbors for j in sorted(ns)], dtype=np.int32)
+        if n == 0:
+            distances = np.zeros((0, 0), dtype=np.int32)
+        elif SCIPY_AVAILABLE:
+            from scipy.sparse import csr_matrix
+            from scipy.sparse.csgraph import shortest_path as _csgraph_shortest_path
+            graph = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n, n))
+            hops = _csgraph_shortest_path(graph, directed=False, unweighted=True)
+            distances = np.where(np.isinf(hops), -1, hops).astype(np.int32)
+        else:
+            distances = _bfs_all_pairs(indptr, indices, n)
+        return cls(np.array(nodes, dtype=np.int64), indptr, indices, distances, key or geometry_key(device))
+
+    @classmethod
+    def for_device(cls, device: Dict[str, Any], cache_dir: Optional[str] = None) -> 'DeviceGeometry':
+        """Shared geometry of a device config: process memo, then disk cache, then build."""
+        key = geometry_key(device)
+        with cls._memo_lock:
+            geometry = cls._memo.get(key)
+        if geometry is not None:
+            return geometry
+        path = os.path.join(cache_dir or default_cache_dir(), f"{key}.npz")
+        geometry = cls._load(path, key)
+        if geometry is None:
+            geometry = cls.build(device, key)
+            geometry._save(path)
+        with cls._memo_lock:
+            return cls._memo.setdefault(key, geometry)
+
+    @classmethod
+    def _load(cls, path: str, key: str) -> Optional['DeviceGeometry']:
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != GEOMETRY_CACHE_VERSION:
+                    return None
+                distances = data['distances']
+                n = len(data['nodes'])
+                distances = np.where(distances >= max(n, 1), -1, distances)
+                return cls(data['nodes'], data['indptr'], data['indices'], distances, key)
+        except Exception as e:
+            print(f"[WARNING] Ignoring unreadable device geometry cache {path}: {e}")
+            return None
+
+    def _save(self, path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+            np.savez_compressed(tmp_path, version=GEOMETRY_CACHE_VERSION, nodes=self.nodes, indptr=self.indptr,
+                                indices=self.indices, distances=self.distances)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] Could not write device geometry cache {path}: {e}")
+
+    @classmethod
+    def clear_memo(cls) -> None:
+        with cls._memo_lock:
+            cls._memo.clear()
+
+    def indices_of(self, qubits: Iterable[int]) -> np.ndarray:
+        """Row indices of hardware qubit ids."""
+        return np.fromiter((self.index[int(q)] for q in qubits), dtype=np.int64)
+
+    def distance(self, q1: int, q2: int) -> int:
+        """Hop distance between two hardware qubits (`unreachable` if disconnected)."""
+        return int(self.distances[self.index[int(q1)], self.index[int(q2)]])
+
+    def are_adjacent(self, q1: int, q2: int) -> bool:
+        return bool(self.adjacency[self.index[int(q1)], self.index[int(q2)]])
+
+    def neighbors(self, qubit: int) -> np.ndarray:
+        """Hardware qubit ids adjacent to `qubit`."""
+        i = self.index[int(qubit)]
+        return self.nodes[self.indices[self.indptr[i]:self.indptr[i + 1]]]
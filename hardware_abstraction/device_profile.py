@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from configuration_management.config_manager import freeze_config, thaw_config
+
+
+def _as_float(value: Any) -> float:
+    # YAML 1.1 reads exponents without a dot (e.g. 100e-6) as strings
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+class DeviceProfile:
+    """
+    Frozen, normalized device config with precomputed per-qubit arrays.
+
+    Attributes:
+        provider: lower-case provider name
+        device_name: device name
+        file_hash: sha256 of the provider config file the profile was built from
+        config: read-only view of the normalized device config (mappings are MappingProxyType,
+            lists are tuples); to_dict() returns a mutable copy
+        qubits: sorted hardware qubit ids (row order of the arrays below)
+        readout_error, t1, t2: per-qubit float arrays from qubit_properties (NaN where missing)
+        edge_index: (E, 2) undirected coupling edges as rows into `qubits`, each edge once (i < j)
+
+    Use DeviceProfile.get(...) (or DeviceAbstraction.get_device_profile) for the shared instance:
+    profiles are memoized per (provider, device, file hash), so each device is normalized and
+    validated once per process and version of its provider file.
+    """
+    _memo: Dict[Tuple[str, str, str], 'DeviceProfile'] = {}
+    _memo_lock = threading.Lock()
+
+    def __init__(self, provider: str, device_name: str, file_hash: str, device: Dict[str, Any]):
+        set_ = super().__setattr__
+        set_('provider', provider)
+        set_('device_name', device_name)
+        set_('file_hash', file_hash)
+        set_('config', freeze_config(device))
+        props = device.get('qubit_properties') or {}
+        conn = device.get('qubit_connectivity') or {}
+        ids = {int(q) for q in conn} | {int(q) for q in props}
+        if not ids and isinstance(device.get('max_qubits'), int):
+            ids = set(range(device['max_qubits']))
+        qubits = np.array(sorted(ids), dtype=np.int64)
+        row = {int(q): i for i, q in enumerate(qubits)}
+        by_qubit = {int(q): p or {} for q, p in props.items()}
+        set_('qubits', _read_only(qubits))
+        set_('readout_error', _read_only(np.array([_as_float(by_qubit.get(int(q), {}).get('readout_error')) for q in qubits])))
+        set_('t1', _read_only(np.array([_as_float(by_qubit.get(int(q), {}).get('T1', by_qubit.get(int(q), {}).get('t1'))) for q in qubits])))
+        set_('t2', _read_only(np.array([_as_float(by_qubit.get(int(q), {}).get('T2', by_qubit.get(int(q), {}).get('t2'))) for q in qubits])))
+        edges = sorted({(min(row[int(q)], row[int(n)]), max(row[int(q)], row[int(n)]))
+                        for q, neighbors in conn.items() for n in neighbors
+                        if int(n) in row and int(n) != int(q)})
+        set_('edge_index', _read_only(np.array(edges, dtype=np.int64).reshape(-1, 2)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"DeviceProfile is frozen (cannot set '{name}')")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"DeviceProfile is frozen (cannot delete '{name}')")
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return (self.provider, self.device_name, self.file_hash)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable copy of the normalized device config (what load_selected_device returns)."""
+        return thaw_config(self.config)
+
+    @classmethod
+    def get(cls, provider: str, device_name: str, file_hash: str) -> Optional['DeviceProfile']:
+        with cls._memo_lock:
+            return cls._memo.get((provider, device_name, file_hash))
+
+    @classmethod
+    def register(cls, profile: 'DeviceProfile') -> 'DeviceProfile':
+        """Memoize a profile; if another thread registered the same key first, return that one."""
+        with cls._memo_lock:
+            return cls._memo.setdefault(profile.key, profile)
+
+    @classmethod
+    def clear_memo(cls) -> None:
+        with cls._memo_lock:
+            cls._memo.clear()
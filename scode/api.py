@@ -11,22 +11,14 @@ from code_switcher.code_switcher import CodeSwitcher
 from logging_results.logging_results_manager import LoggingResultsManager
 import uuid
 import math
-try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+from scode.utils.lazy_import import is_available, lazy_import
+# Heavy optional dependencies are imported on first use (matplotlib) or inside the training path (SB3/torch)
+plt = lazy_import('matplotlib.pyplot')
+MATPLOTLIB_AVAILABLE = is_available('matplotlib')
 import networkx as nx
 from hardware_abstraction.device_abstraction import DeviceAbstraction
 from configuration_management.config_manager import ConfigManager
-try:
-    from stable_baselines3 import PPO
-    from stable_baselines3.common.vec_env import SubprocVecEnv
-    SB3_AVAILABLE = True
-except ImportError:
-    PPO = None
-    SubprocVecEnv = None
-    SB3_AVAILABLE = False
+SB3_AVAILABLE = is_available('stable_baselines3')
 from scode.utils.decoder_interface import DecoderInterface
 
 # Device abstraction and config management
@@ -36,7 +28,6 @@ from scode.heuristic_layer.surface_code_object import SurfaceCodeObject
 from scode.graph_transformer.graph_transformer import ConnectivityAwareGraphTransformer
 
 from scode.rl_agent.environment import SurfaceCodeEnvironment
-from scode.rl_agent.progress import ProgressBarCallback
 
 # Utility for deep merging dicts (API > config)
 def deep_merge(base: dict, override: Optional[dict]) -> dict:
@@ -653,23 +644,22 @@ class SurfaceCodeAPI:
         return sorted(gates)
 
     def list_trained_agents(self) -> List[Dict[str, Any]]:
-        """Return metadata for all available trained agents (device, layout, distance, path)."""
-        agents_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'training_artifacts'))
-        agents = []
-        if os.path.exists(agents_dir):
-            for fname in os.listdir(agents_dir):
-                if fname.endswith('.zip'):
-                    parts = fname.split('_')
-                    agents.append({
-                        'device': parts[1] if len(parts) > 1 else '',
-                        'layout': parts[2] if len(parts) > 2 else '',
-                        'distance': parts[3][1:] if len(parts) > 3 and parts[3].startswith('d') else '',
-                        'path': os.path.join(agents_dir, fname)
-                    })
-        return agents
+        """
+        Return metadata for all trained agents in the artifact index: provider, device, code_family,
+        layout, distance, patch_count, curriculum_stage, path, sha256, size, created and training metrics.
+        """
+        from scode.rl_agent.artifact_index import ArtifactIndex
+        index = ArtifactIndex.for_directory(self._get_artifacts_dir(self.config))
+        index.sync()
+        return [dict(entry, layout=entry['layout_type'], distance=entry['code_distance'])
+                for entry in index.entries()]
 
     # --- Training ---
     def _get_artifacts_dir(self, config=None):
+        config = config or {}
+        ta_config = config.get('multi_patch_rl_agent', {}).get('training_artifacts', {})
+        if ta_config.get('output_dir'):
+            return os.path.abspath(ta_config['output_dir'])
         output_dir = config.get('system', {}).get('output_dir', './outputs')
         return os.path.abspath(os.path.join(output_dir, 'training_artifacts'))
 
@@ -794,14 +784,8 @@ class SurfaceCodeAPI:
             total_timesteps = config.get('multi_patch_rl_agent', {}).get('agent', {}).get('total_timesteps')
         if total_timesteps is None:
             total_timesteps = config.get('multi_patch_rl_agent', {}).get('agent', {}).get('num_episodes', 10000) * 200
-        # Setup progress bar callback for both terminal and GUI
-        from scode.rl_agent.progress import ProgressBarCallback
-        progress_callback = ProgressBarCallback(
-            total_steps=total_timesteps,
-            mode='both' if log_callback else 'terminal',
-            callback=log_callback if log_callback else None
-        )
-        if n_envs <= 1:
+        vec_strategy = agent_config.get('vec_strategy', 'subproc')
+        if n_envs <= 1 or vec_strategy == 'none':
             env = make_env()
             if log_callback:
                 log_callback({
@@ -815,8 +799,8 @@ class SurfaceCodeAPI:
                     "msg": f"[DEBUG] Using single environment (n_envs={n_envs})"
                 })
         else:
-            env_fns = [make_env for _ in range(n_envs)]
-            env = SubprocVecEnv(env_fns)
+            from scode.rl_agent.shared_memory_vec_env import build_vec_env
+            env = build_vec_env(make_env, n_envs, vec_strategy)
             if log_callback:
                 log_callback({
                     "step": 0,
@@ -826,7 +810,7 @@ class SurfaceCodeAPI:
                     "eta": None,
                     "elapsed": time.time() - start_time,
                     "progress": 0.0,
-                    "msg": f"[DEBUG] Using SubprocVecEnv (n_envs={n_envs})"
+                    "msg": f"[DEBUG] Using {type(env).__name__} (n_envs={n_envs}, vec_strategy={vec_strategy})"
                 })
 
         # Initial config/log messages only (not for training progress)
@@ -834,17 +818,40 @@ class SurfaceCodeAPI:
             # Initial config/log messages handled above
             pass
 
-        # Model creation and training
-        model = PPO('MultiInputPolicy', env, verbose=1, batch_size=agent_config.get('batch_size', 64), n_steps=agent_config.get('n_steps', 2048), learning_rate=agent_config.get('learning_rate', 0.0003), gamma=agent_config.get('gamma', 0.99), gae_lambda=agent_config.get('gae_lambda', 0.95), ent_coef=agent_config.get('ent_coef', 0.01), vf_coef=agent_config.get('vf_coef', 0.5))
-        progress_callback = ProgressBarCallback(
-            total_steps=total_timesteps,
-            callback=log_callback,
-            mode='both'
-        )
-        model.learn(total_timesteps=total_timesteps, callback=progress_callback)
-
+        # Use output_dir and artifact_naming from config
+        ta_config = config.get('multi_patch_rl_agent', {}).get('training_artifacts', {})
+        output_dir = ta_config.get('output_dir', './outputs/training_artifacts')
+        artifact_naming = ta_config.get('artifact_naming', '{provider}_{device}_{layout_type}_d{code_distance}_patches{patch_count}_stage{curriculum_stage}_sb3_ppo_surface_code_{timestamp}.zip')
+        os.makedirs(output_dir, exist_ok=True)
+        patch_count = env_config.get('patch_count', 1)
+        curriculum_stage = agent_config.get('curriculum_stage', 1)
+        code_family = env_config.get('code_family', 'surface')
+        # Checkpoints of one training configuration share a directory so 'latest' can resume them
+        checkpoint_dir = os.path.join(output_dir, 'checkpoints',
+                                      f"{provider}_{device}_{code_family}_{layout_type}_d{code_distance}_patches{patch_count}_stage{curriculum_stage}")
 
-        model = PPO('MultiInputPolicy', env, verbose=1, batch_size=agent_config.get('batch_size', 64), n_steps=agent_config.get('n_steps', 2048), learning_rate=agent_config.get('learning_rate', 0.0003), gamma=agent_config.get('gamma', 0.99), gae_lambda=agent_config.get('gae_lambda', 0.95), ent_coef=agent_config.get('ent_coef', 0.01), vf_coef=agent_config.get('vf_coef', 0.5))
+        # Model creation (or resume) and a single training run
+        from stable_baselines3 import PPO
+        from stable_baselines3.common.callbacks import CallbackList
+        from scode.rl_agent.checkpointing import PeriodicCheckpointCallback, resolve_resume_checkpoint
+        resume_path = resolve_resume_checkpoint(agent_config.get('resume_from_checkpoint'), checkpoint_dir)
+        if resume_path:
+            model = PPO.load(resume_path, env=env)
+            if log_callback:
+                log_callback({
+                    "step": model.num_timesteps,
+                    "total_steps": total_timesteps,
+                    "reward": None,
+                    "ler": None,
+                    "eta": None,
+                    "elapsed": time.time() - start_time,
+                    "progress": min(1.0, model.num_timesteps / total_timesteps) if total_timesteps else 0.0,
+                    "msg": f"[INFO] Resuming from checkpoint {resume_path} at step {model.num_timesteps}"
+                })
+        else:
+            model = PPO('MultiInputPolicy', env, verbose=1, batch_size=agent_config.get('batch_size', 64), n_steps=agent_config.get('n_steps', 2048), learning_rate=agent_config.get('learning_rate', 0.0003), gamma=agent_config.get('gamma', 0.99), gae_lambda=agent_config.get('gae_lambda', 0.95), ent_coef=agent_config.get('ent_coef', 0.01), vf_coef=agent_config.get('vf_coef', 0.5), seed=env_config.get('seed'))
+        # Setup progress bar callback for both terminal and GUI
+        from scode.rl_agent.progress import ProgressBarCallback
         progress_callback = ProgressBarCallback(
             total_steps=total_timesteps,
             bar_length=40,
@@ -853,20 +860,23 @@ class SurfaceCodeAPI:
             mode='both',
             run_id=run_id
         )
-        model.learn(total_timesteps=total_timesteps, callback=progress_callback)
+        checkpoint_callback = PeriodicCheckpointCallback(
+            checkpoint_dir,
+            save_interval=agent_config.get('save_interval', 10000),
+            keep_last=agent_config.get('keep_checkpoints', 3)
+        )
+        remaining_timesteps = total_timesteps - model.num_timesteps
+        if remaining_timesteps > 0:
+            model.learn(total_timesteps=remaining_timesteps, callback=CallbackList([progress_callback, checkpoint_callback]),
+                        reset_num_timesteps=not resume_path)
+            checkpoint_callback.save()
 
-        # Use output_dir and artifact_naming from config
-        ta_config = config.get('multi_patch_rl_agent', {}).get('training_artifacts', {})
-        output_dir = ta_config.get('output_dir', './outputs/training_artifacts')
-        artifact_naming = ta_config.get('artifact_naming', '{provider}_{device}_{layout_type}_d{code_distance}_patches{patch_count}_stage{curriculum_stage}_sb3_ppo_surface_code_{timestamp}.zip')
-        os.makedirs(output_dir, exist_ok=True)
         from datetime import datetime
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        patch_count = env_config.get('patch_count', 1)
-        curriculum_stage = agent_config.get('curriculum_stage', 1)
         policy_path = os.path.join(output_dir, artifact_naming.format(
             provider=provider,
             device=device,
+            code_family=code_family,
             layout_type=layout_type,
             code_distance=code_distance,
             patch_count=patch_count,
@@ -875,6 +885,13 @@ class SurfaceCodeAPI:
         ))
         model.save(policy_path)
         elapsed = time.time() - start_time
+        from scode.rl_agent.artifact_index import ArtifactIndex
+        ArtifactIndex.for_directory(output_dir).register(
+            policy_path, provider, device, layout_type, code_distance, patch_count=patch_count,
+            curriculum_stage=curriculum_stage, code_family=code_family,
+            metrics={'total_timesteps': int(model.num_timesteps), 'elapsed': elapsed,
+                     'final_reward': progress_callback.last_reward, 'final_ler': progress_callback.last_ler,
+                     'resumed_from': resume_path})
         self.logger.log_event('run_ended', {'run_id': run_id, 'policy_path': policy_path, 'elapsed': elapsed}, level='INFO')
         self.logger.store_result(run_id, {'policy_path': policy_path, 'provider': provider, 'device': device, 'layout_type': layout_type, 'code_distance': code_distance, 'elapsed': elapsed})
         if log_callback:
@@ -983,20 +1000,15 @@ class SurfaceCodeAPI:
         code = self.heuristic_layer.generate_surface_code(code_distance, layout_type, visualize=False)
         return code.stabilizer_map
 
-    def _find_agent_artifact(self, device, layout_type, code_distance, provider=None):
-        """Find the correct trained agent artifact for the given parameters."""
-        config = self.config
-        artifacts_dir = self._get_artifacts_dir(config)
-        candidates = []
-        for fname in os.listdir(artifacts_dir):
-            if fname.endswith('.zip') and device in fname and layout_type in fname and f'd{code_distance}' in fname:
-                if provider is None or provider in fname:
-                    candidates.append(os.path.join(artifacts_dir, fname))
-        if not candidates:
+    def _find_agent_artifact(self, device, layout_type, code_distance, provider=None, patch_count=None):
+        """Find the newest indexed trained agent artifact for the given parameters."""
+        from scode.rl_agent.artifact_index import ArtifactIndex
+        artifacts_dir = self._get_artifacts_dir(self.config)
+        entry = ArtifactIndex.for_directory(artifacts_dir).lookup(provider=provider, device=device, layout_type=layout_type,
+                                                                  code_distance=code_distance, patch_count=patch_count)
+        if entry is None:
             raise FileNotFoundError(f"No trained agent artifact found for device={device}, layout_type={layout_type}, code_distance={code_distance}, provider={provider} in {artifacts_dir}")
-        # If multiple, pick the most recent
-        candidates.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-        return candidates[0]
+        return entry['path']
 
     def get_multi_patch_mapping(self, code_distance: int, layout_type: str, mapping_constraints: dict, device: str = None, use_rl_agent: bool = True, rl_policy_path: str = None) -> dict:
         if device is None:
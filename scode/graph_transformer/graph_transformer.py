@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
+import heapq
+import itertools
 from typing import Dict, Any, List, Tuple, Optional
 import networkx as nx
 import numpy as np
@@ -58,11 +60,14 @@ class ConnectivityAwareGraphTransformer:
         hardware_stabilizer_map = self._remap_stabilizers(surface_code_object.stabilizer_map, mapping)
         logical_operators = self._remap_logical_operators(surface_code_object.logical_operators, mapping)
         
+        # Surface-code graph shared by the overhead estimate and the annotated graph
+        sc_graph = self._create_surface_code_graph(surface_code_object)
+        
         # Calculate connectivity overhead (SWAPs, delays, cost)
-        connectivity_overhead_info = self._compute_connectivity_overhead(hw_graph, mapping, surface_code_object)
+        connectivity_overhead_info = self._compute_connectivity_overhead(hw_graph, mapping, surface_code_object, sc_graph)
         
         # Create an annotated graph with performance metrics
-        annotated_graph = self._create_annotated_graph(hw_graph, mapping, surface_code_object)
+        annotated_graph = self._create_annotated_graph(hw_graph, mapping, surface_code_object, sc_graph)
         
         return {
             'surface_code': surface_code_object,
@@ -71,6 +76,7 @@ class ConnectivityAwareGraphTransformer:
             'logical_operators': logical_operators,
             'connectivity_overhead_info': connectivity_overhead_info,
             'annotated_graph': annotated_graph,
+            'annotated_graph_arrays': self.annotated_graph_arrays(annotated_graph),
             'hardware_info': {
                 'topology_type': self.topology_type,
                 'native_gates': self.native_gates,
@@ -255,55 +261,79 @@ class ConnectivityAwareGraphTransformer:
                            initial_mapping: Dict[int, int]) -> Dict[int, int]:
         """
         Optimize the mapping to better preserve adjacency relationships.
-        Uses a simple local search algorithm to reduce the number of broken edges.
+
+        Best-improvement local search over moves that bring a surface-code qubit next to the hardware
+        position of one of its neighbours: a swap with the qubit mapped there, or a move onto a free
+        allowed hardware qubit. Gains only look at the edges incident to the moved qubits (O(degree)),
+        and candidate moves sit in a max-heap that is re-validated lazily, so a pass costs roughly
+        O(n * degree^2 * log n) instead of O(n^2 * E).
         """
         mapping = initial_mapping.copy()
-        mapped_hw_nodes = set(mapping.values())
-        available_hw_nodes = set(hw_graph.nodes()) - mapped_hw_nodes
-        
-        # Remove excluded and high-error qubits from available nodes
-        available_hw_nodes = {n for n in available_hw_nodes if n not in self.excluded_qubits and 
-                            hw_graph.nodes[n].get('error_rate', 1.0) <= self.max_error_rate}
-        
-        # Calculate initial broken edges count
-        broken_edges = self._count_broken_edges(sc_graph, hw_graph, mapping)
-        
-        # Local search iterations (limited to ensure we don't get stuck)
-        max_iterations = 20
-        iterations = 0
-        improved = True
-        
-        while improved and iterations < max_iterations:
-            improved = False
-            iterations += 1
-            
-            # Try swapping each pair of qubits
-            for sc_node1 in mapping:
-                best_swap = None
-                best_improvement = 0
-                
-                # Try swapping with another mapped node
-                for sc_node2 in mapping:
-                    if sc_node1 != sc_node2:
-                        # Swap mapping temporarily
-                        mapping[sc_node1], mapping[sc_node2] = mapping[sc_node2], mapping[sc_node1]
-                        new_broken = self._count_broken_edges(sc_graph, hw_graph, mapping)
-                        improvement = broken_edges - new_broken
-                        
-                        if improvement > best_improvement:
-                            best_improvement = improvement
-                            best_swap = ('mapped', sc_node2)
-                        
-                        # Revert swap
-                        mapping[sc_node1], mapping[sc_node2] = mapping[sc_node2], mapping[sc_node1]
-                
-                # Apply the best swap if it improves the mapping
-                if best_swap and best_improvement > 0:
-                    sc_node2 = best_swap[1]
-                    mapping[sc_node1], mapping[sc_node2] = mapping[sc_node2], mapping[sc_node1]
-                    broken_edges -= best_improvement
-                    improved = True
-        
+        occupant = {hw: sc for sc, hw in mapping.items()}
+        hw_adj = hw_graph.adj
+        # Free hardware qubits a qubit may move onto (excluded and high-error qubits are not allowed)
+        allowed = {n for n in hw_graph.nodes() if n not in self.excluded_qubits and
+                   hw_graph.nodes[n].get('error_rate', 1.0) <= self.max_error_rate}
+        sc_adj = {u: [w for w in sc_graph.adj[u] if w != u] for u in sc_graph.nodes()}
+
+        def broken_around(u, hw_u, skip=None):
+            # Broken edges between u (placed on hw_u) and its mapped neighbours other than `skip`
+            return sum(1 for w in sc_adj.get(u, ()) if w != skip and w in mapping and mapping[w] not in hw_adj.get(hw_u, ()))
+
+        def move_gain(u, target):
+            hw_u = mapping[u]
+            v = occupant.get(target)
+            gain = broken_around(u, hw_u, skip=v) - broken_around(u, target, skip=v)
+            if v is not None:
+                # The u-v edge maps onto the same hardware pair before and after the swap
+                gain += broken_around(v, target, skip=u) - broken_around(v, hw_u, skip=u)
+            return gain
+
+        def candidates(u):
+            hw_u = mapping[u]
+            for w in sc_adj.get(u, ()):
+                if w in mapping:
+                    for target in hw_adj.get(mapping[w], ()):
+                        if target != hw_u and (target in occupant or target in allowed):
+                            yield target
+
+        def push_best(u):
+            best_gain, best_target = 0, None
+            for target in candidates(u):
+                gain = move_gain(u, target)
+                if gain > best_gain:
+                    best_gain, best_target = gain, target
+            if best_target is not None:
+                heapq.heappush(heap, (-best_gain, next(counter), u, best_target))
+
+        heap: List[Tuple[int, int, Any, int]] = []
+        counter = itertools.count()
+        for u in mapping:
+            if u in sc_adj:
+                push_best(u)
+        while heap:
+            neg_gain, _, u, target = heapq.heappop(heap)
+            gain = move_gain(u, target)
+            if gain <= 0:
+                # Stale entry: look for the current best move of u instead
+                push_best(u)
+                continue
+            if gain < -neg_gain and heap and -heap[0][0] > gain:
+                heapq.heappush(heap, (-gain, next(counter), u, target))
+                continue
+            hw_u, v = mapping[u], occupant.get(target)
+            mapping[u], occupant[target] = target, u
+            if v is None:
+                del occupant[hw_u]
+            else:
+                mapping[v], occupant[hw_u] = hw_u, v
+            # Every accepted move removes at least one broken edge, so the search terminates
+            for moved in (u, v):
+                if moved is not None:
+                    push_best(moved)
+                    for w in sc_adj.get(moved, ()):
+                        if w in mapping:
+                            push_best(w)
         return mapping
 
     def _count_broken_edges(self, sc_graph: nx.Graph, hw_graph: nx.Graph, 
@@ -360,7 +390,7 @@ class ConnectivityAwareGraphTransformer:
         return remapped
 
     def _compute_connectivity_overhead(self, hw_graph: nx.Graph, mapping: Dict[int, int], 
-                                     surface_code: SurfaceCodeObject) -> Dict[str, Any]:
+                                     surface_code: SurfaceCodeObject, sc_graph: Optional[nx.Graph] = None) -> Dict[str, Any]:
         """
         Compute the connectivity overhead of the mapping.
         
@@ -370,7 +400,8 @@ class ConnectivityAwareGraphTransformer:
         - Gate error impact
         """
         # Create a graph from the surface code
-        sc_graph = self._create_surface_code_graph(surface_code)
+        if sc_graph is None:
+            sc_graph = self._create_surface_code_graph(surface_code)
         
         # Count broken edges (each broken edge requires a SWAP)
         broken_edges = self._count_broken_edges(sc_graph, hw_graph, mapping)
@@ -401,38 +432,69 @@ class ConnectivityAwareGraphTransformer:
         }
 
     def _create_annotated_graph(self, hw_graph: nx.Graph, mapping: Dict[int, int], 
-                              surface_code: SurfaceCodeObject) -> nx.Graph:
+                              surface_code: SurfaceCodeObject, sc_graph: Optional[nx.Graph] = None) -> nx.Graph:
         """
         Create an annotated graph with mapping and performance information.
         
         This can be used for visualization and further analysis.
+        Args:
+            hw_graph: Hardware graph
+            mapping: Surface-code qubit -> hardware qubit
+            surface_code: Surface code that was mapped
+            sc_graph: Surface-code graph, if already built (default: built from surface_code)
         """
         # Create a copy of the hardware graph
         G = hw_graph.copy()
+        if sc_graph is None:
+            sc_graph = self._create_surface_code_graph(surface_code)
         
         # Add surface code qubit type information to nodes
+        hw_to_sc = {}
         for sc_q, hw_q in mapping.items():
             if hw_q in G.nodes:
+                hw_to_sc[hw_q] = sc_q
                 sc_info = surface_code.qubit_layout.get(sc_q, {})
                 G.nodes[hw_q]['sc_qubit'] = sc_q
                 G.nodes[hw_q]['qubit_type'] = sc_info.get('type', 'unknown')
                 G.nodes[hw_q]['original_x'] = sc_info.get('x', 0)
                 G.nodes[hw_q]['original_y'] = sc_info.get('y', 0)
         
-        # Add edge properties
-        for u, v in G.edges():
-            # Mark edges used by surface code
-            used = False
-            for sc_u, hw_u in mapping.items():
-                if hw_u == u:
-                    for sc_v, hw_v in mapping.items():
-                        if hw_v == v:
-                            # Check if these qubits are connected in the surface code
-                            sc_graph = self._create_surface_code_graph(surface_code)
-                            if sc_graph.has_edge(sc_u, sc_v):
-                                used = True
-                                break
-            G.edges[u, v]['used'] = used
-            G.edges[u, v]['gate_error'] = self.gate_error_rates.get('cx', 0.01)
-        
-        return G 
\ No newline at end of file
+        # Add edge properties: an edge is used when both ends hold coupled surface-code qubits
+        gate_error = self.gate_error_rates.get('cx', 0.01)
+        for u, v, data in G.edges(data=True):
+            data['used'] = u in hw_to_sc and v in hw_to_sc and sc_graph.has_edge(hw_to_sc[u], hw_to_sc[v])
+            data['gate_error'] = gate_error
+        
+        return G
+
+    @staticmethod
+    def annotated_graph_arrays(annotated_graph: nx.Graph) -> Dict[str, np.ndarray]:
+        """
+        Node and edge attributes of an annotated graph as NumPy arrays, for visualizers that do not
+        need a networkx object.
+        Args:
+            annotated_graph: Graph returned by _create_annotated_graph
+        Returns:
+            Dictionary with per-node arrays (nodes, mapped, sc_qubit, qubit_type, error_rate,
+            original_x, original_y; NaN/None/'unmapped' on unmapped qubits) and per-edge arrays
+            (edges as (E, 2) node ids, edge_index as (E, 2) positions into nodes, used, gate_error)
+        """
+        nodes = list(annotated_graph.nodes())
+        position = {n: i for i, n in enumerate(nodes)}
+        attrs = [annotated_graph.nodes[n] for n in nodes]
+        edges = list(annotated_graph.edges(data=True))
+        sc_qubit = np.empty(len(nodes), dtype=object)
+        sc_qubit[:] = [a.get('sc_qubit') for a in attrs]
+        return {
+            'nodes': np.array(nodes),
+            'mapped': np.array(['sc_qubit' in a for a in attrs], dtype=bool),
+            'sc_qubit': sc_qubit,
+            'qubit_type': np.array([a.get('qubit_type', 'unmapped') for a in attrs], dtype=str),
+            'error_rate': np.array([a.get('error_rate', np.nan) for a in attrs], dtype=float),
+            'original_x': np.array([a.get('original_x', np.nan) for a in attrs], dtype=float),
+            'original_y': np.array([a.get('original_y', np.nan) for a in attrs], dtype=float),
+            'edges': np.array([(u, v) for u, v, _ in edges]).reshape(-1, 2),
+            'edge_index': np.array([(position[u], position[v]) for u, v, _ in edges], dtype=np.int64).reshape(-1, 2),
+            'used': np.array([d.get('used', False) for _, _, d in edges], dtype=bool),
+            'gate_error': np.array([d.get('gate_error', np.nan) for _, _, d in edges], dtype=float),
+        }
@@ -1,12 +1,14 @@
 # SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
-import matplotlib.pyplot as plt
+from scode.utils.lazy_import import lazy_import
+plt = lazy_import('matplotlib.pyplot')
 import networkx as nx
 from typing import Dict, List, Tuple, Any, Optional, Set
 import numpy as np
 import random
 from .surface_code_object import SurfaceCodeObject
+from .layout_cache import LayoutCache, default_layout_cache_dir, layout_key
 from scode.utils.decoder_interface import DecoderInterface
 
 class HeuristicInitializationLayer:
@@ -29,6 +31,14 @@ class HeuristicInitializationLayer:
         self.excluded_qubits = config.get('advanced_constraints', {}).get('exclude_qubits', config.get('excluded_qubits', []))
         self.max_error_rate = config.get('advanced_constraints', {}).get('max_error_rate', config.get('max_error_rate', 0.1))
         
+        # Generated layouts are cached by content (device + generator parameters) and shared frozen
+        cache_cfg = env_cfg.get('layout_cache', {}) or {}
+        max_entries = cache_cfg.get('max_entries', 128)
+        self.layout_cache = LayoutCache.shared() if max_entries and max_entries > 0 else None
+        if self.layout_cache is not None:
+            self.layout_cache.max_entries = max_entries
+        self.layout_cache_dir = (cache_cfg.get('cache_dir') or default_layout_cache_dir()) if cache_cfg.get('disk_cache', False) else None
+
         # Initialize visualization settings
         self.visualize_settings = config.get('visualization', {
             'node_size': 300,
@@ -46,7 +56,8 @@ class HeuristicInitializationLayer:
         - visualize: Whether to visualize the generated layout
         
         Returns:
-        - A SurfaceCodeObject representing the surface code
+        - A SurfaceCodeObject representing the surface code. With the layout cache enabled this is a
+          shared, frozen object; call mutable_copy() on it before modifying it.
         """
         if code_distance is None or not isinstance(code_distance, int):
             raise ValueError("Code distance must be a non-None integer. Please select a valid code distance in the GUI or config.")
@@ -54,6 +65,15 @@ class HeuristicInitializationLayer:
         # Validate parameters
         self._validate_parameters(code_distance, layout_type)
         
+        key = None
+        if self.layout_cache is not None:
+            key = layout_key(layout_type, code_distance, self.device, self._layout_params())
+            surface_code = self.layout_cache.get(key, self.layout_cache_dir, on_load=self._refresh_supported_logical_gates)
+            if surface_code is not None:
+                if visualize:
+                    self._visualize_layout(surface_code)
+                return surface_code
+        
         # Calculate required qubits
         required_qubits = self._calculate_required_qubits(code_distance, layout_type)
         
@@ -70,9 +90,7 @@ class HeuristicInitializationLayer:
         adjacency_matrix = self._generate_adjacency_matrix_from_device(qubit_layout)
         
         # Compute supported logical gates for this code patch
-        from scode.api import SurfaceCodeAPI
-        supported_logical_gates = SurfaceCodeAPI.list_supported_logical_gates(
-            SurfaceCodeAPI(), layout_type=layout_type, code_distance=code_distance, logical_operators=logical_operators)
+        supported_logical_gates = self._supported_logical_gates(layout_type, code_distance, logical_operators)
         
         # Create the surface code object with supported_logical_gates
         surface_code = SurfaceCodeObject(
@@ -88,6 +106,8 @@ class HeuristicInitializationLayer:
         
         # Validate the generated surface code
         self._validate_surface_code(surface_code)
+        if key is not None:
+            surface_code = self.layout_cache.put(key, surface_code, self.layout_cache_dir)
         
         # Visualize if requested
         if visualize:
@@ -95,6 +115,26 @@ class HeuristicInitializationLayer:
         
         return surface_code
 
+    def _supported_logical_gates(self, layout_type: str, code_distance: int, logical_operators: Dict[str, List[int]]) -> List[str]:
+        from scode.api import SurfaceCodeAPI
+        return SurfaceCodeAPI.list_supported_logical_gates(
+            SurfaceCodeAPI(), layout_type=layout_type, code_distance=code_distance, logical_operators=logical_operators)
+
+    def _refresh_supported_logical_gates(self, surface_code: SurfaceCodeObject) -> None:
+        """Recompute the gate set of a layout read from the disk cache (it is not part of the cache key)."""
+        surface_code.supported_logical_gates = self._supported_logical_gates(
+            surface_code.layout_type, surface_code.code_distance, surface_code.logical_operators)
+
+    def _layout_params(self) -> Dict[str, Any]:
+        """Generator parameters a layout depends on besides the device (part of the layout cache key)."""
+        return {
+            'qubit_offsets': self.qubit_offsets,
+            'excluded_qubits': sorted(self.excluded_qubits),
+            'max_error_rate': self.max_error_rate,
+            'default_error_rate': self.config.get('default_error_rate', 0.0),
+            'color_code': self.config.get('color_code', {}),
+        }
+
     def _validate_parameters(self, code_distance: int, layout_type: str) -> None:
         """Validate the input parameters for surface code generation."""
         if code_distance is None or not isinstance(code_distance, int):
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from scode.heuristic_layer.surface_code_object import SurfaceCodeObject
+
+LAYOUT_CACHE_VERSION = 1
+
+
+def default_layout_cache_dir() -> str:
+    return os.path.join(os.environ.get('QCRAFT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'qcraft')),
+                        'layouts')
+
+
+def _normalize(value):
+    """JSON-stable form of config data (string keys, sorted by json.dumps)."""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def layout_key(layout_type: str, code_distance: int, device: Dict[str, Any], params: Dict[str, Any]) -> str:
+    """
+    Content hash of everything a generated surface-code layout depends on: layout type, distance,
+    generator parameters (ancilla offsets, exclusions, error thresholds, color-code settings), the
+    device coupling map, topology and per-qubit readout errors.
+    """
+    payload = {
+        'version': LAYOUT_CACHE_VERSION,
+        'layout_type': layout_type,
+        'code_distance': code_distance,
+        'params': _normalize(params),
+        'topology_type': device.get('topology_type', 'unknown'),
+        'coupling_map': _normalize(device.get('coupling_map')),
+        'qubit_connectivity': _normalize(device.get('qubit_connectivity')),
+        'readout_error': {str(q): (p or {}).get('readout_error') for q, p in (device.get('qubit_properties') or {}).items()},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+
+def _int_keys(mapping: Dict[str, Any]) -> Dict[Any, Any]:
+    return {int(k) if isinstance(k, str) and k.lstrip('-').isdigit() else k: v for k, v in mapping.items()}
+
+
+class LayoutCache:
+    """
+    Content-addressed cache of generated SurfaceCodeObjects: an in-process LRU of frozen objects,
+    optionally backed by JSON files (<cache_dir>/<key>.json) shared across processes. Fields derived
+    from code or config outside the key (e.g. supported_logical_gates) are refreshed on disk hits.
+    Args:
+        max_entries: LRU capacity
+    """
+    _shared: Optional['LayoutCache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, SurfaceCodeObject]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    @classmethod
+    def shared(cls) -> 'LayoutCache':
+        """Process-wide cache used by HeuristicInitializationLayer."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, key: str, cache_dir: Optional[str] = None,
+            on_load: Optional[Callable[[SurfaceCodeObject], None]] = None) -> Optional[SurfaceCodeObject]:
+        """
+        Cached code for `key`: memory first, then <cache_dir>/<key>.json.
+        Args:
+            on_load: called with a code read from disk before it is frozen, to recompute fields
+                the key does not cover
+        """
+        with self._lock:
+            code = self._entries.get(key)
+            if code is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return code
+        code = self._load(os.path.join(cache_dir, f"{key}.json")) if cache_dir else None
+        with self._lock:
+            if code is None:
+                self.stats['misses'] += 1
+                return None
+            self.stats['disk_hits'] += 1
+        if on_load is not None:
+            on_load(code)
+        return self._remember(key, code.freeze())
+
+    def put(self, key: str, code: SurfaceCodeObject, cache_dir: Optional[str] = None) -> SurfaceCodeObject:
+        """Freeze and store a code; returns the shared instance for `key`."""
+        code = self._remember(key, code.freeze())
+        if cache_dir:
+            self._save(os.path.join(cache_dir, f"{key}.json"), code)
+        return code
+
+    def _remember(self, key: str, code: SurfaceCodeObject) -> SurfaceCodeObject:
+        with self._lock:
+            code = self._entries.setdefault(key, code)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(1, self.max_entries):
+                self._entries.popitem(last=False)
+            return code
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _load(path: str) -> Optional[SurfaceCodeObject]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            data['qubit_layout'] = _int_keys(data['qubit_layout'])
+            data['edges'] = [tuple(e) for e in data.get('edges', [])]
+            return SurfaceCodeObject.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[WARNING][LayoutCache] Ignoring unreadable layout cache file {path}: {e}")
+            return None
+
+    @staticmethod
+    def _save(path: str, code: SurfaceCodeObject) -> None:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = code.to_dict()
+            data['topology_type'] = code.grid_connectivity
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[WARNING][LayoutCache] Could not write layout cache file {path}: {e}")
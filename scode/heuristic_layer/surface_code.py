@@ -7,11 +7,33 @@ from hardware_abstraction.device_abstraction import DeviceAbstraction
 from scode.heuristic_layer.heuristic_initialization_layer import HeuristicInitializationLayer
 from scode.multi_patch_mapper.multi_patch_mapper import MultiPatchMapper
 from scode.utils.decoder_interface import DecoderInterface
+from concurrent.futures import ProcessPoolExecutor
 import math
 import logging
+import os
+import random
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DISTANCE_SWEEP = {
+    'workers': 1,        # > 1: evaluate candidate distances in a process pool; 0 = one per CPU
+    'target_ler': None,  # stop at the smallest distance whose LER is <= target (None: lowest LER overall)
+    'seed': None,        # distance d seeds the mapper and the LER sampler with seed + d (reproducible sweeps)
+    'num_trials': 1000,  # shots per LER estimate
+}
+
+_worker_surface_code = None
+
+
+def _init_sweep_worker(cls, config: dict, device_config: dict) -> None:
+    global _worker_surface_code
+    _worker_surface_code = cls.from_configs(config, device_config)
+
+
+def _evaluate_distance_in_worker(d: int, layout_type: str, num_patches: int, mapping_constraints: Dict[str, Any], sweep: Dict[str, Any]):
+    return _worker_surface_code._evaluate_distance(d, layout_type, num_patches, mapping_constraints, sweep)
+
 def deep_merge(base: dict, override: dict) -> dict:
     if not override:
         return base.copy()
@@ -36,6 +58,18 @@ class SurfaceCode:
         self.current_codes = None
         self.current_mapping = None
 
+    @classmethod
+    def from_configs(cls, config: dict, device_config: dict) -> 'SurfaceCode':
+        """Build a SurfaceCode from already merged configs (no registry or hardware.json lookup)."""
+        surface_code = cls.__new__(cls)
+        surface_code.config = config
+        surface_code.device_config = device_config
+        surface_code.h_layer = HeuristicInitializationLayer(config, device_config)
+        surface_code.mapper = MultiPatchMapper(config, device_config)
+        surface_code.current_codes = None
+        surface_code.current_mapping = None
+        return surface_code
+
     def get_codes(self, code_distance: int, layout_type: str, num_patches: int = 1):
         """
         Generate one or more surface code layouts.
@@ -97,47 +131,21 @@ class SurfaceCode:
                 n = len(qc)
         if n is None:
             raise ValueError("Device qubit count could not be determined from config.")
-        import math
         # --- If code_distance is None, auto-select the best d based on LER ---
         if code_distance is None:
             min_d = 3
-            if layout_type in ('planar', 'rotated'):
-                max_d = int(math.sqrt(((n/num_patches)+1)/2))
-            elif layout_type == 'color':
-                max_d = int(math.sqrt(((2*n/num_patches)-1)/3))
-            else:
-                max_d = int(math.sqrt(n/num_patches))
-            best_ler = float('inf')
-            best_d = None
-            best_mapping = None
-            for d in range(min_d, max_d+1, 2):  # Only odd distances
-                try:
-                    logger.debug("Trying code distance %s for %s patches...", d, num_patches)
-                    codes = self.get_codes(d, layout_type, num_patches)
-                    if any(not hasattr(code, 'qubit_layout') or not code.qubit_layout for code in codes):
-                        logger.debug("At least one patch for d=%s is empty or invalid!", d)
-                        raise ValueError(f"Generated patch for code distance {d} is empty or invalid.")
-                    mapping = self.mapper.map_patches(codes, mapping_constraints)
-                    # Estimate logical error rate (LER) for this mapping using DecoderInterface
-                    ler = None
-                    try:
-                        layout = codes[0] if len(codes) == 1 else codes
-                        noise_model = self.device_config.get('noise_model', {'p': 0.001})
-                        ler = DecoderInterface.estimate_logical_error_rate(layout, mapping, noise_model)
-                    except Exception as e:
-                        logger.error("LER estimation error: %s", e)
-                        ler = None
-                    if ler is not None and ler < best_ler:
-                        best_ler = ler
-                        best_d = d
-                        best_mapping = mapping
-                except Exception as e:
-                    logger.warning("Skipping code distance %s: %s", d, e)
-                    continue  # Skip invalid d
+            max_d = self._max_code_distance(layout_type, n, num_patches)
+            # Bounding: distances whose patches cannot fit on the device are never generated or mapped
+            candidates = [d for d in range(min_d, max_d+1, 2)  # Only odd distances
+                          if self._required_qubits(layout_type, d, num_patches) <= n]
+            sweep = {**DEFAULT_DISTANCE_SWEEP, **(self.config.get('multi_patch_rl_agent', {}).get('distance_sweep') or {}),
+                     **(mapping_constraints.get('distance_sweep') or {})}
+            best_d, best_ler, best_mapping = self._sweep_code_distances(candidates, layout_type, num_patches, mapping_constraints, sweep)
             if best_mapping is None:
                 logger.debug("No valid code distance found for %s patches on this device after trying all distances.", num_patches)
                 raise ValueError(f"No valid code distance found for {num_patches} patches on this device.")
             logger.info("Selected code type: %s, code distance: %s, LER: %.3e", layout_type, best_d, best_ler)
+            self.get_codes(best_d, layout_type, num_patches)
             best_mapping['selected_code_distance'] = best_d
             best_mapping['selected_code_type'] = layout_type
             best_mapping['selected_ler'] = best_ler
@@ -145,20 +153,16 @@ class SurfaceCode:
             return best_mapping
         # --- If code_distance is provided, use as before ---
         code_distance = int(code_distance)
+        max_d = self._max_code_distance(layout_type, n, num_patches)
+        required_qubits = self._required_qubits(layout_type, code_distance, num_patches)
         if layout_type in ('planar', 'rotated'):
-            max_d = int(math.sqrt(((n/num_patches)+1)/2))
-            required_qubits = num_patches*(2*code_distance*code_distance-1)
             if required_qubits > n:
                 logger.debug("Not enough physical qubits for %s planar/rotated patches of distance %s. Required: %s, available: %s", num_patches, code_distance, required_qubits, n)
                 raise ValueError(f"Not enough physical qubits for {num_patches} planar/rotated patches of distance {code_distance}. Max allowed distance: {max_d}, available qubits: {n}")
         elif layout_type == 'color':
-            max_d = int(math.sqrt(((2*n/num_patches)-1)/3))
-            required_qubits = num_patches*((3*code_distance*code_distance+1)//2)
             if required_qubits > n:
                 raise ValueError(f"Not enough physical qubits for {num_patches} color code patches of distance {code_distance}. Max allowed distance: {max_d}, available qubits: {n}")
         else:
-            max_d = int(math.sqrt(n/num_patches))
-            required_qubits = num_patches*code_distance*code_distance
             if required_qubits > n:
                 logger.debug("Not enough physical qubits for %s patches of distance %s. Required: %s, available: %s", num_patches, code_distance, required_qubits, n)
                 raise ValueError(f"Not enough physical qubits for {num_patches} patches of distance {code_distance}. Max allowed distance: {max_d}, available qubits: {n}")
@@ -185,6 +189,117 @@ class SurfaceCode:
         logger.debug("get_multi_patch_mapping: final patch_shapes=%s", patch_shapes)
         return mapping 
 
+    @staticmethod
+    def _max_code_distance(layout_type: str, n: int, num_patches: int) -> int:
+        """Largest code distance whose patches can fit on n physical qubits."""
+        if layout_type in ('planar', 'rotated'):
+            return int(math.sqrt(((n/num_patches)+1)/2))
+        if layout_type == 'color':
+            return int(math.sqrt(((2*n/num_patches)-1)/3))
+        return int(math.sqrt(n/num_patches))
+
+    @staticmethod
+    def _required_qubits(layout_type: str, code_distance: int, num_patches: int) -> int:
+        """Physical qubits needed by num_patches patches of the given distance."""
+        if layout_type in ('planar', 'rotated'):
+            return num_patches*(2*code_distance*code_distance-1)
+        if layout_type == 'color':
+            return num_patches*((3*code_distance*code_distance+1)//2)
+        return num_patches*code_distance*code_distance
+
+    def _evaluate_distance(self, d: int, layout_type: str, num_patches: int, mapping_constraints: Dict[str, Any],
+                           sweep: Dict[str, Any]):
+        """
+        Generate, map and estimate the LER of one candidate distance. With a sweep seed the global
+        random/np.random state is seeded with seed + d for the mapper and restored afterwards.
+        Returns:
+            (ler, mapping); ler is None if the distance is invalid or its LER could not be estimated
+        """
+        seed = sweep.get('seed')
+        if seed is None:
+            return self._map_and_estimate(d, layout_type, num_patches, mapping_constraints, sweep, None)
+        random_state, np_state = random.getstate(), np.random.get_state()
+        random.seed(seed + d)
+        np.random.seed((seed + d) % (2 ** 32))
+        try:
+            return self._map_and_estimate(d, layout_type, num_patches, mapping_constraints, sweep, seed + d)
+        finally:
+            random.setstate(random_state)
+            np.random.set_state(np_state)
+
+    def _map_and_estimate(self, d: int, layout_type: str, num_patches: int, mapping_constraints: Dict[str, Any],
+                          sweep: Dict[str, Any], seed: Optional[int]):
+        try:
+            logger.debug("Trying code distance %s for %s patches...", d, num_patches)
+            codes = self.get_codes(d, layout_type, num_patches)
+            if any(not hasattr(code, 'qubit_layout') or not code.qubit_layout for code in codes):
+                logger.debug("At least one patch for d=%s is empty or invalid!", d)
+                raise ValueError(f"Generated patch for code distance {d} is empty or invalid.")
+            # MultiPatchMapper only supports RL-agent mapping
+            mapping = self.mapper.map_patches(codes, mapping_constraints, use_rl_agent=True)
+        except Exception as e:
+            logger.warning("Skipping code distance %s: %s", d, e)
+            return None, None  # Skip invalid d
+        # Estimate logical error rate (LER) of every mapped patch using DecoderInterface; report the mean
+        try:
+            noise_model = self.device_config.get('noise_model', {'p': 0.001})
+            patch_mappings = mapping.get('logical_to_physical', {})
+            lers = [DecoderInterface.estimate_logical_error_rate(code, patch_mappings[i], noise_model,
+                                                                 num_trials=sweep.get('num_trials', 1000), seed=seed)
+                    for i, code in enumerate(codes) if patch_mappings.get(i)]
+            ler = sum(lers) / len(lers) if lers else None
+        except Exception as e:
+            logger.error("LER estimation error: %s", e)
+            ler = None
+        return ler, mapping
+
+    def _sweep_code_distances(self, candidates, layout_type: str, num_patches: int, mapping_constraints: Dict[str, Any],
+                              sweep: Dict[str, Any]):
+        """
+        Evaluate candidate distances (ascending) and pick the one with the lowest LER (ties: smallest d).
+        With a target_ler the sweep stops at the first distance meeting it. With workers > 1 the distances
+        are evaluated concurrently in a process pool; results are consumed in distance order, so the
+        selection is the same as the sequential sweep and distances past an early stop are cancelled.
+        Returns:
+            (best_d, best_ler, best_mapping); best_mapping is None if no distance was valid
+        """
+        target_ler = sweep.get('target_ler')
+        workers = int(sweep.get('workers') or 0) or os.cpu_count() or 1
+        workers = min(workers, len(candidates))
+        pool = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker,
+                                       initargs=(type(self), self.config, self.device_config))
+            futures = [pool.submit(_evaluate_distance_in_worker, d, layout_type, num_patches, mapping_constraints, sweep)
+                       for d in candidates]
+            results = (self._sweep_result(future, d) for future, d in zip(futures, candidates))
+        else:
+            results = (self._evaluate_distance(d, layout_type, num_patches, mapping_constraints, sweep) for d in candidates)
+        best_ler = float('inf')
+        best_d = None
+        best_mapping = None
+        try:
+            for d, (ler, mapping) in zip(candidates, results):
+                if ler is not None and ler < best_ler:
+                    best_ler = ler
+                    best_d = d
+                    best_mapping = mapping
+                if target_ler is not None and ler is not None and ler <= target_ler:
+                    logger.debug("Code distance %s meets target LER %.3e; stopping the sweep.", d, target_ler)
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        return best_d, best_ler, best_mapping
+
+    @staticmethod
+    def _sweep_result(future, d: int):
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning("Skipping code distance %s: %s", d, e)
+            return None, None
+
     def get_single_patch_mapping(self, code_distance: int, layout_type: str, mapping_constraints: Optional[Dict[str, Any]] = None):
         """Compatibility wrapper that enforces a single logical patch mapping.
 
@@ -2,9 +2,53 @@
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
 from typing import Dict, Any, List, Tuple, Optional, Union
+import copy
 import networkx as nx
 import numpy as np
 
+
+def _read_only(*args, **kwargs):
+    raise TypeError("Frozen SurfaceCodeObject data cannot be modified (use mutable_copy())")
+
+
+class FrozenDict(dict):
+    """dict that rejects mutation; copies (copy/deepcopy/dict()) are ordinary dicts."""
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+
+class FrozenList(list):
+    """list that rejects mutation; copies (copy/deepcopy/list()) are ordinary lists."""
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return FrozenDict({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return FrozenList(_freeze(v) for v in value)
+    return value
+
+
 class SurfaceCodeObject:
     """
     Object representation of a surface code.
@@ -44,6 +88,51 @@ class SurfaceCodeObject:
         # Validate the surface code
         self.is_valid = self.validate(raise_error=False)
 
+    def __setattr__(self, name, value):
+        # Frozen (shared, cached) codes only accept no-op re-assignments such as code.is_valid = True
+        if self.__dict__.get('_frozen') and getattr(self, name, None) is not value:
+            raise AttributeError(f"Frozen SurfaceCodeObject attribute '{name}' cannot be reassigned (use mutable_copy())")
+        super().__setattr__(name, value)
+
+    def freeze(self) -> 'SurfaceCodeObject':
+        """
+        Make this object immutable in place, so it can be shared between callers (layout cache).
+        Dicts and lists become read-only dict/list subclasses and the adjacency graph is nx.freeze()d.
+        Returns:
+            self
+        """
+        if not self.__dict__.get('_frozen'):
+            for name in ('qubit_layout', 'stabilizer_map', 'logical_operators', 'supported_logical_gates'):
+                super().__setattr__(name, _freeze(getattr(self, name)))
+            if isinstance(self.adjacency_matrix, nx.Graph):
+                nx.freeze(self.adjacency_matrix)
+            super().__setattr__('_frozen', True)
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return bool(self.__dict__.get('_frozen'))
+
+    def mutable_copy(self) -> 'SurfaceCodeObject':
+        """Independent, mutable deep copy (also what copy.deepcopy returns for a frozen object)."""
+        clone = object.__new__(type(self))
+        for name, value in self.__dict__.items():
+            if name == '_frozen':
+                continue
+            if isinstance(value, nx.Graph):
+                value = value.__class__(value)  # rebuilt graph is not frozen
+            object.__setattr__(clone, name, copy.deepcopy(value))
+        return clone
+
+    def __deepcopy__(self, memo):
+        if self.frozen:
+            return self.mutable_copy()
+        clone = object.__new__(type(self))
+        memo[id(self)] = clone
+        for name, value in self.__dict__.items():
+            object.__setattr__(clone, name, copy.deepcopy(value, memo))
+        return clone
+
     def validate(self, raise_error: bool = True) -> bool:
         """
         Validate the surface code for correctness, including advanced color code support.
@@ -310,42 +399,25 @@ class SurfaceCodeObject:
             supported_logical_gates=data.get('supported_logical_gates', [])
         )
 
-    def to_stim_circuit(self, mapping, noise_model):
+    def to_stim_circuit(self, mapping, noise_model, rounds: Optional[int] = None, basis: Optional[str] = None):
         """
-        Build a stim.Circuit for this surface code object, using the logical-to-physical mapping and noise model.
+        Build a multi-round memory-experiment stim.Circuit for this surface code object.
+        Every round measures all stabilizers; detectors compare consecutive rounds and the final
+        data readout defines logical observable 0 for the chosen basis.
         Args:
             mapping: logical_to_physical mapping dict
-            noise_model: dict describing noise (e.g., {'p': 0.001})
+            noise_model: dict describing noise (e.g., {'p': 0.001}); may also carry per-qubit
+                'qubit_properties' and per-gate 'gate_error_rates' from the device config
+            rounds: number of syndrome rounds (default: noise_model['rounds'] or the code distance)
+            basis: memory basis 'Z' or 'X' (default: noise_model['basis'] or 'Z')
         Returns:
             stim.Circuit instance
         """
-        import stim
-        p = noise_model.get('p', 0.001) if noise_model else 0.001
-        circuit = stim.Circuit()
-        # Map logical to physical qubits
-        qubit_map = mapping if mapping else {q: q for q in self.qubit_layout}
-        # Add noise to all physical qubits
-        for q in qubit_map.values():
-            circuit.append_operation("DEPOLARIZE1", [q], p)
-        # For each stabilizer round, measure all stabilizers
-        for stab_type in ['X', 'Z']:
-            for stab in self.stabilizer_map.get(stab_type, []):
-                anc = qubit_map[stab['ancilla']]
-                data = [qubit_map[q] for q in stab['data_qubits']]
-                # Prepare ancilla in |+> or |0> depending on X or Z
-                if stab_type == 'X':
-                    circuit.append_operation("H", [anc])
-                # CNOTs: data -> ancilla (X: CNOT, Z: CNOT with H)
-                for dq in data:
-                    if stab_type == 'X':
-                        circuit.append_operation("CNOT", [dq, anc])
-                    else:
-                        circuit.append_operation("CNOT", [anc, dq])
-                # Measure ancilla
-                circuit.append_operation("M", [anc])
-                # Reset ancilla (optional, for repeated rounds)
-                circuit.append_operation("R", [anc])
-        # Measure all data qubits at the end (for logical operator detection)
-        data_qubits = [qubit_map[q] for q in self.get_data_qubits()]
-        circuit.append_operation("M", data_qubits)
-        return circuit 
\ No newline at end of file
+        from scode.utils.memory_experiment import MemoryExperimentBuilder
+        noise_model = noise_model if isinstance(noise_model, dict) else {}
+        if rounds is None:
+            rounds = noise_model.get('rounds', self.code_distance)
+        if basis is None:
+            basis = noise_model.get('basis', 'Z')
+        builder = MemoryExperimentBuilder(self.qubit_layout, self.stabilizer_map, self.logical_operators, self.get_data_qubits())
+        return builder.build(mapping, noise_model, rounds=rounds, basis=basis)
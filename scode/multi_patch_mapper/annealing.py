@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import math
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from scode.multi_patch_mapper.mapping_problem import MappingProblem
+
+SCHEDULES = ('geometric', 'linear')
+
+# Defaults reproduce the legacy schedule: T 1.0 -> 1e-3, x0.95 per level, 100 moves per level
+DEFAULT_ANNEALING_PARAMS = {
+    't_start': 1.0,
+    't_min': 1e-3,
+    'alpha': 0.95,
+    'schedule': 'geometric',
+    'num_temperatures': None,  # linear schedule length (default: as many levels as the geometric one)
+    'moves_per_temperature': 100,
+    'restarts': 1,
+    'seed': None,
+}
+
+
+def temperatures(t_start: float, t_min: float, alpha: float, schedule: str = 'geometric',
+                 num_temperatures: Optional[int] = None) -> np.ndarray:
+    """Temperature levels of an annealing schedule."""
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown annealing schedule '{schedule}'. Use one of: {list(SCHEDULES)}")
+    if num_temperatures is None:
+        num_temperatures = max(1, math.ceil(math.log(t_min / t_start) / math.log(alpha)))
+    if schedule == 'geometric':
+        return t_start * alpha ** np.arange(num_temperatures)
+    return np.linspace(t_start, t_min, num_temperatures)
+
+
+def _anneal(problem: MappingProblem, perm: np.ndarray, temps: np.ndarray, moves: int,
+            rng: np.random.Generator) -> Tuple[np.ndarray, float]:
+    """One annealing run on a slot permutation (perm[:n_logical] is the assignment)."""
+    n, h = problem.n_logical, problem.n_hw
+    assignment = perm[:n]  # view: updated in place with perm
+    current = best = problem.cost(assignment)
+    best_assignment = assignment.copy()
+    for t in temps:
+        firsts = rng.integers(0, n, size=moves)
+        # A logical swaps with another logical or with a free candidate qubit
+        seconds = rng.integers(0, h - 1, size=moves)
+        draws = rng.random(moves)
+        for a, b, u in zip(firsts.tolist(), seconds.tolist(), draws.tolist()):
+            if b >= a:
+                b += 1
+            slot_a, slot_b = perm[a], perm[b]
+            if b < n:
+                delta = problem.move_delta(assignment, a, slot_b, exclude=b) + \
+                        problem.move_delta(assignment, b, slot_a, exclude=a)
+            else:
+                delta = problem.move_delta(assignment, a, slot_b)
+            if delta <= 0 or u < math.exp(-delta / t):
+                perm[a], perm[b] = slot_b, slot_a
+                current += delta
+                if current < best - 1e-12:
+                    best = current
+                    best_assignment = assignment.copy()
+    return best_assignment, problem.cost(best_assignment)
+
+
+def simulated_annealing(problem: MappingProblem, params: Optional[Dict[str, Any]] = None,
+                        initial: Optional[np.ndarray] = None) -> Tuple[np.ndarray, float, Dict[str, Any]]:
+    """
+    Simulated annealing over slot permutations with O(degree) delta costs.
+    Args:
+        problem: MappingProblem to minimize
+        params: overrides of DEFAULT_ANNEALING_PARAMS
+        initial: optional starting assignment for the first restart (default: slots 0..n-1)
+    Returns:
+        (best assignment, its cost, stats with per-restart costs)
+    """
+    p = dict(DEFAULT_ANNEALING_PARAMS, **(params or {}))
+    n, h = problem.n_logical, problem.n_hw
+    if h < n:
+        raise ValueError("Not enough hardware qubits for mapping (after constraints)")
+    rng = np.random.default_rng(p['seed'])
+    temps = temperatures(p['t_start'], p['t_min'], p['alpha'], p['schedule'], p['num_temperatures'])
+    best_assignment, best_cost, restart_costs = None, math.inf, []
+    for restart in range(max(1, int(p['restarts']))):
+        if restart == 0:
+            start = np.arange(n) if initial is None else np.asarray(initial)
+            rest = np.setdiff1d(np.arange(h), start, assume_unique=True)
+            perm = np.concatenate([start, rest]).astype(np.int64)
+        else:
+            perm = rng.permutation(h)
+        if n == 0 or h < 2:
+            assignment, cost = perm[:n].copy(), problem.cost(perm[:n])
+        else:
+            assignment, cost = _anneal(problem, perm, temps, int(p['moves_per_temperature']), rng)
+        restart_costs.append(cost)
+        if cost < best_cost:
+            best_assignment, best_cost = assignment, cost
+    return best_assignment, best_cost, {'restart_costs': restart_costs, 'temperatures': len(temps)}
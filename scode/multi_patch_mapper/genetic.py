@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from scode.multi_patch_mapper.mapping_problem import MappingProblem
+
+CROSSOVERS = ('order', 'pmx')
+
+# Population, generations and mutation rate default to the legacy values
+DEFAULT_GENETIC_PARAMS = {
+    'pop_size': 30,
+    'generations': 50,
+    'mutation_rate': 0.2,
+    'crossover': 'pmx',
+    'survivor_fraction': 0.5,
+    'workers': 1,  # > 1: score the population in a process pool
+    'seed': None,
+}
+
+_WORKER_PROBLEM: Optional[MappingProblem] = None
+
+
+def _init_worker(problem: MappingProblem) -> None:
+    global _WORKER_PROBLEM
+    _WORKER_PROBLEM = problem
+
+
+def _score_chunk(chunk: np.ndarray) -> np.ndarray:
+    return _WORKER_PROBLEM.costs(chunk)
+
+
+def order_crossover(p1: np.ndarray, p2: np.ndarray, c1: int, c2: int) -> np.ndarray:
+    """OX: keep p1[c1:c2] in place, fill the other positions with the remaining genes in p2 order."""
+    child = np.empty_like(p1)
+    segment = p1[c1:c2]
+    child[c1:c2] = segment
+    rest = p2[~np.isin(p2, segment, assume_unique=True)]
+    child[:c1] = rest[:c1]
+    child[c2:] = rest[c1:]
+    return child
+
+
+def pmx_crossover(p1: np.ndarray, p2: np.ndarray, c1: int, c2: int) -> np.ndarray:
+    """PMX: keep p1[c1:c2]; other positions take p2's gene, resolved through the segment mapping."""
+    child = p2.copy()
+    child[c1:c2] = p1[c1:c2]
+    position_in_p1 = np.empty_like(p1)
+    position_in_p1[p1] = np.arange(len(p1))
+    in_segment = np.zeros(len(p1), dtype=bool)
+    in_segment[p1[c1:c2]] = True
+    for k in np.concatenate([np.arange(c1), np.arange(c2, len(p1))]):
+        gene = child[k]
+        while in_segment[gene]:
+            gene = p2[position_in_p1[gene]]
+        child[k] = gene
+    return child
+
+
+def genetic_algorithm(problem: MappingProblem, params: Optional[Dict[str, Any]] = None) -> Tuple[np.ndarray, float, Dict[str, Any]]:
+    """
+    Genetic algorithm over slot permutations.
+
+    Each individual is a permutation of the n_hw candidate slots; its first n_logical entries are
+    the assignment, so crossover and mutation can also move logical qubits onto unused hardware
+    qubits. The population is a (pop_size, n_hw) int array scored with one vectorized
+    MappingProblem.costs pass per generation (optionally split across a process pool).
+    Args:
+        problem: MappingProblem to minimize
+        params: overrides of DEFAULT_GENETIC_PARAMS
+    Returns:
+        (best assignment, its cost, stats with the best cost per generation)
+    """
+    p = dict(DEFAULT_GENETIC_PARAMS, **(params or {}))
+    if p['crossover'] not in CROSSOVERS:
+        raise ValueError(f"Unknown crossover '{p['crossover']}'. Use one of: {list(CROSSOVERS)}")
+    n, h = problem.n_logical, problem.n_hw
+    if h < n:
+        raise ValueError("Not enough hardware qubits for mapping (after constraints)")
+    rng = np.random.default_rng(p['seed'])
+    pop_size = max(2, int(p['pop_size']))
+    n_survivors = min(pop_size - 1, max(2, int(round(pop_size * p['survivor_fraction']))))
+    crossover = order_crossover if p['crossover'] == 'order' else pmx_crossover
+    population = np.argsort(rng.random((pop_size, h)), axis=1)
+    workers = int(p['workers'] or 1)
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(problem,)) if workers > 1 else None
+
+    def score(pop: np.ndarray) -> np.ndarray:
+        if pool is None:
+            return problem.costs(pop[:, :n])
+        return np.concatenate(list(pool.map(_score_chunk, np.array_split(pop[:, :n], workers))))
+
+    history = []
+    try:
+        costs = score(population)
+        for _ in range(int(p['generations'])):
+            order = np.argsort(costs, kind='stable')
+            survivors, survivor_costs = population[order[:n_survivors]], costs[order[:n_survivors]]
+            history.append(float(survivor_costs[0]))
+            n_children = pop_size - n_survivors
+            parents = np.array([rng.choice(n_survivors, size=2, replace=False) for _ in range(n_children)])
+            cuts = np.sort(rng.integers(0, h + 1, size=(n_children, 2)), axis=1)
+            children = np.stack([crossover(survivors[a], survivors[b], c1, c2)
+                                 for (a, b), (c1, c2) in zip(parents, cuts)])
+            # Mutation: swap an assigned slot with any other slot (possibly an unused qubit)
+            mutate = np.flatnonzero(rng.random(n_children) < p['mutation_rate'])
+            if len(mutate) and n and h > 1:
+                i = rng.integers(0, n, size=len(mutate))
+                j = (i + rng.integers(1, h, size=len(mutate))) % h
+                children[mutate, i], children[mutate, j] = children[mutate, j], children[mutate, i]
+            population = np.concatenate([survivors, children])
+            costs = np.concatenate([survivor_costs, score(children)])
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    best = int(np.argmin(costs))
+    return population[best, :n].copy(), float(costs[best]), {'best_cost_per_generation': history}
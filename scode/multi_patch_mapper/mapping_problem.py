@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+
+class MappingProblem:
+    """
+    Array form of the heuristic mapping cost used by the MultiPatchMapper search heuristics.
+
+    An assignment is an int array `a` of length n_logical holding, for every logical qubit, a slot
+    in `hw_qubits` (the candidate hardware qubits left after constraints). Its cost is
+
+        sum over neighbour entries (lq -> ln) of hop_distance(hw(lq), hw(ln)) + error_weight * sum readout_error(hw(lq))
+
+    i.e. the legacy dict-based cost with the real hop distance of the device. Neighbour entries are
+    folded into undirected weighted edges, so symmetric adjacency counts every edge twice, as before.
+    Args:
+        logical_qubits: logical qubit ids (duplicates are collapsed, as in the dict mappings)
+        logical_neighbors: logical qubit -> neighbouring logical qubits
+        hw_qubits: candidate hardware qubit ids
+        geometry: DeviceGeometry of the device
+        qubit_errors: device qubit_properties (readout_error per hardware qubit)
+        error_weight: weight of the readout-error term
+    """
+
+    def __init__(self, logical_qubits: Sequence[Any], logical_neighbors: Dict[Any, Sequence[Any]],
+                 hw_qubits: Sequence[int], geometry, qubit_errors: Dict[Any, Dict[str, Any]], error_weight: float = 10.0):
+        self.logical: List[Any] = list(dict.fromkeys(logical_qubits))
+        self.n_logical = len(self.logical)
+        self.hw_qubits = np.array([int(q) for q in hw_qubits], dtype=np.int64)
+        self.n_hw = len(self.hw_qubits)
+        rows = geometry.indices_of(self.hw_qubits)
+        self.distances = geometry.distances[np.ix_(rows, rows)].astype(np.float64)
+        self.node_cost = np.array([error_weight * qubit_errors.get(int(q), {}).get('readout_error', 0.0)
+                                   for q in self.hw_qubits], dtype=np.float64)
+        # Undirected weighted edges between logical indices
+        position = {lq: i for i, lq in enumerate(self.logical)}
+        weights: Dict[tuple, float] = {}
+        for lq in self.logical:
+            for ln in logical_neighbors.get(lq, []) or []:
+                if ln in position and ln != lq:
+                    u, v = sorted((position[lq], position[ln]))
+                    weights[(u, v)] = weights.get((u, v), 0.0) + 1.0
+        edges = sorted(weights)
+        self.edge_u = np.array([u for u, _ in edges], dtype=np.int64)
+        self.edge_v = np.array([v for _, v in edges], dtype=np.int64)
+        self.edge_w = np.array([weights[e] for e in edges], dtype=np.float64)
+        # Per-logical neighbour lists (both directions) for delta evaluation
+        self.neighbors: List[List[tuple]] = [[] for _ in range(self.n_logical)]
+        for (u, v), w in weights.items():
+            self.neighbors[u].append((v, w))
+            self.neighbors[v].append((u, w))
+
+    def cost(self, assignment: np.ndarray) -> float:
+        assignment = np.asarray(assignment)
+        edge_cost = self.edge_w @ self.distances[assignment[self.edge_u], assignment[self.edge_v]] if len(self.edge_w) else 0.0
+        return float(edge_cost + self.node_cost[assignment].sum())
+
+    def costs(self, population: np.ndarray) -> np.ndarray:
+        """Cost of every row of a (pop_size, n_logical) assignment array in one pass."""
+        population = np.asarray(population)
+        total = self.node_cost[population].sum(axis=1)
+        if len(self.edge_w):
+            total = total + self.distances[population[:, self.edge_u], population[:, self.edge_v]] @ self.edge_w
+        return total
+
+    def move_delta(self, assignment: np.ndarray, lq: int, new_slot: int, exclude: int = -1) -> float:
+        """Cost change of moving logical index `lq` to `new_slot`, other logicals fixed (edge to `exclude` ignored)."""
+        old_slot = assignment[lq]
+        row_new, row_old = self.distances[new_slot], self.distances[old_slot]
+        delta = self.node_cost[new_slot] - self.node_cost[old_slot]
+        for other, w in self.neighbors[lq]:
+            if other != exclude:
+                slot = assignment[other]
+                delta += w * (row_new[slot] - row_old[slot])
+        return float(delta)
+
+    def to_mapping(self, assignment: np.ndarray) -> Dict[Any, int]:
+        return {lq: int(self.hw_qubits[slot]) for lq, slot in zip(self.logical, assignment)}
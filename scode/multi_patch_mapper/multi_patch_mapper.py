@@ -4,15 +4,16 @@
 import copy
 from typing import List, Dict, Any, Optional, Callable
 from scode.heuristic_layer.surface_code_object import SurfaceCodeObject
-import networkx as nx
 import numpy as np
-import random
 import pprint
 from scode.utils.decoder_interface import DecoderInterface
 import traceback
 from scode.heuristic_layer.heuristic_initialization_layer import HeuristicInitializationLayer
 from scode.rl_agent.reward_engine import MultiPatchRewardEngine
-import glob
+from hardware_abstraction.device_abstraction import DeviceAbstraction
+from scode.multi_patch_mapper.annealing import simulated_annealing
+from scode.multi_patch_mapper.genetic import genetic_algorithm
+from scode.multi_patch_mapper.mapping_problem import MappingProblem
 import os
 import logging
 
@@ -73,6 +74,8 @@ class MultiPatchMapper:
     def __init__(self, config: Dict[str, Any], hardware_graph: Dict[str, Any]):
         self.config = config
         self.hardware_graph = hardware_graph
+        # Shared hop-distance/adjacency geometry of the device, used by the heuristic cost functions
+        self.geometry = DeviceAbstraction.get_geometry(hardware_graph)
         # Register heuristics
         self._register_heuristics()
 
@@ -155,6 +158,7 @@ class MultiPatchMapper:
         from scode.rl_agent.environment import SurfaceCodeEnvironment
         import os
         logical_to_physical = {}
+        rollout_summary = {}
         # --- Create generator and reward engine once ---
         surface_code_generator = HeuristicInitializationLayer(self.config, self.hardware_graph)
         reward_engine = MultiPatchRewardEngine(self.config)
@@ -185,23 +189,6 @@ class MultiPatchMapper:
             # Also set in multi_patch_rl_agent.environment if present
             if 'multi_patch_rl_agent' in env_config and 'environment' in env_config['multi_patch_rl_agent']:
                 env_config['multi_patch_rl_agent']['environment']['patch_count'] = patch_count
-            # Create environment ONCE
-            env = SurfaceCodeEnvironment(
-                env_config,
-                self.hardware_graph,
-                surface_code_generator=surface_code_generator,
-                reward_engine=reward_engine
-            )
-            logger.debug("RL env.surface_code_config: %s", env.surface_code_config)
-            env.surface_code_config['patch_count'] = patch_count
-            env.surface_code_config['code_distance'] = code_distance
-            env.surface_code_config['layout_type'] = layout_type_patch
-            obs, _ = env.reset()
-            # Defensive assertion
-            if env.patch_count != patch_count or len(env.current_mappings) != patch_count:
-                logger.error("RL env patch_count mismatch after reset! env.patch_count=%s, expected=%s, len(current_mappings)=%s", env.patch_count, patch_count, len(env.current_mappings))
-                logger.error("Config passed to env: %s", env_config)
-                raise RuntimeError(f"RL environment patch_count mismatch: env.patch_count={env.patch_count}, expected={patch_count}")
             # --- Find the correct policy file for the multi-patch config ---
             provider = self.hardware_graph.get('provider_name', 'provider').lower()
             dev_name = self.hardware_graph.get('device_name', 'device').lower()
@@ -211,51 +198,64 @@ class MultiPatchMapper:
                 or self.config.get('training_artifacts', {})
             )
             artifact_dir = os.path.abspath(training_artifacts_cfg.get('output_dir', './outputs/training_artifacts'))
-            # Match artifacts with or without an optional code_family token before layout_type.
-            # Examples we need to match:
-            #   provider_device_rotated_d3_patches2_stage1_sb3_ppo_surface_code_*.zip
-            #   provider_device_surface_rotated_d3_patches2_stage1_sb3_ppo_surface_code_*.zip
-            artifact_pattern = f"{provider}_{dev_name}_*{layout_type_patch}_d{code_distance}_patches{patch_count}_stage*_sb3_ppo_surface_code*.zip"
-            search_pattern = os.path.join(artifact_dir, artifact_pattern)
-            artifact_files = glob.glob(search_pattern)
-            if artifact_files:
-                artifact_files.sort(key=lambda f: os.path.getmtime(f), reverse=True)
-                policy_path = artifact_files[0]
-                if len(artifact_files) > 1:
-                    logger.warning("Multiple artifacts found for pattern %s. Using most recent: %s", artifact_pattern, policy_path)
-                logger.info("Loading RL policy: %s", policy_path)
-            else:
-                # Fallback: try to match the old pattern without stage/timestamp
-                fallback_pattern = f"{provider}_{dev_name}_{layout_type_patch}_d{code_distance}_patches{patch_count}_sb3_ppo_surface_code*.zip"
-                fallback_search = os.path.join(artifact_dir, fallback_pattern)
-                fallback_files = glob.glob(fallback_search)
-                if fallback_files:
-                    fallback_files.sort(key=lambda f: os.path.getmtime(f), reverse=True)
-                    policy_path = fallback_files[0]
-                    logger.warning("No stage/timestamp artifact found, using fallback: %s", policy_path)
-                    logger.info("Loading RL policy: %s", policy_path)
-                else:
-                    logger.error("No trained RL agent found for code_distance=%s, patch_count=%s, layout_type=%s. Expected at: %s", code_distance, patch_count, layout_type_patch, search_pattern)
-                    return {
-                        'multi_patch_layout': multi_patch_layout,
-                        'inter_patch_connectivity': inter_patch_connectivity,
-                        'resource_allocation': resource_allocation,
-                        'optimization_metrics': {},
-                        'logical_to_physical': {},
-                        'has_overlap': False
-                    }
-            from stable_baselines3 import PPO
-            model = PPO.load(policy_path, env=env)
-            done = False
-            step_count = 0
-            while not done:
-                action, _ = model.predict(obs, deterministic=True)
-                obs, reward, done, truncated, info = env.step(action)
-                step_count += 1
-                # Print only LER and reward concisely
+            # Newest indexed policy for this device/layout/distance/patch count (highest curriculum stage)
+            from scode.rl_agent.artifact_index import ArtifactIndex
+            artifact = ArtifactIndex.for_directory(artifact_dir).lookup(
+                provider=provider, device=dev_name, layout_type=layout_type_patch,
+                code_distance=code_distance, patch_count=patch_count)
+            if artifact is None:
+                logger.error("No trained RL agent found for code_distance=%s, patch_count=%s, layout_type=%s in %s", code_distance, patch_count, layout_type_patch, artifact_dir)
+                return {
+                    'multi_patch_layout': multi_patch_layout,
+                    'inter_patch_connectivity': inter_patch_connectivity,
+                    'resource_allocation': resource_allocation,
+                    'optimization_metrics': {},
+                    'logical_to_physical': {},
+                    'has_overlap': False
+                }
+            policy_path = artifact['path']
+            logger.info("Loading RL policy: %s", policy_path)
+            from scode.rl_agent.policy_inference import load_policy, run_batched_rollouts, select_best_rollout
+            # Batched inference: K seeded rollouts stepped together, one batched predict per step
+            inference_cfg = merged_config.get('multi_patch_rl_agent', {}).get('inference', {}) or {}
+            num_rollouts = max(1, int(inference_cfg.get('num_rollouts', 1)))
+            base_seed = int(inference_cfg.get('seed', 0))
+            envs = []
+            for k in range(num_rollouts):
+                env = SurfaceCodeEnvironment(
+                    env_config,
+                    self.hardware_graph,
+                    surface_code_generator=surface_code_generator,
+                    reward_engine=reward_engine if k == 0 else MultiPatchRewardEngine(self.config)
+                )
+                env.surface_code_config['patch_count'] = patch_count
+                env.surface_code_config['code_distance'] = code_distance
+                env.surface_code_config['layout_type'] = layout_type_patch
+                envs.append(env)
+            logger.debug("RL env.surface_code_config: %s", envs[0].surface_code_config)
+            # Loaded once per process; later calls reuse the cached policy
+            model = load_policy(policy_path)
+
+            def log_step(rollout_idx, step, reward, info):
                 ler = info.get('ler', info.get('logical_error_rate', None))
-                if (ler is not None) or (reward is not None):
-                    logger.info("RL inference step %s: reward=%s, LER=%s", step_count, reward, ler)
+                logger.debug("RL inference rollout %s step %s: reward=%s, LER=%s", rollout_idx, step, reward, ler)
+            rollouts = run_batched_rollouts(model, envs, [base_seed + k for k in range(num_rollouts)],
+                                            deterministic=inference_cfg.get('deterministic', True),
+                                            on_step=log_step)
+            for env in envs:
+                # Defensive assertion
+                if env.patch_count != patch_count or len(env.current_mappings) != patch_count:
+                    logger.error("RL env patch_count mismatch after reset! env.patch_count=%s, expected=%s, len(current_mappings)=%s", env.patch_count, patch_count, len(env.current_mappings))
+                    logger.error("Config passed to env: %s", env_config)
+                    raise RuntimeError(f"RL environment patch_count mismatch: env.patch_count={env.patch_count}, expected={patch_count}")
+            best = select_best_rollout(rollouts, inference_cfg.get('select_by', 'reward'),
+                                       num_trials=inference_cfg.get('ler_num_trials', 100))
+            env = best['env']
+            rollout_summary = {'num_rollouts': num_rollouts, 'selected_seed': best['seed'],
+                               'selected_reward': best['final_reward'], 'selected_ler': best['ler'],
+                               'rollout_rewards': [r['final_reward'] for r in rollouts]}
+            logger.info("RL inference: selected rollout seed=%s of %s (reward=%s, LER=%s)",
+                        best['seed'], num_rollouts, best['final_reward'], best['ler'])
             # Debug: print RL agent output mapping length and content
             logger.debug("RL agent env.current_mappings length: %s", len(getattr(env, 'current_mappings', [])))
             logger.debug("RL agent env.current_mappings: %s", getattr(env, 'current_mappings', None))
@@ -285,12 +285,16 @@ class MultiPatchMapper:
             has_overlap = len(set(all_hw)) < len(all_hw)
             if has_overlap:
                 logger.warning("Overlap detected: the same physical qubit is mapped to multiple logical qubits across patches!")
+            for rollout_env in envs:
+                rollout_env.close()
         except Exception as e:
             logger.error("Exception during RL agent mapping for all patches: %s", e)
             import traceback; traceback.print_exc()
         optimization_metrics = self._compute_optimization_metrics(
             multi_patch_layout, inter_patch_connectivity, logical_to_physical, advanced_constraints
         )
+        if rollout_summary:
+            optimization_metrics['rl_rollouts'] = rollout_summary
         logger.debug("MultiPatchMapper.map_patches (RL agent):")
         logger.debug("  Number of logical qubits: %s", sum(len(patch.qubit_layout) for patch in surface_code_objects))
         logger.debug("  Number of hardware qubits: %s", len(self.hardware_graph.get('qubit_connectivity', {})))
@@ -309,11 +313,7 @@ class MultiPatchMapper:
         Greedy mapping: assign logical data qubits to hardware qubits with lowest error, minimizing neighbor distance.
         Enforces exclusion zones and error thresholds.
         """
-        hw_graph = nx.Graph()
         hw_connectivity = self.hardware_graph.get('qubit_connectivity', {})
-        for q, neighbors in hw_connectivity.items():
-            for n in neighbors:
-                hw_graph.add_edge(int(q), int(n))
         qubit_errors = self.hardware_graph.get('qubit_properties', {})
         hw_nodes = set(hw_connectivity.keys())
         hw_nodes = _enforce_constraints(hw_nodes, qubit_errors, constraints)
@@ -374,7 +374,7 @@ class MultiPatchMapper:
                 candidate_hw = set()
                 for n in mapped_neighbors:
                     if n is not None:
-                        candidate_hw.update(hw_graph.neighbors(n))
+                        candidate_hw.update(int(nb) for nb in self.geometry.neighbors(n))
                 
                 # Filter out already used hardware qubits
                 candidate_hw = candidate_hw - used_hw
@@ -408,8 +408,6 @@ class MultiPatchMapper:
         qubit_errors = self.hardware_graph.get('qubit_properties', {})
         hw_nodes = list(map(int, hw_connectivity.keys()))
         hw_nodes = list(map(int, _enforce_constraints(hw_nodes, qubit_errors, constraints)))
-        def get_error(q):
-            return qubit_errors.get(int(q), {}).get('readout_error', 0.0)
         all_logical = []
         logical_neighbors = {}
         for patch in surface_code_objects:
@@ -424,36 +422,14 @@ class MultiPatchMapper:
                         logical_neighbors[lq] = []
                 else:
                     logical_neighbors[lq] = []
-        # Initial random assignment
         if len(hw_nodes) < len(all_logical):
             raise ValueError("Not enough hardware qubits for mapping (after constraints)")
-        current = {lq: hw for lq, hw in zip(all_logical, hw_nodes[:len(all_logical)])}
-        def cost(mapping):
-            total = 0.0
-            for lq, hw in mapping.items():
-                for ln in logical_neighbors.get(lq, []):
-                    if ln in mapping:
-                        total += abs(hw - mapping[ln])
-                total += 10 * get_error(hw)
-            return total
-        T = 1.0
-        T_min = 1e-3
-        alpha = 0.95
-        best = current.copy()
-        best_cost = cost(current)
-        while T > T_min:
-            for _ in range(100):
-                lq1, lq2 = random.sample(all_logical, 2)
-                new = current.copy()
-                new[lq1], new[lq2] = new[lq2], new[lq1]
-                new_cost = cost(new)
-                if new_cost < best_cost or random.random() < np.exp((best_cost - new_cost) / T):
-                    current = new
-                    if new_cost < best_cost:
-                        best = new
-                        best_cost = new_cost
-            T *= alpha
-        return best
+        # Permutation-array annealing with O(degree) swap deltas on the device hop-distance matrix;
+        # schedule, restarts and seed can be set via constraints['simulated_annealing']
+        problem = MappingProblem(all_logical, logical_neighbors, hw_nodes, self.geometry, qubit_errors)
+        assignment, best_cost, stats = simulated_annealing(problem, constraints.get('simulated_annealing'))
+        logger.debug("_simulated_annealing_mapping: cost=%s, restart costs=%s", best_cost, stats['restart_costs'])
+        return problem.to_mapping(assignment)
 
     def _genetic_algorithm_mapping(self, surface_code_objects: List[SurfaceCodeObject], constraints: Dict[str, Any]) -> Dict[Any, int]:
         """
@@ -481,54 +457,12 @@ class MultiPatchMapper:
                     logical_neighbors[lq] = []
         if len(hw_nodes) < len(all_logical):
             raise ValueError("Not enough hardware qubits for mapping (after constraints)")
-        pop_size = 30
-        generations = 50
-        mutation_rate = 0.2
-        def get_error(q):
-            return qubit_errors.get(int(q), {}).get('readout_error', 0.0)
-        def cost(mapping):
-            total = 0.0
-            for lq, hw in mapping.items():
-                for ln in logical_neighbors.get(lq, []):
-                    if ln in mapping:
-                        total += abs(hw - mapping[ln])
-                total += 10 * get_error(hw)
-            return total
-        # Population: list of dicts
-        population = []
-        for _ in range(pop_size):
-            assignment = random.sample(hw_nodes, len(all_logical))
-            mapping = {lq: hw for lq, hw in zip(all_logical, assignment)}
-            population.append(mapping)
-        for _ in range(generations):
-            # Evaluate
-            scored = sorted(population, key=cost)
-            survivors = scored[:pop_size // 2]
-            # Crossover
-            children = []
-            while len(children) < pop_size - len(survivors):
-                p1, p2 = random.sample(survivors, 2)
-                cut = random.randint(1, len(all_logical) - 1)
-                child_assignment = list(p1.values())[:cut] + list(p2.values())[cut:]
-                # Ensure uniqueness
-                if len(set(child_assignment)) < len(child_assignment):
-                    # Repair: fill with unused
-                    used = set(child_assignment)
-                    unused = [q for q in hw_nodes if q not in used]
-                    for i in range(len(child_assignment)):
-                        if child_assignment.count(child_assignment[i]) > 1:
-                            child_assignment[i] = unused.pop()
-                child = {lq: hw for lq, hw in zip(all_logical, child_assignment)}
-                children.append(child)
-            # Mutation
-            for child in children:
-                if random.random() < mutation_rate:
-                    idx1, idx2 = random.sample(range(len(all_logical)), 2)
-                    lq1, lq2 = all_logical[idx1], all_logical[idx2]
-                    child[lq1], child[lq2] = child[lq2], child[lq1]
-            population = survivors + children
-        best = min(population, key=cost)
-        return best
+        # Vectorized GA over (pop_size, n_hw) slot permutations with order/PMX crossover; population,
+        # generations, mutation rate, crossover, workers and seed via constraints['genetic_algorithm']
+        problem = MappingProblem(all_logical, logical_neighbors, hw_nodes, self.geometry, qubit_errors)
+        assignment, best_cost, stats = genetic_algorithm(problem, constraints.get('genetic_algorithm'))
+        logger.debug("_genetic_algorithm_mapping: cost=%s after %d generations", best_cost, len(stats['best_cost_per_generation']))
+        return problem.to_mapping(assignment)
 
     def _compute_inter_patch_connectivity(self, multi_patch_layout: Dict[int, Any], min_distance: int) -> Dict[str, Any]:
         # Compute inter-patch connectivity based on minimum distance
@@ -541,13 +475,13 @@ class MultiPatchMapper:
             ]
             for i, patch in multi_patch_layout.items()
         }
+        coords = {i: np.array(points, dtype=float).reshape(-1, 2) for i, points in patch_positions.items()}
         for i in patch_positions:
             for j in patch_positions:
-                if i < j:
-                    min_dist = np.min([
-                        np.linalg.norm(np.array(p1) - np.array(p2))
-                        for p1 in patch_positions[i] for p2 in patch_positions[j]
-                    ])
+                if i < j and len(coords[i]) and len(coords[j]):
+                    # All point-pair distances of the two patches at once
+                    diff = coords[i][:, None, :] - coords[j][None, :, :]
+                    min_dist = float(np.sqrt((diff * diff).sum(axis=-1)).min())
                     if min_dist <= min_distance:
                         connectivity[(i, j)] = {'distance': min_dist}
         return connectivity
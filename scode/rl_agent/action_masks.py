@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Rules that only depend on which code qubits are mapped, not on where they are placed
+_PLACEMENT_FREE_RULES = ('mapped', 'code_edge')
+
+
+class ActionMaskBuilder:
+    """
+    Vectorized, cached legal-action masks of shape (patch_count * 3, max_qubits, max_qubits).
+
+    Each action type (SWAP, REWIRE, ASSIGN_GATE) gets a rule deciding which (qubit1, qubit2)
+    pairs of mapped code qubits are legal:
+        mapped:         any two distinct mapped code qubits
+        hw_adjacent:    their hardware qubits are adjacent
+        rewire_target:  qubit2's hardware qubit has a free, non-excluded hardware neighbour
+        code_edge:      the code qubits share an edge in the code's adjacency graph (if it has one)
+        gate_edge:      code_edge and hw_adjacent
+    Masks are rebuilt per patch with NumPy fancy indexing against a precomputed boolean hardware
+    adjacency matrix, and only when that patch's mapped-qubit set (or, for placement-dependent
+    rules, its placement) changed since the previous call. `version` increments on every rebuild.
+    """
+    RULES = ('mapped', 'hw_adjacent', 'rewire_target', 'code_edge', 'gate_edge')
+
+    def __init__(self, connectivity: Dict[int, Iterable[int]], max_qubits: int,
+                 rules: Sequence[str] = ('mapped', 'mapped', 'mapped'), excluded_qubits: Iterable[int] = ()):
+        rules = tuple(rules)
+        if len(rules) != 3 or any(r not in self.RULES for r in rules):
+            raise ValueError(f"Action mask rules must be three of {self.RULES}, got {rules}")
+        self.rules = rules
+        self.max_qubits = max_qubits
+        self.placement_dependent = any(r not in _PLACEMENT_FREE_RULES for r in rules)
+        nodes = {int(q) for q in connectivity} | {int(n) for nbrs in connectivity.values() for n in nbrs}
+        size = max(nodes) + 1 if nodes else 0
+        self.hw_adjacency = np.zeros((size, size), dtype=bool)
+        for q, nbrs in connectivity.items():
+            for n in nbrs:
+                self.hw_adjacency[int(q), int(n)] = True
+                self.hw_adjacency[int(n), int(q)] = True
+        self.hw_available = np.zeros(size, dtype=bool)
+        self.hw_available[sorted(nodes)] = True
+        for q in excluded_qubits:
+            if 0 <= int(q) < size:
+                self.hw_available[int(q)] = False
+        self.masks = np.zeros((0, max_qubits, max_qubits), dtype=np.float32)
+        self.version = 0
+        self._signatures: List[Optional[Tuple[object, object]]] = []
+        self._code_adjacency: Dict[int, Tuple[object, np.ndarray]] = {}
+
+    def get(self, mappings: List[Dict[int, int]], patch_count: int, codes: Optional[List] = None) -> np.ndarray:
+        """
+        Return the masks for the current mappings. The array is owned by the builder and reused
+        between calls; it is only rewritten for patches whose mapping changed.
+        """
+        if self.masks.shape[0] != patch_count * 3:
+            self.masks = np.zeros((patch_count * 3, self.max_qubits, self.max_qubits), dtype=np.float32)
+            self._signatures = [None] * patch_count
+            self.version += 1
+        codes = codes or []
+        for i in range(patch_count):
+            mapping = mappings[i] if i < len(mappings) else {}
+            code = codes[i] if i < len(codes) else None
+            key = self._placement_key(mapping)
+            previous = self._signatures[i]
+            if previous is None or previous[0] is not code or previous[1] != key:
+                self._build_patch(i, mapping, code)
+                self._signatures[i] = (code, key)
+                self.version += 1
+        return self.masks
+
+    def invalidate(self) -> None:
+        """Force every patch to be rebuilt on the next call."""
+        self._signatures = [None] * len(self._signatures)
+
+    def _placement_key(self, mapping: Dict[int, int]):
+        if self.placement_dependent:
+            return tuple(mapping.items())
+        return frozenset(mapping)
+
+    def _build_patch(self, patch_idx: int, mapping: Dict[int, int], code) -> None:
+        block = self.masks[patch_idx * 3:(patch_idx + 1) * 3]
+        block.fill(0.0)
+        sc = np.fromiter((int(q) for q in mapping), dtype=np.intp, count=len(mapping))
+        hw = np.fromiter((int(h) for h in mapping.values()), dtype=np.intp, count=len(mapping))
+        in_range = (sc >= 0) & (sc < self.max_qubits)
+        sc, hw = sc[in_range], hw[in_range]
+        if sc.size < 2:
+            return
+        pairs = sc[:, None] != sc[None, :]
+        cache = {}
+        for a_type, rule in enumerate(self.rules):
+            if rule not in cache:
+                cache[rule] = pairs & self._rule(rule, sc, hw, mapping, code, cache)
+            block[a_type][np.ix_(sc, sc)] = cache[rule]
+
+    def _rule(self, rule: str, sc: np.ndarray, hw: np.ndarray, mapping, code, cache) -> np.ndarray:
+        if rule == 'mapped':
+            return np.ones((sc.size, sc.size), dtype=bool)
+        if rule == 'hw_adjacent':
+            valid = (hw >= 0) & (hw < self.hw_adjacency.shape[0])
+            hw_c = np.where(valid, hw, 0)
+            return self.hw_adjacency[hw_c[:, None], hw_c[None, :]] & valid[:, None] & valid[None, :]
+        if rule == 'rewire_target':
+            free = self.hw_available.copy()
+            used = np.fromiter((int(h) for h in mapping.values()), dtype=np.intp, count=len(mapping))
+            free[used[(used >= 0) & (used < free.size)]] = False
+            valid = (hw >= 0) & (hw < self.hw_adjacency.shape[0])
+            has_free = np.zeros(sc.size, dtype=bool)
+            has_free[valid] = (self.hw_adjacency[hw[valid]] & free[None, :]).any(axis=1)
+            return np.broadcast_to(has_free[None, :], (sc.size, sc.size))
+        if rule == 'code_edge':
+            return self._code_adjacency_for(code)[sc[:, None], sc[None, :]]
+        # gate_edge
+        code_edge = cache.get('code_edge')
+        if code_edge is None:
+            code_edge = self._rule('code_edge', sc, hw, mapping, code, cache)
+        return code_edge & self._rule('hw_adjacent', sc, hw, mapping, code, cache)
+
+    def _code_adjacency_for(self, code) -> np.ndarray:
+        cached = self._code_adjacency.get(id(code))
+        if cached is not None and cached[0] is code:
+            return cached[1]
+        graph = getattr(code, 'adjacency_matrix', None) if code is not None else None
+        # Without a code graph the rule does not constrain the pair
+        adj = np.zeros((self.max_qubits, self.max_qubits), dtype=bool) if graph is not None else \
+            np.ones((self.max_qubits, self.max_qubits), dtype=bool)
+        if graph is not None:
+            for u, v in graph.edges():
+                if 0 <= int(u) < self.max_qubits and 0 <= int(v) < self.max_qubits:
+                    adj[int(u), int(v)] = adj[int(v), int(u)] = True
+        # Keep only the codes of the current episode
+        if len(self._code_adjacency) > 4 * max(1, len(self._signatures)):
+            self._code_adjacency.clear()
+        self._code_adjacency[id(code)] = (code, adj)
+        return adj
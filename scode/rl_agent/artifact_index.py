@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+INDEX_FILENAME = 'artifact_index.json'
+INDEX_VERSION = 1
+KEY_FIELDS = ('provider', 'device', 'code_family', 'layout_type', 'code_distance', 'patch_count', 'curriculum_stage')
+# Secondary index groups: the configuration callers look up (any family/stage), and the same without
+# provider and patch count for callers that do not know them
+CONFIG_FIELDS = ('provider', 'device', 'layout_type', 'code_distance', 'patch_count')
+DEVICE_FIELDS = ('device', 'layout_type', 'code_distance')
+
+# Artifact names written before the index existed, e.g.
+#   ibm_ibm_hummingbird_surface_rotated_d3_patches2_stage1_sb3_ppo_20250610_153447.zip
+#   ibm_ibm_hummingbird_rotated_d3_sb3_ppo_surface_code.zip
+_LEGACY_NAME_RE = re.compile(
+    r'^(?P<provider>[a-z0-9]+)_(?P<device>.+?)_(?:(?P<code_family>surface|qldpc)_)?(?P<layout_type>[a-z]+)'
+    r'_d(?P<code_distance>\d+)(?:_patches(?P<patch_count>\d+))?(?:_stage(?P<curriculum_stage>\d+))?_sb3_ppo.*\.zip$')
+
+
+def artifact_key(provider: str, device: str, code_family: str, layout_type: str, code_distance: int,
+                 patch_count: int, curriculum_stage: int) -> str:
+    return f"{str(provider).lower()}/{str(device).lower()}/{code_family}/{layout_type}/d{int(code_distance)}" \
+           f"/patches{int(patch_count)}/stage{int(curriculum_stage)}"
+
+
+def file_checksum(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_artifact_name(filename: str) -> Optional[Dict[str, Any]]:
+    """Key fields encoded in a (legacy) artifact file name, or None if the name does not match."""
+    match = _LEGACY_NAME_RE.match(os.path.basename(filename))
+    if not match:
+        return None
+    fields = match.groupdict()
+    return {'provider': fields['provider'], 'device': fields['device'],
+            'code_family': fields['code_family'] or 'surface', 'layout_type': fields['layout_type'],
+            'code_distance': int(fields['code_distance']), 'patch_count': int(fields['patch_count'] or 1),
+            'curriculum_stage': int(fields['curriculum_stage'] or 1)}
+
+
+class ArtifactIndex:
+    """
+    Persistent manifest of trained policies in a training-artifacts directory.
+
+    The manifest (artifact_index.json next to the artifacts) maps
+    provider/device/code_family/layout_type/d<distance>/patches<n>/stage<s> to the artifacts saved
+    for that configuration, newest first, with their SHA-256 checksum, size, creation time and
+    training metrics. Lookups with every key field given are a dictionary access, and so are lookups
+    by provider/device/layout/distance/patches (or device/layout/distance) through a secondary index
+    ordered by stage and age; other partial lookups compare fields exactly (so d3 never matches d33).
+    Artifacts found on disk but missing from the manifest (e.g. saved before it existed) are indexed
+    from their file names on a miss, at most once per change of the directory.
+    Use ArtifactIndex.for_directory() to share one loaded manifest per directory and process.
+    """
+    _instances: Dict[str, 'ArtifactIndex'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+        self.path = os.path.join(self.directory, INDEX_FILENAME)
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._groups: Dict[tuple, List[str]] = {}
+        self._mtime: Optional[float] = None
+        self._synced_dir_mtime: Optional[int] = None
+        self._lock = threading.RLock()
+        self._reload()
+
+    @classmethod
+    def for_directory(cls, directory: str) -> 'ArtifactIndex':
+        directory = os.path.abspath(directory)
+        with cls._instances_lock:
+            index = cls._instances.get(directory)
+            if index is None:
+                index = cls._instances[directory] = cls(directory)
+            return index
+
+    def _reload(self) -> None:
+        """(Re)read the manifest if another process or index instance rewrote it."""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self._entries = data.get('entries', {})
+            self._mtime = mtime
+            self._regroup()
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Ignoring unreadable artifact index {self.path}: {e}")
+
+    def _save(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            # NumPy scalars (e.g. rewards in metrics) are stored as plain numbers
+            json.dump({'version': INDEX_VERSION, 'entries': self._entries}, f, indent=2,
+                      default=lambda o: o.item() if hasattr(o, 'item') else str(o))
+        os.replace(tmp_path, self.path)
+        self._mtime = os.path.getmtime(self.path)
+        self._regroup()
+
+    @staticmethod
+    def _group_key(fields: Dict[str, Any], names: tuple) -> tuple:
+        return (names,) + tuple(str(fields[k]).lower() if k in ('provider', 'device') else fields[k] for k in names)
+
+    def _regroup(self) -> None:
+        """Rebuild the secondary index: group -> manifest keys, highest stage then newest first."""
+        groups: Dict[tuple, List[str]] = {}
+        for key, versions in self._entries.items():
+            if versions:
+                for names in (CONFIG_FIELDS, DEVICE_FIELDS):
+                    groups.setdefault(self._group_key(versions[0], names), []).append(key)
+        for keys in groups.values():
+            keys.sort(key=lambda k: (self._entries[k][0]['curriculum_stage'], self._entries[k][0]['created']), reverse=True)
+        self._groups = groups
+
+    def _dir_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def register(self, path: str, provider: str, device: str, layout_type: str, code_distance: int,
+                 patch_count: int = 1, curriculum_stage: int = 1, code_family: str = 'surface',
+                 metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Record a saved artifact (call right after model.save).
+        Args:
+            path: artifact path; stored relative to the index directory when it lies inside it
+            provider, device, layout_type, code_distance, patch_count, curriculum_stage, code_family: key fields
+            metrics: optional training metrics (timesteps, elapsed time, final reward/LER, ...)
+        Returns:
+            The stored entry
+        """
+        key = artifact_key(provider, device, code_family, layout_type, code_distance, patch_count, curriculum_stage)
+        path = os.path.abspath(path)
+        stored_path = os.path.relpath(path, self.directory) if path.startswith(self.directory + os.sep) else path
+        entry = {'key': key, 'path': stored_path, 'provider': str(provider).lower(), 'device': str(device).lower(),
+                 'code_family': code_family, 'layout_type': layout_type, 'code_distance': int(code_distance),
+                 'patch_count': int(patch_count), 'curriculum_stage': int(curriculum_stage),
+                 'sha256': file_checksum(path), 'size': os.path.getsize(path),
+                 'created': datetime.now().isoformat(timespec='seconds'), 'metrics': dict(metrics or {})}
+        with self._lock:
+            self._reload()
+            versions = [e for e in self._entries.get(key, []) if e['path'] != stored_path]
+            self._entries[key] = [entry] + versions
+            self._save()
+        return entry
+
+    def _resolve(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(entry, path=os.path.join(self.directory, entry['path']))
+
+    def lookup(self, provider: str = None, device: str = None, layout_type: str = None, code_distance: int = None,
+               patch_count: int = None, curriculum_stage: int = None, code_family: str = None,
+               verify: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Newest artifact matching the given fields (None for "any"); the highest stage wins when the
+        stage is not given. Returns the entry with an absolute 'path', or None.
+        Args:
+            verify: recompute the checksum and skip artifacts whose file changed or disappeared
+        """
+        for attempt in range(2):
+            for entry in self._candidates(provider, device, layout_type, code_distance, patch_count,
+                                          curriculum_stage, code_family):
+                entry = self._resolve(entry)
+                if not os.path.exists(entry['path']):
+                    continue
+                if verify and file_checksum(entry['path']) != entry['sha256']:
+                    print(f"[WARNING] Checksum mismatch for {entry['path']}; skipping.")
+                    continue
+                return entry
+            if attempt == 0 and not self._sync_if_changed():
+                break
+        return None
+
+    def _candidates(self, provider, device, layout_type, code_distance, patch_count, curriculum_stage, code_family):
+        with self._lock:
+            self._reload()
+            fields = dict(zip(KEY_FIELDS, (provider, device, code_family, layout_type, code_distance,
+                                           patch_count, curriculum_stage)))
+            if all(v is not None for v in fields.values()):
+                return list(self._entries.get(artifact_key(**fields), []))
+            wanted = {k: (str(v).lower() if k in ('provider', 'device') else v)
+                      for k, v in fields.items() if v is not None}
+            for names in (CONFIG_FIELDS, DEVICE_FIELDS):
+                if all(fields[k] is not None for k in names):
+                    keys = self._groups.get(self._group_key(fields, names), [])
+                    matches = [self._entries[k] for k in keys]
+                    break
+            else:
+                matches = sorted((versions for versions in self._entries.values() if versions),
+                                 key=lambda versions: (versions[0]['curriculum_stage'], versions[0]['created']), reverse=True)
+            matches = [versions for versions in matches if all(versions[0][k] == v for k, v in wanted.items())]
+            return [entry for versions in matches for entry in versions]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """All indexed artifacts (absolute paths), newest version of each configuration first."""
+        with self._lock:
+            self._reload()
+            return [self._resolve(e) for versions in self._entries.values() for e in versions]
+
+    def _sync_if_changed(self) -> int:
+        """sync() on a lookup miss, skipped while the directory is unchanged since the last sync."""
+        with self._lock:
+            if self._dir_mtime() == self._synced_dir_mtime:
+                return 0
+            return self.sync()
+
+    def sync(self) -> int:
+        """Index .zip artifacts in the directory that the manifest does not know yet; returns how many."""
+        if not os.path.isdir(self.directory):
+            return 0
+        with self._lock:
+            self._reload()
+            dir_mtime = self._dir_mtime()
+            known = {e['path'] for versions in self._entries.values() for e in versions}
+            unknown = [(fname, fields) for fname in os.listdir(self.directory)
+                       if fname.endswith('.zip') and fname not in known
+                       for fields in (parse_artifact_name(fname),) if fields is not None]
+            added = 0
+            for fname, fields in sorted(unknown, key=lambda item: os.path.getmtime(os.path.join(self.directory, item[0]))):
+                key = artifact_key(**fields)
+                full_path = os.path.join(self.directory, fname)
+                entry = dict(fields, key=key, path=fname, sha256=file_checksum(full_path),
+                             size=os.path.getsize(full_path),
+                             created=datetime.fromtimestamp(os.path.getmtime(full_path)).isoformat(timespec='seconds'),
+                             metrics={})
+                self._entries[key] = [entry] + self._entries.get(key, [])
+                added += 1
+            if added:
+                self._save()
+            # Taken after the manifest write when it happened, so that write does not trigger another sync
+            self._synced_dir_mtime = self._dir_mtime() if added else dir_mtime
+            return added
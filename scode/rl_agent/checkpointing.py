@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import glob
+import os
+import re
+from typing import Optional
+
+from stable_baselines3.common.callbacks import BaseCallback
+
+_CHECKPOINT_RE = re.compile(r'_(\d+)_steps\.zip$')
+
+
+def checkpoint_steps(path: str) -> int:
+    """Timestep count encoded in a checkpoint file name (-1 if it is not a checkpoint)."""
+    match = _CHECKPOINT_RE.search(os.path.basename(path))
+    return int(match.group(1)) if match else -1
+
+
+def find_latest_checkpoint(directory: str) -> Optional[str]:
+    """The checkpoint with the highest timestep count in `directory`, or None."""
+    candidates = [p for p in glob.glob(os.path.join(directory, '*_steps.zip')) if checkpoint_steps(p) >= 0]
+    return max(candidates, key=checkpoint_steps) if candidates else None
+
+
+def resolve_resume_checkpoint(resume_from: Optional[str], directory: str) -> Optional[str]:
+    """
+    Resolve agent.resume_from_checkpoint.
+    Args:
+        resume_from: None/'' (start fresh), 'latest' (newest checkpoint in `directory`) or a path
+        directory: checkpoint directory of this training configuration
+    Raises:
+        FileNotFoundError if an explicit path does not exist
+    """
+    if not resume_from:
+        return None
+    if str(resume_from).lower() == 'latest':
+        return find_latest_checkpoint(directory)
+    if not os.path.exists(resume_from):
+        raise FileNotFoundError(f"resume_from_checkpoint not found: {resume_from}")
+    return resume_from
+
+
+class PeriodicCheckpointCallback(BaseCallback):
+    """
+    Save the model every `save_interval` timesteps as <name_prefix>_<timesteps>_steps.zip.
+
+    Checkpoints are written to a temporary file and renamed into place, so a crash mid-save never
+    leaves a truncated checkpoint behind; only the newest `keep_last` checkpoints are kept.
+    """
+
+    def __init__(self, save_dir: str, save_interval: int, name_prefix: str = 'ppo', keep_last: int = 3, verbose: int = 0):
+        super().__init__(verbose)
+        self.save_dir = save_dir
+        self.save_interval = max(1, int(save_interval))
+        self.name_prefix = name_prefix
+        self.keep_last = max(1, int(keep_last))
+        self.last_saved = None
+        self._last_save_step = 0
+
+    def _on_training_start(self) -> None:
+        os.makedirs(self.save_dir, exist_ok=True)
+        # Resumed runs continue counting from the checkpoint
+        self._last_save_step = self.model.num_timesteps
+
+    def _on_step(self) -> bool:
+        if self.model.num_timesteps - self._last_save_step >= self.save_interval:
+            self.save()
+        return True
+
+    def save(self) -> str:
+        path = os.path.join(self.save_dir, f"{self.name_prefix}_{self.model.num_timesteps}_steps.zip")
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            self.model.save(f)
+        os.replace(tmp_path, path)
+        self._last_save_step = self.model.num_timesteps
+        self.last_saved = path
+        if self.verbose:
+            print(f"[INFO] Saved checkpoint {path}")
+        checkpoints = sorted(glob.glob(os.path.join(self.save_dir, f"{self.name_prefix}_*_steps.zip")), key=checkpoint_steps)
+        for old in checkpoints[:-self.keep_last]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+        return path
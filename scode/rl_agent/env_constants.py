@@ -7,3 +7,57 @@
 MAX_PATCHES = 3      # Maximum number of patches supported by curriculum
 MAX_QUBITS = 65      # Upper bound for hardware qubits across supported devices
 NUM_FEATURES = 5     # Node feature dimensions used by observation space
+
+OBSERVATION_FORMATS = ('dense', 'edge_list')
+
+
+def resolve_observation_dims(config, hardware_graph):
+    """
+    Observation and action-space sizes for the selected device and config.
+
+    Reads multi_patch_rl_agent.environment.observation:
+        max_qubits:  int or 'auto' (default): largest hardware qubit index + 1 of the device
+        max_patches: int or 'auto' (default): largest patch_count of the environment and curriculum
+        format:      'dense' (default) adjacency/action-mask matrices, or 'edge_list' for a padded
+                     edge index and per-qubit masks that grow linearly with the device size
+        max_edges:   int or 'auto' (default, the device's directed edge count): padded length of
+                     the edge index in 'edge_list' format
+    Returns:
+        dict with 'max_qubits', 'max_patches', 'num_features', 'format' and 'max_edges' (None for auto)
+    """
+    config = config or {}
+    hardware_graph = hardware_graph or {}
+    rl_cfg = config.get('multi_patch_rl_agent', {}) or {}
+    env_cfg = rl_cfg.get('environment', {}) or {}
+    obs_cfg = env_cfg.get('observation', {}) or {}
+
+    connectivity = hardware_graph.get('qubit_connectivity', {}) or {}
+    qubit_ids = {int(q) for q in connectivity} | {int(n) for nbrs in connectivity.values() for n in nbrs}
+    max_qubits = obs_cfg.get('max_qubits', 'auto')
+    if max_qubits in (None, 'auto'):
+        max_qubits = max(int(hardware_graph.get('max_qubits') or 0), max(qubit_ids) + 1 if qubit_ids else 0) or MAX_QUBITS
+    elif qubit_ids and max(qubit_ids) >= int(max_qubits):
+        print(f"[WARNING] observation.max_qubits={max_qubits} is smaller than the device "
+              f"({max(qubit_ids) + 1} qubits); higher-index qubits are not observable.")
+
+    max_patches = obs_cfg.get('max_patches', 'auto')
+    if max_patches in (None, 'auto'):
+        counts = [env_cfg.get('patch_count', 1)]
+        for curriculum in (config.get('curriculum_learning'), rl_cfg.get('curriculum_learning')):
+            for stage in (curriculum or {}).get('stages', []) or []:
+                counts.append(stage.get('patch_count', 1))
+        curriculum = config.get('curriculum') or {}
+        counts.extend(phase.get('patch_count', 1) for phase in curriculum.get('phases', []) or [])
+        max_patches = max(int(c) for c in counts if c is not None)
+
+    fmt = obs_cfg.get('format', 'dense')
+    if fmt not in OBSERVATION_FORMATS:
+        raise ValueError(f"Unknown observation format '{fmt}'. Use one of: {list(OBSERVATION_FORMATS)}")
+    max_edges = obs_cfg.get('max_edges', 'auto')
+    return {
+        'max_qubits': int(max_qubits),
+        'max_patches': max(1, int(max_patches)),
+        'num_features': NUM_FEATURES,
+        'format': fmt,
+        'max_edges': None if max_edges in (None, 'auto') else int(max_edges),
+    }
@@ -7,16 +7,18 @@ import numpy as np
 import networkx as nx
 from typing import Dict, Any, List, Tuple, Optional, Union
 import copy
-import random
 
 from scode.heuristic_layer.surface_code_object import SurfaceCodeObject
 
 from scode.rl_agent.reward_engine import MultiPatchRewardEngine
+from scode.rl_agent.action_masks import ActionMaskBuilder
+from scode.rl_agent.ler_evaluator import LEREvaluator
+from scode.rl_agent.mapping_metrics import MappingMetrics
+from scode.rl_agent.observation_builder import ObservationBuilder
 from scode.utils.decoder_interface import DecoderInterface
+from scode.utils.trace import configure_trace
 
-MAX_PATCHES = 3  # Set to the maximum number of patches you will use in curriculum
-MAX_QUBITS = 65  # Set to the maximum number of qubits for your hardware
-NUM_FEATURES = 5
+from scode.rl_agent.env_constants import resolve_observation_dims
 
 class SurfaceCodeEnvironment(gym.Env):
     """
@@ -25,6 +27,11 @@ class SurfaceCodeEnvironment(gym.Env):
     for surface codes on specific hardware architectures.
     """
     metadata = {'render.modes': ['human', 'rgb_array']}
+    # Mask rule per action type (SWAP, REWIRE, ASSIGN_GATE), see ActionMaskBuilder
+    ACTION_MASK_RULES = {
+        'mapped': ('mapped', 'mapped', 'mapped'),
+        'connectivity': ('mapped', 'rewire_target', 'gate_edge'),
+    }
 
     def __init__(self, config: Dict[str, Any], hardware_graph: Dict[str, Any], 
                  surface_code_generator=None, reward_engine=None, device=None, logger=None):
@@ -48,6 +55,9 @@ class SurfaceCodeEnvironment(gym.Env):
         self.device = device
         self.logger = logger
         
+        # Level-gated per-step tracing (environment.trace); replaces per-step stdout prints
+        self.trace = configure_trace(config.get('multi_patch_rl_agent', {}).get('environment', {}).get('trace'))
+        
         # Use MultiPatchRewardEngine for multi-patch RL
         print(f"[DEBUG][ENV INIT] reward_function={config.get('reward_function', {})}")
         self.reward_engine = reward_engine if reward_engine else MultiPatchRewardEngine(config)
@@ -79,6 +89,24 @@ class SurfaceCodeEnvironment(gym.Env):
         
         # Setup hardware graph
         self._setup_hardware_graph()
+        # Observation/action-space sizes derived from the device and config
+        self.obs_dims = resolve_observation_dims(config, hardware_graph)
+        self.max_qubits = self.obs_dims['max_qubits']
+        self.max_patches = self.obs_dims['max_patches']
+        if self.patch_count > self.max_patches:
+            raise ValueError(f"patch_count={self.patch_count} exceeds observation.max_patches={self.max_patches}")
+        # Incrementally updated mapping metrics (preserved edges, qubit usage, error sums, components)
+        self.metrics = MappingMetrics(self.hw_graph)
+        # Precomputed hardware tensors and reusable observation buffers
+        self.observation_builder = ObservationBuilder(self.hw_graph, self.max_patches, self.max_qubits,
+                                                      self.obs_dims['num_features'], self.obs_dims['format'],
+                                                      self.obs_dims['max_edges'])
+        # Cached action masks; 'connectivity' mode tightens REWIRE/ASSIGN_GATE to hardware-feasible pairs
+        mask_mode = self.surface_code_config.get('action_mask_mode', 'mapped')
+        if mask_mode not in self.ACTION_MASK_RULES:
+            raise ValueError(f"Unknown action_mask_mode '{mask_mode}'. Use one of: {list(self.ACTION_MASK_RULES)}")
+        self.action_mask_builder = ActionMaskBuilder(self.qubit_connectivity, self.max_qubits,
+                                                     self.ACTION_MASK_RULES[mask_mode], self.excluded_qubits)
         
         # Setup action and observation spaces
         self._setup_spaces()
@@ -108,6 +136,13 @@ class SurfaceCodeEnvironment(gym.Env):
         self.patch_cfg = config.get('multi_patch', {})
         self.reward_cfg = config.get('reward_engine', config.get('reward_function', {}))
         self.device_cfg = hardware_graph
+        # Limits of the process-wide cache of compiled LER circuits, matching graphs and samplers
+        ler_cache_cfg = self.env_cfg.get('ler_cache', {}) or {}
+        if ler_cache_cfg:
+            DecoderInterface.configure_cache(max_entries=ler_cache_cfg.get('max_entries'),
+                                             max_bytes=ler_cache_cfg.get('max_bytes'))
+        # LER on every step (legacy) or amortized every N steps / at episode end, optionally in a process pool
+        self.ler_evaluator = LEREvaluator.from_config(self.env_cfg)
 
     def _setup_hardware_graph(self):
         """Setup hardware graph from device description."""
@@ -135,49 +170,39 @@ class SurfaceCodeEnvironment(gym.Env):
         # Hardware constraints
         excluded_qubits = self.config.get('advanced_constraints', {}).get('exclude_qubits', [])
         self.excluded_qubits = set(excluded_qubits)
+        # Device noise for LER estimation: per-qubit readout errors and per-gate error rates
+        self.noise_model = {
+            'p': 0.001,
+            'qubit_properties': qubit_properties,
+            'gate_error_rates': self.hardware_graph.get('gate_error_rates', {}),
+        }
         # Debug: print hardware graph info
         print(f"[DEBUG] Hardware graph nodes: {list(self.hw_graph.nodes())}")
         print(f"[DEBUG] Number of hardware qubits: {self.num_hw_qubits}")
 
     def _setup_spaces(self):
-        """Setup the action and observation spaces."""
-        # Use fixed max values for SB3 compatibility
+        """Setup the action and observation spaces, sized from the device and config."""
         self.action_space = spaces.Box(
             low=np.array([0, 0, 0, 0, 0, 0], dtype=np.float32),
             high=np.array([
-                MAX_PATCHES-1,  # patch_idx
-                2,                  # action_type
-                MAX_QUBITS-1,       # qubit1
-                MAX_QUBITS-1,       # qubit2
-                MAX_QUBITS-1,       # param1
-                1                   # param2 (e.g., error scale)
+                self.max_patches-1,  # patch_idx
+                2,                   # action_type
+                self.max_qubits-1,   # qubit1
+                self.max_qubits-1,   # qubit2
+                self.max_qubits-1,   # param1
+                1                    # param2 (e.g., error scale)
             ], dtype=np.float32),
             dtype=np.float32
         )
-        self.observation_space = spaces.Dict({
-            'node_features': spaces.Box(
-                low=0, high=1, 
-                shape=(MAX_PATCHES * MAX_QUBITS, NUM_FEATURES), 
-                dtype=np.float32
-            ),
-            'adjacency': spaces.Box(
-                low=0, high=1, 
-                shape=(MAX_PATCHES * MAX_QUBITS, MAX_QUBITS), 
-                dtype=np.float32
-            ),
-            'action_mask': spaces.Box(
-                low=0, high=1,
-                shape=(MAX_PATCHES * 3, MAX_QUBITS, MAX_QUBITS),
-                dtype=np.float32
-            )
-        })
+        self.observation_space = self.observation_builder.observation_space()
 
     def reset(self, seed=None, options=None):
         """
         Reset the environment to start a new episode.
         
         Args:
-            seed: Optional random seed
+            seed: Optional random seed; seeds the environment's own RNG (self.np_random), so the
+                initial mappings of an episode sequence are reproducible
             options: Optional configuration overrides
             
         Returns:
@@ -194,7 +219,7 @@ class SurfaceCodeEnvironment(gym.Env):
             # Clamp current_phase to valid range
             self.current_phase = min(self.current_phase, len(self.phases) - 1)
             stage = self.phases[self.current_phase]
-            print(f"[DEBUG] Curriculum: current stage={stage}")
+            self.trace.debug('env', 'Curriculum: current stage=%s', stage)
             if 'patch_count' in stage:
                 self.patch_count = stage['patch_count']
         else:
@@ -213,7 +238,7 @@ class SurfaceCodeEnvironment(gym.Env):
             if patch_count_from_config is None:
                 patch_count_from_config = 1
             self.patch_count = patch_count_from_config
-            print(f"[DEBUG] Curriculum disabled. Using patch_count={self.patch_count} from config.")
+            self.trace.debug('env', 'Curriculum disabled. Using patch_count=%s from config.', self.patch_count)
         
         # Generate new surface code layouts for each patch
         self.surface_codes = []
@@ -249,6 +274,8 @@ class SurfaceCodeEnvironment(gym.Env):
         for code in self.surface_codes:
             mapping = self._initialize_mapping_multi_patch(code)
             self.current_mappings.append(mapping)
+        self.metrics.reset(self.surface_codes, self.current_mappings)
+        self.observation_builder.reset(self.surface_codes, self.current_mappings, self.patch_count)
         
         # Reset counters
         self.episode_step_count = 0
@@ -258,10 +285,10 @@ class SurfaceCodeEnvironment(gym.Env):
         observation = self._get_observation_multi_patch()
         self.action_masks = self._get_action_masks_multi_patch()
         
-        # Debug: print patch_count and mapping/surface_codes lengths
-        print(f"[DEBUG] SurfaceCodeEnvironment.reset: patch_count={self.patch_count}, len(current_mappings)={len(self.current_mappings)}, len(surface_codes)={len(self.surface_codes)}")
+        self.trace.debug('env', 'SurfaceCodeEnvironment.reset: patch_count=%s, len(current_mappings)=%s, len(surface_codes)=%s',
+                         self.patch_count, len(self.current_mappings), len(self.surface_codes))
         for i, mapping in enumerate(self.current_mappings):
-            print(f"[DEBUG] Initial mapping for patch {i}: {mapping}")
+            self.trace.debug('env', 'Initial mapping for patch %s: %s', i, mapping)
         # Return observation and action mask info
         return observation, {}
 
@@ -279,7 +306,8 @@ class SurfaceCodeEnvironment(gym.Env):
             if self.verbose:
                 print(f"Warning: Not enough available hardware qubits ({len(available_hw_qubits)}) for surface code ({len(sc_qubits)})")
             sc_qubits = sc_qubits[:len(available_hw_qubits)]
-        random.shuffle(available_hw_qubits)
+        # Per-environment RNG, seeded by reset(seed=...)
+        self.np_random.shuffle(available_hw_qubits)
         mapping = {sc_q: hw_q for sc_q, hw_q in zip(sc_qubits, available_hw_qubits[:len(sc_qubits)])}
         # Assert no overlap in mapping
         if len(set(mapping.values()).intersection(used_hw_qubits)) > 0:
@@ -307,20 +335,23 @@ class SurfaceCodeEnvironment(gym.Env):
         qubit2 = int(action[3])
         param1 = int(action[4])
         param2 = float(action[5])
-        # Apply the action
+        # Apply the action; SWAP and REWIRE only remap qubit1/qubit2, so the metrics are delta-updated
+        metrics = self._sync_metrics()
+        mapping = self.current_mappings[patch_idx]
+        previous_hw = {q: mapping[q] for q in (qubit1, qubit2) if q in mapping}
         action_result = False
         if action_type == 0:  # SWAP
-            action_result = self._apply_swap_multi_patch(self.current_mappings[patch_idx], qubit1, qubit2)
+            action_result = metrics.apply(patch_idx, (qubit1, qubit2),
+                                          lambda: self._apply_swap_multi_patch(mapping, qubit1, qubit2))
         elif action_type == 1:  # REWIRE
-            action_result = self._apply_rewire_multi_patch(self.current_mappings[patch_idx], qubit1, qubit2, param1)
+            action_result = metrics.apply(patch_idx, (qubit1, qubit2),
+                                          lambda: self._apply_rewire_multi_patch(mapping, qubit1, qubit2, param1))
         elif action_type == 2:  # ASSIGN_GATE
-            action_result = self._apply_assign_gate_multi_patch(patch_idx, self.current_mappings[patch_idx], qubit1, qubit2, param1, param2)
+            action_result = self._apply_assign_gate_multi_patch(patch_idx, mapping, qubit1, qubit2, param1, param2)
+        if self.observation_builder.in_sync(self.surface_codes, self.current_mappings):
+            self.observation_builder.update(patch_idx, (qubit1, qubit2), previous_hw)
         # Check for overlap after action
-        all_hw = []
-        for mapping in self.current_mappings:
-            all_hw.extend(list(mapping.values()))
-        has_overlap = len(set(all_hw)) < len(all_hw)
-        if has_overlap:
+        if metrics.has_overlap:
             # Prohibit further steps, end episode with high penalty
             observation = self._get_observation_multi_patch()
             reward = -100.0  # Large negative penalty
@@ -334,8 +365,7 @@ class SurfaceCodeEnvironment(gym.Env):
                 'reward_breakdown': {'overlap_penalty': -100.0},
                 'has_overlap': True
             }
-            if self.verbose:
-                print(f"[ENV DEBUG] Step {self.episode_step_count}: Overlap detected, terminating episode with penalty.")
+            self.trace.debug('env', 'Step %s: Overlap detected, terminating episode with penalty.', self.episode_step_count)
             return observation, reward, done, False, info
         # Get the new observation
         observation = self._get_observation_multi_patch()
@@ -363,26 +393,31 @@ class SurfaceCodeEnvironment(gym.Env):
         }
         # --- Add LER/logical_error_rate to info dict ---
         ler = None
-        try:
-            # Use DecoderInterface for LER
-            layout = self.surface_codes[patch_idx]
-            mapping = self.current_mappings[patch_idx]
-            logical_ops = getattr(layout, 'logical_operators', {})
-            print(f'[DEBUG] LER calculation: logical_operators={logical_ops}, mapping={mapping}')
-            if not logical_ops or (not logical_ops.get('Z') and not logical_ops.get('X')):
-                print('[WARNING] No logical operators defined in surface code object! LER may be meaningless.')
-            noise_model = self.error_profile if hasattr(self, 'error_profile') else {'p': 0.001}
-            ler = DecoderInterface.estimate_logical_error_rate(layout, mapping, noise_model, num_trials=getattr(self, 'ler_num_trials', 100), error_prob=getattr(self, 'ler_noise_prob', 0.001))
-        except Exception as e:
-            if self.verbose:
-                print(f"[LER ERROR] {e}")
-            ler = None
-        if ler is not None:
-            info['ler'] = ler
-            info['logical_error_rate'] = ler
-        # Debug print for reward and LER
-        if self.verbose:
-            print(f"[ENV DEBUG] Step {self.episode_step_count}: reward={reward:.4f}, LER={ler}")
+        if self.ler_evaluator.amortized:
+            # Evaluated every N steps / at episode end; results arrive on a later step
+            noise_model = self.error_profile if hasattr(self, 'error_profile') else self.noise_model
+            info.update(self.ler_evaluator.after_step(
+                self.episode_step_count, done, self.surface_codes, self.current_mappings, noise_model,
+                num_trials=getattr(self, 'ler_num_trials', None), error_prob=getattr(self, 'ler_noise_prob', None)))
+            ler = info.get('ler')
+        else:
+            try:
+                # Use DecoderInterface for LER
+                layout = self.surface_codes[patch_idx]
+                mapping = self.current_mappings[patch_idx]
+                logical_ops = getattr(layout, 'logical_operators', {})
+                self.trace.debug('env', 'LER calculation: logical_operators=%s, mapping=%s', logical_ops, mapping)
+                if not logical_ops or (not logical_ops.get('Z') and not logical_ops.get('X')):
+                    self.trace.warning('env', 'No logical operators defined in surface code object! LER may be meaningless.')
+                noise_model = self.error_profile if hasattr(self, 'error_profile') else self.noise_model
+                ler = DecoderInterface.estimate_logical_error_rate(layout, mapping, noise_model, num_trials=getattr(self, 'ler_num_trials', 100), error_prob=getattr(self, 'ler_noise_prob', 0.001))
+            except Exception as e:
+                self.trace.error('env', 'LER calculation failed: %s', e)
+                ler = None
+            if ler is not None:
+                info['ler'] = ler
+                info['logical_error_rate'] = ler
+        self.trace.debug('env', 'Step %s: reward=%.4f, LER=%s', self.episode_step_count, reward, ler)
         # Record success if done
         if done:
             self.episode_rewards.append(reward)
@@ -445,99 +480,32 @@ class SurfaceCodeEnvironment(gym.Env):
         return True
 
     def _get_observation_multi_patch(self):
-        """Generate the current observation."""
-        # Use fixed max values for SB3 compatibility
-        max_qubits = MAX_QUBITS
-        patch_count = self.patch_count
-        node_features = np.zeros((patch_count, max_qubits, NUM_FEATURES), dtype=np.float32)
-        adjacency = np.zeros((patch_count, max_qubits, max_qubits), dtype=np.float32)
-        # Build features/adjacency from hardware graph and current SC->HW mappings
-        for i, code in enumerate(self.surface_codes):
-            mapping_i = self.current_mappings[i] if i < len(self.current_mappings) else {}
-            # Feature[0]: hardware readout error_rate per HW node
-            for hw_q in self.hw_graph.nodes():
-                if not (0 <= int(hw_q) < max_qubits):
-                    continue
-                try:
-                    err = self.hw_graph.nodes[int(hw_q)].get('error_rate', 0.0)
-                except Exception:
-                    err = 0.0
-                node_features[i, int(hw_q), 0] = float(err)
-            # One-hot roles per mapped SC qubit
-            for sc_q, hw_q in mapping_i.items():
-                if not (0 <= int(hw_q) < max_qubits):
-                    continue
-                sc_type = ''
-                try:
-                    sc_type = code.qubit_layout.get(sc_q, {}).get('type', '')
-                except Exception:
-                    sc_type = ''
-                role_idx = 4
-                if sc_type == 'data':
-                    role_idx = 1
-                elif sc_type == 'ancilla_X':
-                    role_idx = 2
-                elif sc_type == 'ancilla_Z':
-                    role_idx = 3
-                node_features[i, int(hw_q), role_idx] = 1.0
-            # Hardware adjacency
-            for u, v in self.hw_graph.edges():
-                if 0 <= int(u) < max_qubits and 0 <= int(v) < max_qubits:
-                    adjacency[i, int(u), int(v)] = 1.0
-                    adjacency[i, int(v), int(u)] = 1.0
+        """
+        Generate the current observation. The returned arrays are reusable buffers owned by the
+        observation builder and are overwritten by the next step of the same episode
+        (reset() switches to new buffers).
+        """
+        builder = self.observation_builder
+        if not builder.in_sync(self.surface_codes, self.current_mappings):
+            builder.reset(self.surface_codes, self.current_mappings, self.patch_count)
         action_masks = self._get_action_masks_multi_patch()
-        # Flatten patch dimension
-        node_features_flat = node_features.reshape(patch_count * max_qubits, NUM_FEATURES)
-        adjacency_flat = adjacency.reshape(patch_count * max_qubits, max_qubits)
-        # Pad to max shape
-        node_features_padded = np.zeros((MAX_PATCHES * MAX_QUBITS, NUM_FEATURES), dtype=np.float32)
-        adjacency_padded = np.zeros((MAX_PATCHES * MAX_QUBITS, MAX_QUBITS), dtype=np.float32)
-        node_features_padded[:node_features_flat.shape[0], :node_features_flat.shape[1]] = node_features_flat
-        adjacency_padded[:adjacency_flat.shape[0], :adjacency_flat.shape[1]] = adjacency_flat
-        action_masks_padded = np.zeros((MAX_PATCHES * 3, MAX_QUBITS, MAX_QUBITS), dtype=np.float32)
-        action_masks_padded[:action_masks.shape[0], :action_masks.shape[1], :action_masks.shape[2]] = action_masks
-        return {
-            'node_features': node_features_padded,
-            'adjacency': adjacency_padded,
-            'action_mask': action_masks_padded
-        }
+        return builder.build(action_masks, version=self.action_mask_builder.version)
 
     def _get_action_masks_multi_patch(self):
-        max_qubits = MAX_QUBITS
-        patch_count = self.patch_count
-        action_masks = np.zeros((patch_count, 3, max_qubits, max_qubits), dtype=np.float32)
-        for i, mapping in enumerate(self.current_mappings):
-            sc_qubits = list(mapping.keys())
-            for a_type in range(3):
-                for q1 in sc_qubits:
-                    for q2 in sc_qubits:
-                        if q1 == q2:
-                            continue
-                        # Bounds guard to avoid out-of-range indices
-                        if not (0 <= int(q1) < max_qubits and 0 <= int(q2) < max_qubits):
-                            continue
-                        action_masks[i, a_type, int(q1), int(q2)] = 1.0
-        # Flatten patch dimension
-        action_masks_flat = action_masks.reshape(patch_count * 3, max_qubits, max_qubits)
-        return action_masks_flat
+        """Legal-action masks, shape (patch_count * 3, max_qubits, max_qubits); cached between steps."""
+        return self.action_mask_builder.get(self.current_mappings, self.patch_count, self.surface_codes)
 
     def _calculate_connectivity_score(self) -> float:
         """Calculate how well the surface code connectivity is preserved in the hardware mapping."""
-        # Count preserved edges
-        preserved_edges = 0
-        total_edges = 0
-        
-        for sc_q1, sc_q2 in self.surface_codes[0].adjacency_matrix.edges():
-            total_edges += 1
-            
-            if sc_q1 in self.current_mappings[0] and sc_q2 in self.current_mappings[0]:
-                hw_q1 = self.current_mappings[0][sc_q1]
-                hw_q2 = self.current_mappings[0][sc_q2]
-                
-                if self.hw_graph.has_edge(hw_q1, hw_q2):
-                    preserved_edges += 1
-        
-        return preserved_edges / max(1, total_edges)
+        return self._sync_metrics().connectivity_score(0)
+
+    def _sync_metrics(self) -> MappingMetrics:
+        """Return the metric engine, rebuilding it if the codes or mapping lists were replaced."""
+        if self.metrics.mappings is not self.current_mappings or \
+           len(self.metrics.codes) != len(self.surface_codes) or \
+           any(a is not b for a, b in zip(self.metrics.codes, self.surface_codes)):
+            self.metrics.reset(self.surface_codes, self.current_mappings)
+        return self.metrics
 
     def _is_episode_done_multi_patch(self) -> bool:
         """Check if the episode is complete."""
@@ -627,13 +595,16 @@ class SurfaceCodeEnvironment(gym.Env):
         else:
             raise ValueError(f"Unsupported render mode: {mode}")
 
+    def close(self):
+        """Shut down the background LER evaluation pool, if any."""
+        self.ler_evaluator.close()
+        super().close()
+
     def _gather_mapping_info_multi_patch(self):
         info = {'is_valid': True, 'has_overlap': False, 'connectivity_score': 0, 'adjacency_score': 0, 'inter_patch_distance': 0, 'resource_utilization': 0}
-        all_hw = []
-        for mapping in self.current_mappings:
-            all_hw.extend(list(mapping.values()))
-        print(f"[DEBUG] _gather_mapping_info_multi_patch: current_mappings={self.current_mappings}")
-        if len(set(all_hw)) < len(all_hw):
+        metrics = self._sync_metrics()
+        self.trace.debug('env', '_gather_mapping_info_multi_patch: current_mappings=%s', self.current_mappings)
+        if metrics.has_overlap:
             raise RuntimeError("Illegal mapping: Physical qubit overlap detected across patches. Training/inference halted.")
             info['has_overlap'] = True
             info['is_valid'] = False
@@ -655,46 +626,13 @@ class SurfaceCodeEnvironment(gym.Env):
         except Exception:
             info['resource_utilization'] = 0.0
         # Advanced metrics
-        error_rates = []
-        for mapping in self.current_mappings:
-            for hw_q in mapping.values():
-                try:
-                    error_rates.append(self.hw_graph.nodes[hw_q].get('error_rate', 0.0))
-                except Exception:
-                    error_rates.append(0.0)
-        info['avg_error_rate'] = float(np.mean(error_rates)) if error_rates else 0.0
-        logical_scores = []
-        for i, code in enumerate(self.surface_codes):
-            logical_x = getattr(code, 'logical_operators', {}).get('X', []) if hasattr(code, 'logical_operators') else []
-            logical_z = getattr(code, 'logical_operators', {}).get('Z', []) if hasattr(code, 'logical_operators') else []
-            mapping = self.current_mappings[i] if i < len(self.current_mappings) else {}
-            x_mapped = sum(1 for q in logical_x if q in mapping)
-            z_mapped = sum(1 for q in logical_z if q in mapping)
-            x_ratio = x_mapped / max(1, len(logical_x)) if logical_x else 0.0
-            z_ratio = z_mapped / max(1, len(logical_z)) if logical_z else 0.0
-            logical_scores.append((x_ratio + z_ratio) / 2.0)
-        info['logical_operator_score'] = float(np.mean(logical_scores)) if logical_scores else 0.0
-        mapped_qubits = sum(len(mapping) for mapping in self.current_mappings)
-        total_qubits = sum(len(getattr(code, 'qubit_layout', {})) for code in self.surface_codes)
-        info['mapped_qubits'] = mapped_qubits
-        info['total_qubits'] = total_qubits
-        print(f"[DEBUG] _gather_mapping_info_multi_patch: info={info}")
-        # Remove debug prints for mapping completeness and validity
-        mapped_graph = nx.Graph()
-        for i, code in enumerate(self.surface_codes):
-            mapping = self.current_mappings[i] if i < len(self.current_mappings) else {}
-            adj = getattr(code, 'adjacency_matrix', nx.Graph())
-            if adj is None:
-                adj = nx.Graph()
-            for sc_q1, sc_q2 in adj.edges():
-                if sc_q1 in mapping and sc_q2 in mapping:
-                    mapped_graph.add_edge(mapping[sc_q1], mapping[sc_q2])
-            mapped_graph.add_nodes_from(mapping.values())
-        try:
-            info['num_components'] = nx.number_connected_components(mapped_graph)
-        except Exception:
-            info['num_components'] = 0
-        info['num_nodes'] = mapped_graph.number_of_nodes()
+        info['avg_error_rate'] = float(metrics.avg_error_rate())
+        info['logical_operator_score'] = float(metrics.logical_operator_score())
+        info['mapped_qubits'] = metrics.mapped_qubits()
+        info['total_qubits'] = metrics.total_qubits()
+        self.trace.debug('env', '_gather_mapping_info_multi_patch: info=%s', info)
+        info['num_components'] = metrics.num_components()
+        info['num_nodes'] = metrics.num_nodes()
         # Add any custom, config-driven metrics
         for term in self.reward_cfg.get('custom_terms', []):
             name = term.get('name')
@@ -702,13 +640,16 @@ class SurfaceCodeEnvironment(gym.Env):
             info[name] = value
         # LER calculation during inference
         self.inference_mode = True
-        if hasattr(self, 'inference_mode') and self.inference_mode:
+        if self.ler_evaluator.amortized:
+            # Latest amortized estimate (None until the first evaluation completes)
+            info['logical_error_rate'] = self.ler_evaluator.latest
+        elif hasattr(self, 'inference_mode') and self.inference_mode:
             try:
                 from scode.utils.decoder_interface import DecoderInterface
                 lers = []
                 for i, code in enumerate(self.surface_codes):
                     mapping = self.current_mappings[i] if i < len(self.current_mappings) else {}
-                    noise_model = getattr(self, 'error_profile', {'p': 0.001})
+                    noise_model = getattr(self, 'error_profile', self.noise_model)
                     ler = DecoderInterface.estimate_logical_error_rate(code, mapping, noise_model, num_trials=getattr(self, 'ler_num_trials', 100), error_prob=getattr(self, 'ler_noise_prob', 0.001))
                     if ler is not None:
                         lers.append(ler)
@@ -720,54 +661,17 @@ class SurfaceCodeEnvironment(gym.Env):
         return info
 
     def _compute_connectivity_score(self) -> float:
-        # Count preserved edges
-        preserved_edges = 0
-        total_edges = 0
-        
-        for sc_q1, sc_q2 in self.surface_codes[0].adjacency_matrix.edges():
-            total_edges += 1
-            
-            if sc_q1 in self.current_mappings[0] and sc_q2 in self.current_mappings[0]:
-                hw_q1 = self.current_mappings[0][sc_q1]
-                hw_q2 = self.current_mappings[0][sc_q2]
-                
-                if self.hw_graph.has_edge(hw_q1, hw_q2):
-                    preserved_edges += 1
-        
-        return preserved_edges / max(1, total_edges)
+        # Fraction of preserved edges of the first patch
+        return self._sync_metrics().connectivity_score(0)
 
     def _compute_adjacency_score(self) -> float:
-        # Count adjacent pairs
-        adjacent_pairs = 0
-        total_edges = 0
-        
-        for sc_q1, sc_q2 in self.surface_codes[0].adjacency_matrix.edges():
-            total_edges += 1
-            
-            if sc_q1 in self.current_mappings[0] and sc_q2 in self.current_mappings[0]:
-                hw_q1 = self.current_mappings[0][sc_q1]
-                hw_q2 = self.current_mappings[0][sc_q2]
-                
-                if self.hw_graph.has_edge(hw_q1, hw_q2):
-                    adjacent_pairs += 1
-        
-        return adjacent_pairs / max(1, total_edges)
+        # Fraction of code edges of the first patch mapped onto adjacent hardware qubits
+        return self._sync_metrics().connectivity_score(0)
 
     def _compute_inter_patch_distance(self) -> float:
-        # Calculate inter-patch distance
-        patch_centers = []
-        for mapping in self.current_mappings:
-            xs = [self.hw_graph.nodes[q]['error_rate'] if 'error_rate' in self.hw_graph.nodes[q] else 0 for q in mapping.values()]
-            if xs:
-                patch_centers.append(np.mean(xs))
-        if len(patch_centers) > 1:
-            return float(np.abs(patch_centers[0] - patch_centers[1]))
-        else:
-            return 0.0
+        # Difference of the mean hardware error rate of the first two patches
+        return self._sync_metrics().inter_patch_distance()
 
     def _compute_resource_utilization(self) -> float:
-        # Count unique hardware qubits used
-        all_hw = []
-        for mapping in self.current_mappings:
-            all_hw.extend(list(mapping.values()))
-        return len(set(all_hw)) / self.num_hw_qubits if self.num_hw_qubits else 0.0 
\ No newline at end of file
+        # Fraction of hardware qubits in use
+        return self._sync_metrics().resource_utilization() 
\ No newline at end of file
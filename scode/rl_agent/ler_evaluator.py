@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from scode.utils.decoder_interface import DecoderInterface
+
+
+def evaluate_patch_lers(codes: List, mappings: List[Dict[int, int]], noise_model, num_trials: int,
+                        error_prob: float) -> List[float]:
+    """Logical error rate of every patch (module-level so it can run in a worker process)."""
+    lers = []
+    for code, mapping in zip(codes, mappings):
+        if code is None or not mapping:
+            continue
+        ler = DecoderInterface.estimate_logical_error_rate(code, mapping, noise_model, num_trials=num_trials,
+                                                          error_prob=error_prob)
+        if ler is not None:
+            lers.append(float(ler))
+    return lers
+
+
+class LEREvaluator:
+    """
+    Amortized logical-error-rate evaluation for the RL environments.
+
+    Modes (multi_patch_rl_agent.environment.ler_evaluation.mode):
+        every_step:  legacy behaviour, the environment estimates the LER inline on every step
+        interval:    evaluate every `interval` environment steps (counted across episodes)
+        episode_end: evaluate once when an episode terminates
+        off:         never evaluate
+    In the amortized modes a snapshot of the codes and mappings is evaluated either inline or, with
+    `async: true`, in a background process pool, so step latency no longer depends on the shot count.
+    Environments running in a daemonic vec-env worker (SubprocVecEnv / SharedMemoryVecEnv) cannot have
+    child processes; there evaluation falls back to a single background thread. stim and pymatching
+    hold the GIL, so that thread competes with the stepping loop: it only overlaps evaluation with
+    waits on the trainer, it does not make steps independent of the shot count, and it is limited to
+    one worker because cached matchers and samplers are not thread-safe. Completed results are reported on the next step that collects them, as 'ler' /
+    'logical_error_rate' (mean over patches) together with 'ler_step' and 'ler_episode', the step
+    and episode the snapshot was taken at. `latest` holds the most recent completed LER.
+    """
+    MODES = ('every_step', 'interval', 'episode_end', 'off')
+
+    def __init__(self, mode: str = 'every_step', interval: int = 100, use_async: bool = False,
+                 max_workers: int = 1, num_trials: int = 100, error_prob: float = 0.001):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown ler_evaluation mode '{mode}'. Use one of: {list(self.MODES)}")
+        self.mode = mode
+        self.interval = max(1, int(interval))
+        self.use_async = bool(use_async)
+        self.max_workers = max(1, int(max_workers))
+        self.num_trials = int(num_trials)
+        self.error_prob = float(error_prob)
+        self.latest: Optional[float] = None
+        self.total_steps = 0
+        self.episode = 0
+        self.skipped = 0
+        self._pool: Optional[Executor] = None
+        self._pool_workers = self.max_workers
+        self._pending: List[tuple] = []
+        self._completed: List[Dict[str, Any]] = []
+
+    @classmethod
+    def from_config(cls, env_cfg: Dict[str, Any], num_trials: int = 100, error_prob: float = 0.001) -> 'LEREvaluator':
+        cfg = (env_cfg or {}).get('ler_evaluation', {}) or {}
+        return cls(mode=cfg.get('mode', 'every_step'), interval=cfg.get('interval', 100),
+                   use_async=cfg.get('async', False), max_workers=cfg.get('max_workers', 1),
+                   num_trials=cfg.get('num_trials', num_trials), error_prob=error_prob)
+
+    @property
+    def amortized(self) -> bool:
+        return self.mode != 'every_step'
+
+    def after_step(self, episode_step: int, done: bool, codes: List, mappings: List[Dict[int, int]],
+                   noise_model, num_trials: Optional[int] = None, error_prob: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Schedule an evaluation if one is due and return the info entries of newly completed ones.
+        Args:
+            episode_step: step index within the current episode
+            done: whether the episode terminated on this step
+            codes, mappings: current patches; mappings are copied before evaluation
+            noise_model: noise model passed to DecoderInterface
+            num_trials, error_prob: optional overrides of the configured shot count and error probability
+        """
+        self.total_steps += 1
+        due = (self.mode == 'interval' and self.total_steps % self.interval == 0) or \
+              (self.mode == 'episode_end' and done)
+        if due:
+            args = (list(codes), [dict(m) for m in mappings], noise_model,
+                    self.num_trials if num_trials is None else int(num_trials),
+                    self.error_prob if error_prob is None else float(error_prob))
+            self._submit(episode_step, args)
+        if done:
+            self.episode += 1
+        return self._collect()
+
+    def _submit(self, episode_step: int, args: tuple) -> None:
+        tag = {'ler_step': episode_step, 'ler_episode': self.episode}
+        pool = self._get_pool() if self.use_async else None
+        if pool is None:
+            self._record(tag, evaluate_patch_lers(*args))
+            return
+        # Never queue more work than the pool can absorb; the next due step tries again
+        self._pending = [(t, f) for t, f in self._pending if not self._harvest(t, f)]
+        if len(self._pending) >= 2 * self._pool_workers:
+            self.skipped += 1
+            return
+        try:
+            future = pool.submit(evaluate_patch_lers, *args)
+        except (AssertionError, OSError, RuntimeError) as e:
+            # ProcessPoolExecutor only starts its workers on submit (e.g. 'daemonic processes are not
+            # allowed to have children'); continue with background threads
+            print(f"[WARNING] LER process pool unavailable ({e}); using a single background thread.")
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._thread_pool()
+            future = self._pool.submit(evaluate_patch_lers, *args)
+        self._pending.append((tag, future))
+
+    def _get_pool(self) -> Optional[Executor]:
+        if self._pool is None:
+            try:
+                if multiprocessing.current_process().daemon:
+                    # SubprocVecEnv / SharedMemoryVecEnv workers are daemonic and cannot fork a pool
+                    self._pool = self._thread_pool()
+                else:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                    self._pool_workers = self.max_workers
+            except Exception as e:
+                print(f"[WARNING] LER process pool unavailable ({e}); evaluating inline.")
+                self.use_async = False
+        return self._pool
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        # DecodingCache matchers and samplers are shared per process and not thread-safe
+        if self.max_workers > 1:
+            print(f"[WARNING] LER evaluation in a vec-env worker uses one background thread "
+                  f"(max_workers={self.max_workers} ignored).")
+        self._pool_workers = 1
+        return ThreadPoolExecutor(max_workers=1)
+
+    def _harvest(self, tag: Dict[str, Any], future: Future) -> bool:
+        if not future.done():
+            return False
+        try:
+            self._record(tag, future.result())
+        except Exception as e:
+            print(f"[WARNING] Background LER evaluation failed: {e}")
+        return True
+
+    def _record(self, tag: Dict[str, Any], lers: List[float]) -> None:
+        if not lers:
+            return
+        self.latest = sum(lers) / len(lers)
+        self._completed.append(dict(tag, ler=self.latest, logical_error_rate=self.latest))
+
+    def _collect(self) -> Dict[str, Any]:
+        self._pending = [(t, f) for t, f in self._pending if not self._harvest(t, f)]
+        if not self._completed:
+            return {}
+        # Several results may complete at once; report the most recent
+        latest, self._completed = self._completed[-1], []
+        return latest
+
+    def drain(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Wait for outstanding evaluations and return the latest result (if any)."""
+        for tag, future in self._pending:
+            try:
+                self._record(tag, future.result(timeout=timeout))
+            except Exception as e:
+                print(f"[WARNING] Background LER evaluation failed: {e}")
+        self._pending = []
+        return self._collect()
+
+    def close(self) -> None:
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
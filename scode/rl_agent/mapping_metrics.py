@@ -0,0 +1,208 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import networkx as nx
+
+
+class MappingMetrics:
+    """
+    Incrementally maintained mapping metrics for the multi-patch RL environments.
+
+    Tracks, per patch, the number of surface-code edges whose endpoints sit on adjacent hardware
+    qubits, the summed hardware error rate of the mapped qubits and the logical-operator coverage,
+    plus the hardware-qubit usage counts shared by all patches. A SWAP or REWIRE only touches two
+    code qubits, so callers run the mutation through apply() (or bracket it with detach()/attach())
+    and every metric is updated in O(degree). Connected components of the mapped graph are kept in a
+    union-find that is only rebuilt when the set of mapped qubits changes or patches overlap.
+    """
+
+    def __init__(self, hw_graph: nx.Graph):
+        self.hw_adjacency = {q: set(hw_graph.neighbors(q)) for q in hw_graph.nodes()}
+        self.hw_error = {q: float(data.get('error_rate', 0.0)) for q, data in hw_graph.nodes(data=True)}
+        self.num_hw_qubits = hw_graph.number_of_nodes()
+        self.codes = []
+        self.mappings: List[Dict[int, int]] = []
+        self.neighbors: List[Dict[int, List[int]]] = []
+        self.edge_counts: List[int] = []
+        self.preserved: List[int] = []
+        self.error_sums: List[float] = []
+        self.logical_coverage: List[float] = []
+        self.usage: Dict[int, int] = {}
+        self.overlaps = 0
+        self._num_components: Optional[int] = None
+
+    def reset(self, codes: List, mappings: List[Dict[int, int]]) -> None:
+        """Recompute every metric from scratch for new codes and mappings (O(edges))."""
+        self.codes = list(codes)
+        self.mappings = mappings
+        self.neighbors, self.edge_counts = [], []
+        for code in self.codes:
+            adj = getattr(code, 'adjacency_matrix', None)
+            if adj is None:
+                adj = nx.Graph()
+            self.neighbors.append({q: list(adj.neighbors(q)) for q in adj.nodes()})
+            self.edge_counts.append(adj.number_of_edges())
+        self.preserved = [0] * len(self.codes)
+        self.error_sums = [0.0] * len(self.codes)
+        self.usage = {}
+        self.overlaps = 0
+        for p in range(len(self.codes)):
+            mapping = self._mapping(p)
+            for q in mapping:
+                self._add_usage(p, q)
+            for q1, q2 in self._code_edges(p):
+                self.preserved[p] += self._edge_preserved(mapping, q1, q2)
+        self.logical_coverage = [self._logical_coverage(p) for p in range(len(self.codes))]
+        self._num_components = None
+
+    def apply(self, patch_idx: int, qubits: Iterable[int], action: Callable[[], bool]) -> bool:
+        """Run `action` (which may remap `qubits` of a patch) and update the metrics around it."""
+        qubits = set(qubits)
+        before = self.detach(patch_idx, qubits)
+        try:
+            return action()
+        finally:
+            self.attach(patch_idx, qubits, before)
+
+    def detach(self, patch_idx: int, qubits: Iterable[int]) -> FrozenSet[int]:
+        """
+        Remove the contribution of `qubits` of a patch before their mapping is changed.
+        Returns:
+            The subset of `qubits` that was mapped, to be passed back to attach()
+        """
+        return self._update(patch_idx, set(qubits), -1)
+
+    def attach(self, patch_idx: int, qubits: Iterable[int], mapped_before: Optional[FrozenSet[int]] = None) -> None:
+        """Add back the contribution of `qubits` of a patch after their mapping was changed."""
+        mapped = self._update(patch_idx, set(qubits), +1)
+        if patch_idx >= len(self.codes):
+            return
+        # Logical coverage and components only depend on which code qubits are mapped
+        if mapped_before is None or mapped != mapped_before:
+            self.logical_coverage[patch_idx] = self._logical_coverage(patch_idx)
+            self._num_components = None
+        elif self.overlaps:
+            self._num_components = None
+
+    def _update(self, p: int, qubits: set, sign: int) -> FrozenSet[int]:
+        if p >= len(self.codes):
+            return frozenset()
+        mapping = self._mapping(p)
+        mapped = frozenset(q for q in qubits if q in mapping)
+        for q in mapped:
+            if sign > 0:
+                self._add_usage(p, q)
+            else:
+                self._remove_usage(p, q)
+        neighbors = self.neighbors[p]
+        edges = {(q, n) if (q, n) <= (n, q) else (n, q) for q in mapped for n in neighbors.get(q, ())}
+        for q1, q2 in edges:
+            self.preserved[p] += sign * self._edge_preserved(mapping, q1, q2)
+        return mapped
+
+    def _add_usage(self, p: int, q: int) -> None:
+        hw = self.mappings[p][q]
+        count = self.usage.get(hw, 0) + 1
+        self.usage[hw] = count
+        if count == 2:
+            self.overlaps += 1
+            self._num_components = None
+        self.error_sums[p] += self.hw_error.get(hw, 0.0)
+
+    def _remove_usage(self, p: int, q: int) -> None:
+        hw = self.mappings[p][q]
+        count = self.usage.get(hw, 0) - 1
+        if count <= 0:
+            self.usage.pop(hw, None)
+        else:
+            self.usage[hw] = count
+        if count == 1:
+            self.overlaps -= 1
+            self._num_components = None
+        self.error_sums[p] -= self.hw_error.get(hw, 0.0)
+
+    def _edge_preserved(self, mapping: Dict[int, int], q1: int, q2: int) -> int:
+        if q1 not in mapping or q2 not in mapping:
+            return 0
+        return int(mapping[q2] in self.hw_adjacency.get(mapping[q1], ()))
+
+    def _code_edges(self, p: int) -> List[Tuple[int, int]]:
+        return [(q, n) for q, nbrs in self.neighbors[p].items() for n in nbrs if (q, n) <= (n, q)]
+
+    def _mapping(self, p: int) -> Dict[int, int]:
+        return self.mappings[p] if p < len(self.mappings) else {}
+
+    def _logical_coverage(self, p: int) -> float:
+        ops = getattr(self.codes[p], 'logical_operators', None) or {}
+        mapping = self._mapping(p)
+        ratios = []
+        for op in ('X', 'Z'):
+            support = ops.get(op, []) or []
+            ratios.append(sum(1 for q in support if q in mapping) / len(support) if support else 0.0)
+        return sum(ratios) / 2.0
+
+    # --- Queries -------------------------------------------------------------------------------
+
+    @property
+    def has_overlap(self) -> bool:
+        return self.overlaps > 0
+
+    def connectivity_score(self, patch_idx: int = 0) -> float:
+        """Fraction of the patch's code edges mapped onto hardware edges."""
+        if patch_idx >= len(self.codes):
+            return 0.0
+        return self.preserved[patch_idx] / max(1, self.edge_counts[patch_idx])
+
+    def mapped_qubits(self) -> int:
+        return sum(len(self._mapping(p)) for p in range(len(self.codes)))
+
+    def total_qubits(self) -> int:
+        return sum(len(getattr(code, 'qubit_layout', {}) or {}) for code in self.codes)
+
+    def avg_error_rate(self) -> float:
+        mapped = self.mapped_qubits()
+        return sum(self.error_sums) / mapped if mapped else 0.0
+
+    def inter_patch_distance(self) -> float:
+        """Difference of the mean hardware error rate of the first two non-empty patches."""
+        centers = [self.error_sums[p] / len(self._mapping(p)) for p in range(len(self.codes)) if self._mapping(p)]
+        if len(centers) > 1:
+            return float(abs(centers[0] - centers[1]))
+        return 0.0
+
+    def resource_utilization(self) -> float:
+        return len(self.usage) / self.num_hw_qubits if self.num_hw_qubits else 0.0
+
+    def logical_operator_score(self) -> float:
+        return sum(self.logical_coverage) / len(self.logical_coverage) if self.logical_coverage else 0.0
+
+    def num_nodes(self) -> int:
+        return len(self.usage)
+
+    def num_components(self) -> int:
+        """Connected components of the mapped graph (code edges drawn between their hardware images)."""
+        if self._num_components is None:
+            self._num_components = self._count_components()
+        return self._num_components
+
+    def _count_components(self) -> int:
+        parent = {hw: hw for hw in self.usage}
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        components = len(parent)
+        for p in range(len(self.codes)):
+            mapping = self._mapping(p)
+            for q1, q2 in self._code_edges(p):
+                if q1 in mapping and q2 in mapping:
+                    r1, r2 = find(mapping[q1]), find(mapping[q2])
+                    if r1 != r2:
+                        parent[r1] = r2
+                        components -= 1
+        return components
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import networkx as nx
+from gymnasium import spaces
+
+
+class ObservationBuilder:
+    """
+    Array-backed observation builder for SurfaceCodeEnvironment.
+
+    The hardware adjacency and per-qubit error features are computed once per device. Within an
+    episode the observation buffers are reused: update() only rewrites the role one-hot entries of
+    the qubits an action moved, and build() returns the same dict every step, so callers that keep
+    an observation across steps of one episode must copy it. reset() swaps in freshly allocated
+    buffers (and a new dict), so the last observation of an episode stays valid after reset, as
+    SB3 vec-env workers expect for info['terminal_observation'].
+
+    Node features per hardware qubit: [error_rate, data, ancilla_X, ancilla_Z, other].
+
+    Formats:
+        dense:     'adjacency' (max_patches * max_qubits, max_qubits) and 'action_mask'
+                   (max_patches * 3, max_qubits, max_qubits)
+        edge_list: 'edge_index' (2, max_edges) with 'edge_mask' (max_edges,) for the hardware graph,
+                   shared by all patches, and 'qubit_mask' (max_patches * 3, max_qubits) marking
+                   the qubit1 values that have at least one legal qubit2
+    """
+    ROLE_INDEX = {'data': 1, 'ancilla_X': 2, 'ancilla_Z': 3}
+    OTHER_ROLE = 4
+
+    def __init__(self, hw_graph: nx.Graph, max_patches: int, max_qubits: int, num_features: int,
+                 observation_format: str = 'dense', max_edges: Optional[int] = None):
+        self.max_patches = max_patches
+        self.max_qubits = max_qubits
+        self.num_features = num_features
+        self.format = observation_format
+        # Per-device tensors, fixed for the lifetime of the environment
+        self.hw_error = np.zeros(max_qubits, dtype=np.float32)
+        for q, data in hw_graph.nodes(data=True):
+            if 0 <= int(q) < max_qubits:
+                self.hw_error[int(q)] = float(data.get('error_rate', 0.0) or 0.0)
+        edges = sorted({(int(a), int(b)) for u, v in hw_graph.edges() for a, b in ((u, v), (v, u))
+                        if 0 <= int(a) < max_qubits and 0 <= int(b) < max_qubits})
+        if self.format == 'edge_list':
+            self.max_edges = len(edges) if max_edges is None else int(max_edges)
+            if len(edges) > self.max_edges:
+                print(f"[WARNING] observation.max_edges={self.max_edges} is smaller than the device's "
+                      f"{len(edges)} directed edges; extra edges are dropped.")
+                edges = edges[:self.max_edges]
+            self.max_edges = max(1, self.max_edges)
+            self.edge_index = np.zeros((2, self.max_edges), dtype=np.int64)
+            self.edge_mask = np.zeros(self.max_edges, dtype=np.float32)
+            if edges:
+                self.edge_index[:, :len(edges)] = np.array(edges, dtype=np.int64).T
+                self.edge_mask[:len(edges)] = 1.0
+        else:
+            self.hw_adjacency = np.zeros((max_qubits, max_qubits), dtype=np.float32)
+            for a, b in edges:
+                self.hw_adjacency[a, b] = 1.0
+        self.codes: List = []
+        self.mappings: List[Dict[int, int]] = []
+        self._allocate()
+
+    def _allocate(self) -> None:
+        """New per-episode observation buffers; the device edge arrays are constant and shared."""
+        p, q = self.max_patches, self.max_qubits
+        self.node_features = np.zeros((p * q, self.num_features), dtype=np.float32)
+        self.observation = {'node_features': self.node_features}
+        if self.format == 'edge_list':
+            self.qubit_mask = np.zeros((p * 3, q), dtype=np.float32)
+            self.observation.update({'edge_index': self.edge_index, 'edge_mask': self.edge_mask,
+                                     'qubit_mask': self.qubit_mask})
+            self._mask_buffer = self.qubit_mask
+        else:
+            self.adjacency = np.zeros((p * q, q), dtype=np.float32)
+            self.action_mask = np.zeros((p * 3, q, q), dtype=np.float32)
+            self.observation.update({'adjacency': self.adjacency, 'action_mask': self.action_mask})
+            self._mask_buffer = self.action_mask
+        self._mask_rows = 0
+        self._mask_version = None
+
+    def reset(self, codes: List, mappings: List[Dict[int, int]], patch_count: int) -> None:
+        """Fill fresh buffers for a new set of codes and mappings (earlier observations are left intact)."""
+        self.codes = list(codes)
+        self.mappings = mappings
+        self._allocate()
+        q = self.max_qubits
+        for i in range(min(len(self.codes), patch_count, self.max_patches)):
+            rows = slice(i * q, (i + 1) * q)
+            self.node_features[rows, 0] = self.hw_error
+            if self.format == 'dense':
+                self.adjacency[rows] = self.hw_adjacency
+            mapping = mappings[i] if i < len(mappings) else {}
+            for sc_q, hw_q in mapping.items():
+                self._set_role(i, sc_q, hw_q)
+
+    def in_sync(self, codes: List, mappings: List[Dict[int, int]]) -> bool:
+        """True if the buffers were built for exactly these code and mapping objects."""
+        return self.mappings is mappings and len(self.codes) == len(codes) and \
+            all(a is b for a, b in zip(self.codes, codes))
+
+    def update(self, patch_idx: int, qubits: Iterable[int], previous: Dict[int, int]) -> None:
+        """
+        Rewrite the role entries of code qubits that an action may have moved.
+        Args:
+            patch_idx: patch the action was applied to
+            qubits: code qubits touched by the action
+            previous: hardware qubit of each touched code qubit before the action
+        """
+        if patch_idx >= min(len(self.codes), self.max_patches):
+            return
+        mapping = self.mappings[patch_idx] if patch_idx < len(self.mappings) else {}
+        moved = [sc_q for sc_q in qubits if previous.get(sc_q) != mapping.get(sc_q)]
+        base = patch_idx * self.max_qubits
+        for sc_q in moved:
+            hw_q = previous.get(sc_q)
+            if hw_q is not None and 0 <= int(hw_q) < self.max_qubits:
+                self.node_features[base + int(hw_q), 1:] = 0.0
+        for sc_q in moved:
+            if sc_q in mapping:
+                self._set_role(patch_idx, sc_q, mapping[sc_q])
+
+    def build(self, action_masks: Optional[np.ndarray] = None, version: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Return the observation dict backed by the reusable buffers.
+        Args:
+            action_masks: current (rows, qubits, qubits) action masks, copied into the padded mask
+                buffer (reduced to per-qubit masks in edge_list format)
+            version: optional mask version; the copy is skipped if it matches the last one
+        """
+        if action_masks is not None and (version is None or version != self._mask_version):
+            rows = min(action_masks.shape[0], self._mask_buffer.shape[0])
+            cols = min(action_masks.shape[1], self.max_qubits)
+            if rows < self._mask_rows:
+                self._mask_buffer[rows:self._mask_rows] = 0.0
+            if self.format == 'edge_list':
+                self.qubit_mask[:rows, :cols] = action_masks[:rows, :cols, :cols].any(axis=2)
+            else:
+                self.action_mask[:rows, :cols, :cols] = action_masks[:rows, :cols, :cols]
+            self._mask_rows = rows
+            self._mask_version = version
+        return self.observation
+
+    def observation_space(self) -> spaces.Dict:
+        """Gymnasium observation space matching the buffers of this builder."""
+        p, q, f = self.max_patches, self.max_qubits, self.num_features
+        space = {'node_features': spaces.Box(low=0, high=1, shape=(p * q, f), dtype=np.float32)}
+        if self.format == 'edge_list':
+            space.update({
+                'edge_index': spaces.Box(low=0, high=q - 1, shape=(2, self.max_edges), dtype=np.int64),
+                'edge_mask': spaces.Box(low=0, high=1, shape=(self.max_edges,), dtype=np.float32),
+                'qubit_mask': spaces.Box(low=0, high=1, shape=(p * 3, q), dtype=np.float32),
+            })
+        else:
+            space.update({
+                'adjacency': spaces.Box(low=0, high=1, shape=(p * q, q), dtype=np.float32),
+                'action_mask': spaces.Box(low=0, high=1, shape=(p * 3, q, q), dtype=np.float32),
+            })
+        return spaces.Dict(space)
+
+    def _set_role(self, patch_idx: int, sc_q: int, hw_q: int) -> None:
+        if not (0 <= int(hw_q) < self.max_qubits):
+            return
+        try:
+            sc_type = self.codes[patch_idx].qubit_layout.get(sc_q, {}).get('type', '')
+        except Exception:
+            sc_type = ''
+        role_idx = self.ROLE_INDEX.get(sc_type, self.OTHER_ROLE)
+        self.node_features[patch_idx * self.max_qubits + int(hw_q), role_idx] = 1.0
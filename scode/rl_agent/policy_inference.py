@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from scode.rl_agent.ler_evaluator import evaluate_patch_lers
+
+SELECTION_CRITERIA = ('reward', 'ler')
+
+# Process-level cache of loaded policies, keyed by (absolute path, mtime, size)
+_POLICY_CACHE: Dict[Tuple[str, float, int], Any] = {}
+_POLICY_CACHE_LOCK = threading.Lock()
+
+
+def load_policy(policy_path: str, device: str = 'auto'):
+    """
+    Load a PPO policy once per process. A policy file that is rewritten in place (new mtime or
+    size) is loaded again; older entries for the same path are dropped.
+    Args:
+        policy_path: path of an SB3 PPO .zip artifact
+        device: torch device passed to PPO.load
+    """
+    from stable_baselines3 import PPO
+    path = os.path.abspath(policy_path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime, stat.st_size)
+    with _POLICY_CACHE_LOCK:
+        model = _POLICY_CACHE.get(key)
+        if model is None:
+            model = PPO.load(path, device=device)
+            for stale in [k for k in _POLICY_CACHE if k[0] == path]:
+                del _POLICY_CACHE[stale]
+            _POLICY_CACHE[key] = model
+        return model
+
+
+def clear_policy_cache() -> None:
+    with _POLICY_CACHE_LOCK:
+        _POLICY_CACHE.clear()
+
+
+def _stack(observations: List[Any]):
+    if isinstance(observations[0], dict):
+        return {key: np.stack([obs[key] for obs in observations]) for key in observations[0]}
+    return np.stack(observations)
+
+
+def run_batched_rollouts(model, envs: List, seeds: List[int], deterministic: bool = True,
+                         max_steps: Optional[int] = None,
+                         on_step: Optional[Callable[[int, int, float, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Run one rollout per environment, with one batched model.predict per step for all live rollouts.
+    Environments are not auto-reset, so each rollout keeps its final mappings.
+    Args:
+        model: loaded policy (see load_policy)
+        envs: environments to roll out, one per seed
+        seeds: reset seed of each rollout
+        deterministic: greedy actions (rollouts then differ only by their seeded initial mappings)
+        max_steps: optional cap on steps per rollout
+        on_step: optional callback(rollout_index, step, reward, info)
+    Returns:
+        One dict per rollout: seed, steps, final_reward, total_reward, ler (last reported, if any),
+        mappings (copy of env.current_mappings) and env
+    """
+    observations = [env.reset(seed=int(seed))[0] for env, seed in zip(envs, seeds)]
+    rollouts = [{'seed': int(seed), 'steps': 0, 'final_reward': 0.0, 'total_reward': 0.0, 'ler': None}
+                for seed in seeds]
+    active = list(range(len(envs)))
+    while active:
+        actions, _ = model.predict(_stack([observations[i] for i in active]), deterministic=deterministic)
+        still_active = []
+        for i, action in zip(active, actions):
+            obs, reward, terminated, truncated, info = envs[i].step(action)
+            rollout = rollouts[i]
+            rollout['steps'] += 1
+            rollout['final_reward'] = float(reward)
+            rollout['total_reward'] += float(reward)
+            ler = info.get('ler', info.get('logical_error_rate'))
+            if ler is not None:
+                rollout['ler'] = float(ler)
+            if on_step is not None:
+                on_step(i, rollout['steps'], float(reward), info)
+            observations[i] = obs
+            if not (terminated or truncated or (max_steps is not None and rollout['steps'] >= max_steps)):
+                still_active.append(i)
+        active = still_active
+    for rollout, env in zip(rollouts, envs):
+        rollout['mappings'] = [dict(m) for m in env.current_mappings]
+        rollout['env'] = env
+    return rollouts
+
+
+def select_best_rollout(rollouts: List[Dict[str, Any]], select_by: str = 'reward', num_trials: int = 100,
+                        error_prob: float = 0.001) -> Dict[str, Any]:
+    """
+    Pick the best rollout.
+    Args:
+        rollouts: output of run_batched_rollouts
+        select_by: 'reward' (highest reward of the final mapping) or 'ler' (lowest mean logical
+            error rate of the final mappings, estimated once per rollout)
+        num_trials, error_prob: LER estimation settings for select_by='ler'
+    """
+    if select_by not in SELECTION_CRITERIA:
+        raise ValueError(f"Unknown rollout selection '{select_by}'. Use one of: {list(SELECTION_CRITERIA)}")
+    if select_by == 'ler':
+        for rollout in rollouts:
+            env = rollout['env']
+            noise_model = getattr(env, 'error_profile', env.noise_model)
+            lers = evaluate_patch_lers(env.surface_codes, rollout['mappings'], noise_model, num_trials, error_prob)
+            rollout['ler'] = sum(lers) / len(lers) if lers else None
+        scored = [r for r in rollouts if r['ler'] is not None]
+        if scored:
+            return min(scored, key=lambda r: (r['ler'], -r['final_reward']))
+    return max(rollouts, key=lambda r: r['final_reward'])
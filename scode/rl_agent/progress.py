@@ -45,7 +45,12 @@ class ProgressBarCallback(BaseCallback):
         avg_reward = sum(rewards) / len(rewards) if rewards else None
         lers = [info.get('ler', None) or info.get('logical_error_rate', None) for info in infos if isinstance(info, dict)]
         lers = [ler for ler in lers if ler is not None]
-        avg_ler = sum(lers) / len(lers) if lers else None
+        # With amortized LER evaluation only some steps carry a result; keep the latest one
+        if avg_reward is not None:
+            self.last_reward = float(avg_reward)
+        if lers:
+            self.last_ler = sum(lers) / len(lers)
+        avg_ler = self.last_ler
         progress = n / self.total_steps
         elapsed = now - self.start_time
         eta = (elapsed / progress - elapsed) if progress > 0 else 0
@@ -65,7 +70,7 @@ class ProgressBarCallback(BaseCallback):
             "progress": progress,
             "msg": None
         }
-        if self.mode in ('terminal', 'both'):
+        if self.callback and self.mode in ('terminal', 'both'):
             self.callback(progress_info)
         self.last_print_time = now
         return True
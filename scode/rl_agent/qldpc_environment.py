@@ -5,10 +5,11 @@ import gymnasium as gym
 from gymnasium import spaces
 import numpy as np
 import networkx as nx
-import random
-from scode.rl_agent.env_constants import MAX_PATCHES, MAX_QUBITS, NUM_FEATURES
+from scode.rl_agent.env_constants import NUM_FEATURES, resolve_observation_dims
 from scode.utils.decoder_interface import DecoderInterface
 from scode.rl_agent.env_interface import RLMappingEnvInterface
+from scode.rl_agent.action_masks import ActionMaskBuilder
+from scode.rl_agent.ler_evaluator import LEREvaluator
 
 class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
     metadata = {'render.modes': ['human', 'rgb_array']}
@@ -21,26 +22,36 @@ class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
         self.patch_count = int(self.config.get('multi_patch_rl_agent', {}).get('environment', {}).get('patch_count', 1))
         self.qldpc_generator = qldpc_generator  # may be None; created on reset if missing
         self.reward_engine = reward_engine
+        # Observation sizes derived from the device and config (dense format only)
+        dims = resolve_observation_dims(self.config, self.hardware_graph)
+        self.max_qubits = dims['max_qubits']
+        self.max_patches = dims['max_patches']
         # Align spaces with SurfaceCodeEnvironment for SB3 compatibility
         self.action_space = spaces.Box(
             low=np.array([0, 0, 0, 0, 0, 0], dtype=np.float32),
             high=np.array([
-                MAX_PATCHES-1,  # patch_idx
-                2,              # action_type (SWAP/REWIRE/ASSIGN)
-                MAX_QUBITS-1,   # qubit1
-                MAX_QUBITS-1,   # qubit2
-                MAX_QUBITS-1,   # param1
-                1               # param2
+                self.max_patches-1,  # patch_idx
+                2,                   # action_type (SWAP/REWIRE/ASSIGN)
+                self.max_qubits-1,   # qubit1
+                self.max_qubits-1,   # qubit2
+                self.max_qubits-1,   # param1
+                1                    # param2
             ], dtype=np.float32),
             dtype=np.float32
         )
         self.observation_space = spaces.Dict({
-            'node_features': spaces.Box(low=0, high=1, shape=(MAX_PATCHES * MAX_QUBITS, NUM_FEATURES), dtype=np.float32),
-            'adjacency': spaces.Box(low=0, high=1, shape=(MAX_PATCHES * MAX_QUBITS, MAX_QUBITS), dtype=np.float32),
-            'action_mask': spaces.Box(low=0, high=1, shape=(MAX_PATCHES * 3, MAX_QUBITS, MAX_QUBITS), dtype=np.float32)
+            'node_features': spaces.Box(low=0, high=1, shape=(self.max_patches * self.max_qubits, NUM_FEATURES), dtype=np.float32),
+            'adjacency': spaces.Box(low=0, high=1, shape=(self.max_patches * self.max_qubits, self.max_qubits), dtype=np.float32),
+            'action_mask': spaces.Box(low=0, high=1, shape=(self.max_patches * 3, self.max_qubits, self.max_qubits), dtype=np.float32)
         })
         self._steps = 0
         self._max_steps = int(self.config.get('rl_agent', {}).get('max_steps_per_episode', 100))
+        # SWAP/REWIRE need adjacent hardware qubits, ASSIGN_GATE needs a code edge
+        self.action_mask_builder = ActionMaskBuilder(
+            self.hardware_graph.get('qubit_connectivity', {}) or {}, self.max_qubits,
+            rules=('hw_adjacent', 'hw_adjacent', 'code_edge'))
+        self.ler_evaluator = LEREvaluator.from_config(
+            self.config.get('multi_patch_rl_agent', {}).get('environment', {}), num_trials=50)
 
     # Expose max_steps for external control (curriculum stage wiring)
     @property
@@ -74,7 +85,7 @@ class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
             self.codes.append(code)
         # Initialize trivial mappings (no overlap)
         hw_nodes = list((self.hardware_graph or {}).get('qubit_connectivity', {}).keys())
-        random.shuffle(hw_nodes)
+        self.np_random.shuffle(hw_nodes)
         self.current_mappings = []
         for code in self.codes:
             sc_qubits = list(getattr(code, 'qubit_layout', {}).keys()) if code else []
@@ -83,8 +94,8 @@ class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
         return self._build_observation(), {}
 
     def _make_empty_observation(self):
-        node_features = np.zeros((MAX_PATCHES * MAX_QUBITS, NUM_FEATURES), dtype=np.float32)
-        adjacency = np.zeros((MAX_PATCHES * MAX_QUBITS, MAX_QUBITS), dtype=np.float32)
+        node_features = np.zeros((self.max_patches * self.max_qubits, NUM_FEATURES), dtype=np.float32)
+        adjacency = np.zeros((self.max_patches * self.max_qubits, self.max_qubits), dtype=np.float32)
         action_mask = self._get_action_masks()
         return {
             'node_features': node_features,
@@ -93,33 +104,9 @@ class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
         }
 
     def _get_action_masks(self):
-        """Minimal legal action mask based on current mappings (per patch)."""
-        masks = np.zeros((self.patch_count, 3, MAX_QUBITS, MAX_QUBITS), dtype=np.float32)
-        for i, mapping in enumerate(getattr(self, 'current_mappings', [])):
-            sc_qubits = list(mapping.keys())
-            code_adj = None
-            try:
-                code_adj = getattr(self.codes[i], 'adjacency_matrix', None)
-            except Exception:
-                code_adj = None
-            # Hardware connectivity for mask tightening (align with Surface env semantics)
-            conn = (self.hardware_graph or {}).get('qubit_connectivity', {})
-            for a_type in range(3):
-                for q1 in sc_qubits:
-                    for q2 in sc_qubits:
-                        if q1 == q2:
-                            continue
-                        # For SWAP/REWIRE (a_type 0/1), require HW adjacency when both are mapped
-                        if a_type in (0, 1):
-                            hw1 = mapping.get(int(q1))
-                            hw2 = mapping.get(int(q2))
-                            if hw1 is not None and hw2 is not None:
-                                if int(hw2) not in [int(n) for n in conn.get(int(hw1), [])]:
-                                    continue
-                        if a_type == 2 and code_adj is not None and not code_adj.has_edge(q1, q2):
-                            continue
-                        masks[i, a_type, int(q1), int(q2)] = 1.0
-        return masks.reshape(self.patch_count * 3, MAX_QUBITS, MAX_QUBITS)
+        """Minimal legal action mask based on current mappings (per patch); cached between steps."""
+        return self.action_mask_builder.get(getattr(self, 'current_mappings', []), self.patch_count,
+                                            getattr(self, 'codes', None))
 
     def step(self, action):
         self._steps += 1
@@ -143,6 +130,12 @@ class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
             'episode_step': self._steps,
         }
         # Best-effort logical error rate estimation (optional)
+        if self.ler_evaluator.amortized:
+            info.update(self.ler_evaluator.after_step(
+                self._steps, done, getattr(self, 'codes', []), getattr(self, 'current_mappings', []),
+                getattr(self, 'error_profile', {'p': 0.001}), num_trials=getattr(self, 'ler_num_trials', None),
+                error_prob=getattr(self, 'ler_noise_prob', None)))
+            return obs, reward, done, False, info
         try:
             code = self.codes[0] if self.codes else None
             mapping0 = self.current_mappings[0] if self.current_mappings else {}
@@ -166,8 +159,8 @@ class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
         qprops = (self.hardware_graph or {}).get('qubit_properties', {})
         for i, mapping in enumerate(getattr(self, 'current_mappings', [])):
             for sc_q, hw_q in mapping.items():
-                if 0 <= int(hw_q) < MAX_QUBITS:
-                    idx = i * MAX_QUBITS + int(hw_q)
+                if 0 <= int(hw_q) < self.max_qubits:
+                    idx = i * self.max_qubits + int(hw_q)
                     # Feature[0]: error_rate from hardware properties (fallback 0.0)
                     try:
                         obs['node_features'][idx, 0] = float(qprops.get(int(hw_q), {}).get('readout_error', 0.0))
@@ -188,7 +181,7 @@ class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
                         role_idx = 3
                     obs['node_features'][idx, role_idx] = 1.0
                     for nb in conn.get(int(hw_q), []):
-                        if 0 <= int(nb) < MAX_QUBITS:
+                        if 0 <= int(nb) < self.max_qubits:
                             obs['adjacency'][idx, int(nb)] = 1.0
         obs['action_mask'] = self._get_action_masks()
         return obs
@@ -216,6 +209,10 @@ class QLDPCEnvironment(gym.Env, RLMappingEnvInterface):
         except Exception:
             return 0.0
 
+    def close(self):
+        self.ler_evaluator.close()
+        super().close()
+
     # Interface utility
     def get_mapping_info(self) -> dict:
         return {
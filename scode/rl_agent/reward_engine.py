@@ -4,7 +4,14 @@
 import numpy as np
 import networkx as nx
 
+from scode.rl_agent.reward_history import RewardHistory
+from scode.utils.trace import get_trace_sink
+
+_TRACE = get_trace_sink()
+
 class MultiPatchRewardEngine:
+    PERCENTILE_WINDOW = 100
+
     def __init__(self, config):
         # Failsafe debug: print full reward config
         reward_cfg = config.get('reward_function', {})
@@ -36,9 +43,8 @@ class MultiPatchRewardEngine:
         if not self.normalization:
             self.normalization = 'tanh'  # Default to 'tanh' for robust, bounded training
         print(f"[DEBUG][REWARD ENGINE INIT] FINAL normalization={self.normalization}")
-        self.reward_history = []
-        self.running_mean = 0.0
-        self.running_std = 1.0
+        # Fixed-size history; percentile normalization uses the last PERCENTILE_WINDOW rewards
+        self.reward_history = RewardHistory(reward_cfg.get('history_size', 1000), self.PERCENTILE_WINDOW)
         # Curriculum phase shaping
         self.curriculum_config = config.get('curriculum_learning', {})
         self.phases = self.curriculum_config.get('stages', [{}])
@@ -133,8 +139,8 @@ class MultiPatchRewardEngine:
         # Normalization
         normalized_reward = self._normalize_reward(reward)
         breakdown['normalized_reward'] = normalized_reward
-        # Debug print for normalization
-        print(f"[DEBUG][REWARD ENGINE] Raw reward: {reward}, Normalized reward: {normalized_reward}, Normalization: {self.normalization}")
+        _TRACE.debug('reward', 'Raw reward: %s, Normalized reward: %s, Normalization: %s',
+                     reward, normalized_reward, self.normalization)
         # Normalization for inference
         normalization_constant = getattr(self, 'normalization_constant', 1.0)
         if hasattr(self, 'reward_cfg') and 'normalization_constant' in self.reward_cfg:
@@ -146,30 +152,23 @@ class MultiPatchRewardEngine:
         return normalized_reward, breakdown
 
     def _normalize_reward(self, reward: float) -> float:
-        print(f"[DEBUG][REWARD ENGINE] _normalize_reward called with normalization={self.normalization}, reward={reward}")
-        self.reward_history.append(reward)
+        self.reward_history.push(reward)
         if self.normalization == 'none':
             return reward
         elif self.normalization == 'tanh':
             return np.tanh(reward)
         elif self.normalization == 'running_mean_std':
-            if len(self.reward_history) == 1:
-                self.running_mean = reward
-                self.running_std = 1.0
-            else:
-                alpha = 0.01
-                self.running_mean = (1 - alpha) * self.running_mean + alpha * reward
-                self.running_std = (1 - alpha) * self.running_std + alpha * abs(reward - self.running_mean)
-                self.running_std = max(0.1, self.running_std)
-            normalized = (reward - self.running_mean) / self.running_std
+            # Welford mean/std over every reward seen, including this one
+            std = max(0.1, self.reward_history.std)
+            normalized = (reward - self.reward_history.mean) / std
             return max(-5.0, min(5.0, normalized))
         elif self.normalization == 'clip':
             return max(-1.0, min(1.0, reward))
         elif self.normalization == 'percentile':
-            if len(self.reward_history) > 100:
-                sorted_rewards = sorted(self.reward_history[-100:])
-                percentile_5 = sorted_rewards[4]
-                percentile_95 = sorted_rewards[94]
+            history = self.reward_history
+            if len(history) > history.window:
+                percentile_5 = history.window_rank(history.window * 5 // 100 - 1)
+                percentile_95 = history.window_rank(history.window * 95 // 100 - 1)
                 if percentile_95 > percentile_5:
                     normalized = (reward - percentile_5) / (percentile_95 - percentile_5)
                     return max(0.0, min(1.0, normalized))
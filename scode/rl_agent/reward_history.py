@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import bisect
+import math
+
+import numpy as np
+
+
+class RewardHistory:
+    """
+    Constant-memory reward history for MultiPatchRewardEngine.
+
+    The most recent `capacity` rewards are kept in a NumPy ring buffer. Running statistics over
+    every reward seen (count, mean, variance) use Welford's update. The last `window` rewards are
+    additionally kept in sorted order (bisect insert of the new reward, bisect removal of the one
+    leaving the window), so windowed percentiles are exact lookups instead of a sort per call.
+    """
+
+    def __init__(self, capacity: int = 1000, window: int = 100):
+        self.window = max(1, int(window))
+        self.capacity = max(self.window, int(capacity))
+        self._buffer = np.zeros(self.capacity, dtype=np.float64)
+        self._sorted_window = []
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, reward: float) -> None:
+        reward = float(reward)
+        if self.count >= self.window:
+            leaving = self._buffer[(self.count - self.window) % self.capacity]
+            idx = bisect.bisect_left(self._sorted_window, leaving)
+            if idx < len(self._sorted_window) and self._sorted_window[idx] == leaving:
+                del self._sorted_window[idx]
+            else:
+                # NaN rewards never compare equal; rebuild the window from the ring buffer
+                self._sorted_window = sorted(self.last(self.window - 1))
+        self._buffer[self.count % self.capacity] = reward
+        bisect.insort(self._sorted_window, reward)
+        self.count += 1
+        delta = reward - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (reward - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def window_rank(self, rank: int) -> float:
+        """The rank-th smallest (0-based) of the last `window` rewards."""
+        return self._sorted_window[rank]
+
+    def last(self, n: int) -> np.ndarray:
+        """The most recent min(n, stored) rewards, oldest first."""
+        n = min(int(n), self.count, self.capacity)
+        idx = (np.arange(self.count - n, self.count)) % self.capacity
+        return self._buffer[idx]
+
+    def values(self) -> np.ndarray:
+        """All stored rewards (at most `capacity`), oldest first."""
+        return self.last(self.capacity)
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import multiprocessing as mp
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, List, Optional
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper, VecEnvObs, VecEnvStepReturn
+try:
+    # Private SB3 helper (wraps legacy gym envs via shimmy); not guaranteed across SB3 versions
+    from stable_baselines3.common.vec_env.patch_gym import _patch_env
+except ImportError:
+    def _patch_env(env):
+        if not isinstance(env, gym.Env):
+            raise ValueError(f"The environment is of type {type(env)}, not a Gymnasium environment.")
+        return env
+
+VEC_STRATEGIES = ('subproc', 'shared_memory', 'dummy', 'none')
+
+
+def _observation_layout(space: spaces.Space) -> Dict[Optional[str], spaces.Box]:
+    """Box sub-spaces backing an observation (key None for a plain Box space)."""
+    if isinstance(space, spaces.Box):
+        return {None: space}
+    if isinstance(space, spaces.Dict) and all(isinstance(s, spaces.Box) for s in space.spaces.values()):
+        return dict(space.spaces)
+    raise NotImplementedError(f"SharedMemoryVecEnv supports Box and Dict-of-Box observations, got {space}")
+
+
+def _open_untracked(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block owned (and unlinked) by the parent without registering it with a resource tracker."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python >= 3.13
+    except TypeError:
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _attach(names: Dict[Optional[str], str], layout: Dict[Optional[str], spaces.Box], num_envs: int):
+    blocks, arrays = {}, {}
+    for key, space in layout.items():
+        blocks[key] = _open_untracked(names[key])
+        arrays[key] = np.ndarray((num_envs,) + space.shape, dtype=space.dtype, buffer=blocks[key].buf)
+    return blocks, arrays
+
+
+def _shared_memory_worker(remote, parent_remote, env_fn_wrapper: CloudpickleWrapper) -> None:
+    # Import here to avoid a circular import
+    from stable_baselines3.common.env_util import is_wrapped
+
+    parent_remote.close()
+    env = _patch_env(env_fn_wrapper.var())
+    blocks, arrays, index = {}, {}, 0
+
+    def write(observation):
+        if None in arrays:
+            arrays[None][index] = observation
+        else:
+            for key, array in arrays.items():
+                array[index] = observation[key]
+
+    reset_info: Optional[Dict[str, Any]] = {}
+    try:
+        while True:
+            try:
+                cmd, data = remote.recv()
+            except (EOFError, KeyboardInterrupt):
+                break
+            if cmd == 'step':
+                observation, reward, terminated, truncated, info = env.step(data)
+                done = terminated or truncated
+                info['TimeLimit.truncated'] = truncated and not terminated
+                if done:
+                    # The terminal observation goes through the pipe; it is only needed once per episode
+                    info['terminal_observation'] = observation
+                    observation, reset_info = env.reset()
+                write(observation)
+                remote.send((reward, done, info, reset_info))
+            elif cmd == 'reset':
+                maybe_options = {'options': data[1]} if data[1] else {}
+                observation, reset_info = env.reset(seed=data[0], **maybe_options)
+                write(observation)
+                remote.send(reset_info)
+            elif cmd == 'attach':
+                names, layout, num_envs, index = data
+                blocks, arrays = _attach(names, layout, num_envs)
+                remote.send(True)
+            elif cmd == 'get_spaces':
+                remote.send((env.observation_space, env.action_space))
+            elif cmd == 'render':
+                remote.send(env.render())
+            elif cmd == 'env_method':
+                method = env.get_wrapper_attr(data[0])
+                remote.send(method(*data[1], **data[2]))
+            elif cmd == 'get_attr':
+                remote.send(env.get_wrapper_attr(data))
+            elif cmd == 'has_attr':
+                try:
+                    env.get_wrapper_attr(data)
+                    remote.send(True)
+                except AttributeError:
+                    remote.send(False)
+            elif cmd == 'set_attr':
+                remote.send(setattr(env, data[0], data[1]))
+            elif cmd == 'is_wrapped':
+                remote.send(is_wrapped(env, data))
+            elif cmd == 'close':
+                env.close()
+                remote.close()
+                break
+            else:
+                raise NotImplementedError(f"`{cmd}` is not implemented in the worker")
+    finally:
+        arrays.clear()
+        for block in blocks.values():
+            block.close()
+
+
+class SharedMemoryVecEnv(SubprocVecEnv):
+    """
+    SubprocVecEnv variant whose workers write observations into shared-memory NumPy buffers.
+
+    One shared block of shape (num_envs, *shape) is allocated per observation key; worker i writes
+    its observation into row i, so only actions, rewards, dones and info dicts are pickled through
+    the pipes (plus the terminal observation at the end of an episode). step_wait()/reset() return
+    copies of the shared buffers, since SB3 keeps the previous observation across the next step.
+    Attribute access, env_method and the other VecEnv utilities behave as in SubprocVecEnv.
+    """
+
+    def __init__(self, env_fns: List[Callable[[], gym.Env]], start_method: Optional[str] = None):
+        self.waiting = False
+        self.closed = False
+        self._blocks: Dict[Optional[str], shared_memory.SharedMemory] = {}
+        n_envs = len(env_fns)
+        if start_method is None:
+            start_method = 'forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn'
+        ctx = mp.get_context(start_method)
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_envs)])
+        self.processes = []
+        for work_remote, remote, env_fn in zip(self.work_remotes, self.remotes, env_fns):
+            process = ctx.Process(target=_shared_memory_worker,
+                                  args=(work_remote, remote, CloudpickleWrapper(env_fn)), daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        self.remotes[0].send(('get_spaces', None))
+        observation_space, action_space = self.remotes[0].recv()
+        VecEnv.__init__(self, n_envs, observation_space, action_space)
+
+        self._layout = _observation_layout(observation_space)
+        self._arrays: Dict[Optional[str], np.ndarray] = {}
+        try:
+            for key, space in self._layout.items():
+                nbytes = max(1, n_envs * int(np.prod(space.shape)) * np.dtype(space.dtype).itemsize)
+                self._blocks[key] = shared_memory.SharedMemory(create=True, size=nbytes)
+                self._arrays[key] = np.ndarray((n_envs,) + space.shape, dtype=space.dtype,
+                                               buffer=self._blocks[key].buf)
+            names = {key: block.name for key, block in self._blocks.items()}
+            for i, remote in enumerate(self.remotes):
+                remote.send(('attach', (names, self._layout, n_envs, i)))
+            for remote in self.remotes:
+                remote.recv()
+        except Exception:
+            self.close()
+            raise
+
+    def step_wait(self) -> VecEnvStepReturn:
+        results = [remote.recv() for remote in self.remotes]
+        self.waiting = False
+        rewards, dones, infos, self.reset_infos = zip(*results)
+        return self._observations(), np.stack(rewards), np.stack(dones), infos
+
+    def reset(self) -> VecEnvObs:
+        for env_idx, remote in enumerate(self.remotes):
+            remote.send(('reset', (self._seeds[env_idx], self._options[env_idx])))
+        self.reset_infos = [remote.recv() for remote in self.remotes]
+        # Seeds and options are only used once
+        self._reset_seeds()
+        self._reset_options()
+        return self._observations()
+
+    def _observations(self) -> VecEnvObs:
+        if None in self._arrays:
+            return self._arrays[None].copy()
+        return {key: array.copy() for key, array in self._arrays.items()}
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                super().close()
+            finally:
+                self.closed = True
+        self._arrays = {}
+        for block in self._blocks.values():
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = {}
+
+
+def build_vec_env(make_env: Callable[[], gym.Env], n_envs: int, vec_strategy: str = 'subproc'):
+    """
+    Create the training environment for `agent.vec_strategy`.
+    Args:
+        make_env: environment factory (must be picklable with cloudpickle for process backends)
+        n_envs: number of parallel environments; a single environment is returned unwrapped if <= 1
+        vec_strategy: 'subproc', 'shared_memory', 'dummy' or 'none'
+    """
+    if vec_strategy not in VEC_STRATEGIES:
+        raise ValueError(f"Unsupported vectorization strategy: {vec_strategy}. Use one of: {list(VEC_STRATEGIES)}")
+    if n_envs <= 1 or vec_strategy == 'none':
+        return make_env()
+    env_fns = [make_env for _ in range(n_envs)]
+    if vec_strategy == 'shared_memory':
+        return SharedMemoryVecEnv(env_fns)
+    if vec_strategy == 'dummy':
+        return DummyVecEnv(env_fns)
+    return SubprocVecEnv(env_fns)
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+"""
+Micro-benchmark for SurfaceCodeEnvironment: latency and allocation volume of the observation
+builder and of a full env.step on the selected device.
+
+Usage:
+    python -m scode.scripts.benchmark_env_step --code-distance 3 --layout-type rotated --steps 200
+    python -m scode.scripts.benchmark_env_step --ler-mode interval --ler-async --ler-trials 10000
+    python -m scode.scripts.benchmark_env_step --ler-mode interval --ler-async --vec-worker
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import multiprocessing
+import os
+import random
+import time
+import tracemalloc
+
+import numpy as np
+
+from configuration_management.config_manager import ConfigManager
+from hardware_abstraction.device_abstraction import DeviceAbstraction
+from scode.heuristic_layer.heuristic_initialization_layer import HeuristicInitializationLayer
+from scode.rl_agent.environment import SurfaceCodeEnvironment
+
+
+def build_environment(code_distance: int, layout_type: str, patch_count: int,
+                      ler_evaluation: dict = None, device: dict = None) -> SurfaceCodeEnvironment:
+    """Create an environment for `device` (default: the device selected in configs/hardware.json)."""
+    ConfigManager.load_registry()
+    config = copy.deepcopy(ConfigManager.get_config('multi_patch_rl_agent'))
+    env_cfg = config.setdefault('multi_patch_rl_agent', {}).setdefault('environment', {})
+    env_cfg.update({'code_distance': code_distance, 'layout_type': layout_type, 'patch_count': patch_count})
+    if ler_evaluation:
+        env_cfg['ler_evaluation'] = dict(env_cfg.get('ler_evaluation', {}) or {}, **ler_evaluation)
+    config.setdefault('curriculum_learning', {})['enabled'] = False
+    config.setdefault('rl_agent', {})['max_steps_per_episode'] = 10 ** 9
+    if device is None:
+        hardware_json = ConfigManager.config_registry.get('hardware', os.path.join('configs', 'hardware.json'))
+        device = DeviceAbstraction.load_selected_device(hardware_json)
+    return SurfaceCodeEnvironment(config=config, hardware_graph=device,
+                                  surface_code_generator=HeuristicInitializationLayer(config, device))
+
+
+def _measure(fn, calls: int):
+    """Mean wall time and mean transient allocation (tracemalloc peak above baseline) per call."""
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    latency = (time.perf_counter() - start) / calls
+    tracemalloc.start()
+    allocated = 0
+    for _ in range(calls):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - base
+    tracemalloc.stop()
+    return latency, allocated / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--code-distance', type=int, default=3)
+    parser.add_argument('--layout-type', default='rotated')
+    parser.add_argument('--patch-count', type=int, default=1)
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--ler-mode', choices=['every_step', 'interval', 'episode_end', 'off'], default=None)
+    parser.add_argument('--ler-interval', type=int, default=100)
+    parser.add_argument('--ler-async', action='store_true', help='evaluate LER in a background process pool')
+    parser.add_argument('--ler-trials', type=int, default=None, help='shots per LER evaluation')
+    parser.add_argument('--vec-worker', action='store_true',
+                        help='run inside a daemonic process, like a SubprocVecEnv worker')
+    args = parser.parse_args()
+    if args.vec_worker:
+        worker = multiprocessing.Process(target=run, args=(args,), daemon=True)
+        worker.start()
+        worker.join()
+        return
+    run(args)
+
+
+def run(args):
+    ler_evaluation = {}
+    if args.ler_mode:
+        ler_evaluation.update({'mode': args.ler_mode, 'interval': args.ler_interval, 'async': args.ler_async})
+    if args.ler_trials:
+        ler_evaluation['num_trials'] = args.ler_trials
+
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+    rng = random.Random(args.seed)
+    quiet = io.StringIO()
+    with contextlib.redirect_stdout(quiet):
+        env = build_environment(args.code_distance, args.layout_type, args.patch_count, ler_evaluation)
+        env.reset(seed=args.seed)
+        if args.ler_trials:
+            env.ler_num_trials = args.ler_trials
+    sc_qubits = [list(m) for m in env.current_mappings]
+
+    def step():
+        patch = rng.randrange(len(sc_qubits))
+        q1, q2 = rng.sample(sc_qubits[patch], 2)
+        with contextlib.redirect_stdout(quiet):
+            _, _, done, _, _ = env.step([patch, 0, q1, q2, 0, 0.0])
+            if done:
+                env.reset(seed=args.seed)
+        quiet.seek(0)
+        quiet.truncate()
+
+    obs_latency, obs_alloc = _measure(env._get_observation_multi_patch, args.steps)
+    step_latency, step_alloc = _measure(step, args.steps)
+    print(f"device={env.hardware_graph.get('device_name', 'unknown')} d={args.code_distance} "
+          f"layout={args.layout_type} patches={args.patch_count} calls={args.steps}")
+    print(f"observation: {obs_latency * 1e6:10.1f} us/call  {obs_alloc / 1024:10.1f} KiB allocated/call")
+    print(f"env.step:    {step_latency * 1e6:10.1f} us/call  {step_alloc / 1024:10.1f} KiB allocated/call")
+    print(f"ler:         mode={env.ler_evaluator.mode} async={env.ler_evaluator.use_async} "
+          f"pool={type(env.ler_evaluator._pool).__name__} "
+          f"skipped={env.ler_evaluator.skipped} "
+          f"trials={getattr(env, 'ler_num_trials', env.ler_evaluator.num_trials)}")
+    env.close()
+
+
+if __name__ == '__main__':
+    main()
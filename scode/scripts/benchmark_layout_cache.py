@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+"""
+Benchmark for the surface-code layout cache: latency of HeuristicInitializationLayer.generate_surface_code
+(cold vs. cached), of a layout-type/distance sweep ("discovery") and of SurfaceCodeEnvironment.reset,
+on the device selected in configs/hardware.json.
+
+Usage:
+    python -m scode.scripts.benchmark_layout_cache --code-distance 3 --layout-type rotated --calls 50
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import time
+
+from scode.heuristic_layer.heuristic_initialization_layer import HeuristicInitializationLayer
+from scode.heuristic_layer.layout_cache import LayoutCache
+from scode.scripts.benchmark_env_step import build_environment
+
+
+def _mean_seconds(fn, calls: int, before=None) -> float:
+    total = 0.0
+    for _ in range(calls):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start
+    return total / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--code-distance', type=int, default=3)
+    parser.add_argument('--layout-type', default='rotated')
+    parser.add_argument('--patch-count', type=int, default=2)
+    parser.add_argument('--calls', type=int, default=50)
+    args = parser.parse_args()
+
+    cache = LayoutCache.shared()
+    quiet = io.StringIO()
+    with contextlib.redirect_stdout(quiet):
+        env = build_environment(args.code_distance, args.layout_type, args.patch_count)
+        layer = env.surface_code_generator
+        uncached = HeuristicInitializationLayer(copy.deepcopy(env.config), env.hardware_graph)
+        uncached.layout_cache = None
+        sweep = [(layout, d) for layout in layer.supported_layouts for d in range(3, layer.max_code_distance + 1, 2)]
+
+        def discover(h_layer):
+            for layout, d in sweep:
+                try:
+                    h_layer.generate_surface_code(d, layout)
+                except ValueError:
+                    pass  # does not fit the device
+
+        generate = lambda: layer.generate_surface_code(args.code_distance, args.layout_type)
+        results = {
+            'generate (uncached)': _mean_seconds(lambda: uncached.generate_surface_code(args.code_distance, args.layout_type), args.calls),
+            'generate (cold)': _mean_seconds(generate, args.calls, before=cache.clear),
+            'generate (cached)': _mean_seconds(generate, args.calls),
+            'discovery sweep (uncached)': _mean_seconds(lambda: discover(uncached), max(1, args.calls // 10)),
+            'discovery sweep (cached)': _mean_seconds(lambda: discover(layer), max(1, args.calls // 10)),
+        }
+        env.surface_code_generator = uncached
+        results['env.reset (uncached)'] = _mean_seconds(env.reset, args.calls)
+        env.surface_code_generator = layer
+        results['env.reset (cached)'] = _mean_seconds(env.reset, args.calls)
+    print(f"device={env.hardware_graph.get('device_name', 'unknown')} d={args.code_distance} layout={args.layout_type} "
+          f"patches={args.patch_count} calls={args.calls} sweep={len(sweep)} layouts")
+    for name, seconds in results.items():
+        print(f"{name:28s} {seconds * 1e3:10.3f} ms/call")
+    print(f"cache: entries={len(cache)} stats={cache.stats}")
+    env.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+"""
+Runtime and mapping quality of the MultiPatchMapper search heuristics on rotated surface codes of
+distance d, mapped onto a square-lattice device with seeded random readout errors (the bundled
+device configs are too small for d >= 7).
+
+Quality is the MappingProblem cost (hop distance of coupled logical qubits plus 10x readout
+error) of the returned mapping, so lower is better for every heuristic. `*_legacy` entries are
+the pre-vectorization dict-based implementations, kept here as the reference.
+
+Usage:
+    python -m scode.scripts.benchmark_mappers --distances 3 5 7 9 --heuristics sa sa_legacy ga ga_legacy
+"""
+
+import argparse
+import json
+import math
+import random
+import time
+from types import SimpleNamespace
+
+import networkx as nx
+import numpy as np
+
+from scode.heuristic_layer.surface_code import SurfaceCode  # noqa: F401  (import order: breaks the heuristic_layer <-> mapper cycle)
+from scode.multi_patch_mapper.mapping_problem import MappingProblem
+from scode.multi_patch_mapper.multi_patch_mapper import MultiPatchMapper
+
+
+def rotated_surface_code_patch(d: int):
+    """Patch with the data/ancilla coupling graph of a distance-d rotated surface code."""
+    graph = nx.Graph()
+    data = {(i, j): i * d + j for i in range(d) for j in range(d)}
+    layout = {q: {'x': float(j), 'y': float(i), 'type': 'data'} for (i, j), q in data.items()}
+    next_id = d * d
+    for i in range(-1, d):
+        for j in range(-1, d):
+            corners = [(i + a, j + b) for a in (0, 1) for b in (0, 1) if (i + a, j + b) in data]
+            interior = 0 <= i < d - 1 and 0 <= j < d - 1
+            # Weight-2 boundary plaquettes alternate along each boundary
+            boundary = len(corners) == 2 and ((i in (-1, d - 1)) != (j in (-1, d - 1))) and (i + j) % 2 == 0
+            if not (interior or boundary):
+                continue
+            layout[next_id] = {'x': j + 0.5, 'y': i + 0.5, 'type': 'ancilla_X' if (i + j) % 2 else 'ancilla_Z'}
+            for corner in corners:
+                graph.add_edge(next_id, data[corner])
+            next_id += 1
+    return SimpleNamespace(qubit_layout=layout, adjacency_matrix=graph, code_distance=d)
+
+
+def square_lattice_device(side: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    connectivity = {}
+    for r in range(side):
+        for c in range(side):
+            q = r * side + c
+            connectivity[q] = [n for n, ok in ((q - side, r > 0), (q + side, r < side - 1),
+                                               (q - 1, c > 0), (q + 1, c < side - 1)) if ok]
+    return {'device_name': f'square_{side}x{side}', 'provider_name': 'synthetic', 'max_qubits': side * side,
+            'qubit_connectivity': connectivity,
+            'qubit_properties': {q: {'readout_error': rng.uniform(0.005, 0.05)} for q in connectivity}}
+
+
+def _logical_graph(patches):
+    all_logical, logical_neighbors = [], {}
+    for patch in patches:
+        for lq in patch.qubit_layout:
+            all_logical.append(lq)
+            logical_neighbors[lq] = list(patch.adjacency_matrix.neighbors(lq)) if lq in patch.adjacency_matrix else []
+    return all_logical, logical_neighbors
+
+
+def legacy_simulated_annealing(mapper, patches, constraints):
+    """Dict-copying annealer with full cost re-evaluation per move."""
+    qubit_errors = mapper.hardware_graph.get('qubit_properties', {})
+    hw_nodes = list(map(int, mapper.hardware_graph['qubit_connectivity'].keys()))
+    all_logical, logical_neighbors = _logical_graph(patches)
+    current = {lq: hw for lq, hw in zip(all_logical, hw_nodes[:len(all_logical)])}
+    distance = mapper.geometry.distance
+
+    def cost(mapping):
+        total = 0.0
+        for lq, hw in mapping.items():
+            for ln in logical_neighbors.get(lq, []):
+                if ln in mapping:
+                    total += distance(hw, mapping[ln])
+            total += 10 * qubit_errors.get(int(hw), {}).get('readout_error', 0.0)
+        return total
+    T, best = 1.0, current.copy()
+    best_cost = cost(current)
+    while T > 1e-3:
+        for _ in range(100):
+            lq1, lq2 = random.sample(all_logical, 2)
+            new = current.copy()
+            new[lq1], new[lq2] = new[lq2], new[lq1]
+            new_cost = cost(new)
+            if new_cost < best_cost or random.random() < np.exp((best_cost - new_cost) / T):
+                current = new
+                if new_cost < best_cost:
+                    best, best_cost = new, new_cost
+        T *= 0.95
+    return best
+
+
+def legacy_genetic_algorithm(mapper, patches, constraints):
+    """List-of-dicts GA: per-individual Python cost, one-cut crossover with O(n^2) repair."""
+    qubit_errors = mapper.hardware_graph.get('qubit_properties', {})
+    hw_nodes = list(map(int, mapper.hardware_graph['qubit_connectivity'].keys()))
+    all_logical, logical_neighbors = _logical_graph(patches)
+    pop_size, generations, mutation_rate = 30, 50, 0.2
+    distance = mapper.geometry.distance
+
+    def cost(mapping):
+        total = 0.0
+        for lq, hw in mapping.items():
+            for ln in logical_neighbors.get(lq, []):
+                if ln in mapping:
+                    total += distance(hw, mapping[ln])
+            total += 10 * qubit_errors.get(int(hw), {}).get('readout_error', 0.0)
+        return total
+    population = [dict(zip(all_logical, random.sample(hw_nodes, len(all_logical)))) for _ in range(pop_size)]
+    for _ in range(generations):
+        survivors = sorted(population, key=cost)[:pop_size // 2]
+        children = []
+        while len(children) < pop_size - len(survivors):
+            p1, p2 = random.sample(survivors, 2)
+            cut = random.randint(1, len(all_logical) - 1)
+            child = list(p1.values())[:cut] + list(p2.values())[cut:]
+            if len(set(child)) < len(child):
+                used = set(child)
+                unused = [q for q in hw_nodes if q not in used]
+                for i in range(len(child)):
+                    if child.count(child[i]) > 1:
+                        child[i] = unused.pop()
+            children.append(dict(zip(all_logical, child)))
+        for child in children:
+            if random.random() < mutation_rate:
+                lq1, lq2 = random.sample(all_logical, 2)
+                child[lq1], child[lq2] = child[lq2], child[lq1]
+        population = survivors + children
+    return min(population, key=cost)
+
+
+HEURISTICS = {
+    'greedy': lambda mapper, patches, constraints: mapper._greedy_mapping(patches, constraints),
+    'sa': lambda mapper, patches, constraints: mapper._simulated_annealing_mapping(patches, constraints),
+    'sa_legacy': legacy_simulated_annealing,
+    'ga': lambda mapper, patches, constraints: mapper._genetic_algorithm_mapping(patches, constraints),
+    'ga_legacy': legacy_genetic_algorithm,
+}
+
+
+def benchmark(name: str, d: int, seed: int) -> dict:
+    patch = rotated_surface_code_patch(d)
+    side = math.ceil(math.sqrt(len(patch.qubit_layout))) + 2
+    device = square_lattice_device(side, seed)
+    mapper = MultiPatchMapper({}, device)
+    constraints = {'simulated_annealing': {'seed': seed}, 'genetic_algorithm': {'seed': seed}}
+    random.seed(seed)
+    start = time.perf_counter()
+    mapping = HEURISTICS[name](mapper, [patch], constraints)
+    elapsed = time.perf_counter() - start
+    all_logical, logical_neighbors = _logical_graph([patch])
+    hw_nodes = sorted(device['qubit_connectivity'])
+    problem = MappingProblem(all_logical, logical_neighbors, hw_nodes, mapper.geometry, device['qubit_properties'])
+    slot = {q: i for i, q in enumerate(hw_nodes)}
+    assignment = np.array([slot[mapping[lq]] for lq in problem.logical])
+    return {'heuristic': name, 'code_distance': d, 'logical_qubits': problem.n_logical, 'hw_qubits': len(hw_nodes),
+            'seconds': elapsed, 'cost': problem.cost(assignment)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--distances', nargs='+', type=int, default=[3, 5, 7, 9])
+    parser.add_argument('--heuristics', nargs='+', default=['sa', 'sa_legacy'], choices=sorted(HEURISTICS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+    results = []
+    print(f"{'heuristic':>14} {'d':>3} {'logical':>8} {'seconds':>9} {'cost':>10}")
+    for d in args.distances:
+        for name in args.heuristics:
+            result = benchmark(name, d, args.seed)
+            results.append(result)
+            print(f"{name:>14} {d:>3} {result['logical_qubits']:>8} {result['seconds']:9.3f} {result['cost']:10.2f}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
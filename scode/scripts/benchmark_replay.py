@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+"""
+Replayable benchmark suite for SurfaceCodeEnvironment.
+
+Every case of the (device, layout_type, code_distance, patch_count) matrix replays fixed seeds:
+episode e is reset with seed + e and driven by an action sequence sampled from an action space
+seeded with the same value, so two runs of the same code produce identical reward trajectories.
+Each case runs in a fresh worker process and reports steps/sec, reset latency, the peak RSS of
+that process and the per-episode reward trajectories (with a digest for quick comparison). LER
+evaluation is off by default since shot sampling is not seeded.
+
+With --baseline the results are compared against an earlier JSON report; the script exits with
+status 1 if any case is slower than the baseline by more than --tolerance, uses more than
+--rss-tolerance additional memory, or no longer reproduces the baseline reward digest.
+
+Usage:
+    python -m scode.scripts.benchmark_replay --devices ibm:ibmq_jakarta ibm:mock_ibm_hummingbird \\
+        --code-distances 3 --patch-counts 1 2 --json replay.json
+    python -m scode.scripts.benchmark_replay --json current.json --baseline replay.json
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import itertools
+import json
+import multiprocessing as mp
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+
+from configuration_management.config_manager import ConfigManager
+from hardware_abstraction.device_abstraction import DeviceAbstraction
+from scode.scripts.benchmark_env_step import build_environment
+
+
+def case_key(case: Dict[str, Any]) -> str:
+    return f"{case['device']}/{case['layout_type']}/d{case['code_distance']}/p{case['patch_count']}"
+
+
+def reward_digest(trajectories: List[List[float]]) -> str:
+    """Digest of the reward trajectories, rounded so that it is stable across platforms."""
+    payload = json.dumps([[round(r, 6) for r in episode] for episode in trajectories])
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def run_case(case: Dict[str, Any], seed: int, episodes: int, steps: int, ler_mode: str) -> Dict[str, Any]:
+    """Replay `episodes` seeded episodes of `steps` fixed actions on one configuration."""
+    provider, device_name = case['device'].split(':', 1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ConfigManager.load_registry()
+        device = DeviceAbstraction.get_device_info(provider, device_name)
+        env = build_environment(case['code_distance'], case['layout_type'], case['patch_count'],
+                                {'mode': ler_mode}, device=device)
+    trajectories, reset_times, step_time, step_count = [], [], 0.0, 0
+    try:
+        for episode in range(episodes):
+            episode_seed = seed + episode
+            env.action_space.seed(episode_seed)
+            actions = [env.action_space.sample() for _ in range(steps)]
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                env.reset(seed=episode_seed)
+                reset_times.append(time.perf_counter() - start)
+                rewards = []
+                start = time.perf_counter()
+                for action in actions:
+                    _, reward, terminated, truncated, _ = env.step(action)
+                    rewards.append(float(reward))
+                    if terminated or truncated:
+                        break
+                step_time += time.perf_counter() - start
+            step_count += len(rewards)
+            trajectories.append(rewards)
+    finally:
+        env.close()
+    return dict(case, key=case_key(case), seed=seed, episodes=episodes, steps=step_count,
+                steps_per_s=step_count / step_time if step_time else 0.0,
+                reset_ms=1000 * float(np.mean(reset_times)),
+                peak_rss_kb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                reward_digest=reward_digest(trajectories), rewards=trajectories)
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float,
+            rss_tolerance: float) -> List[str]:
+    """Regressions of `results` against `baseline` (cases missing from the baseline are ignored)."""
+    reference = {(b['key'], b['seed']): b for b in baseline}
+    regressions = []
+    for result in results:
+        base = reference.get((result['key'], result['seed']))
+        if base is None:
+            continue
+        if result['reward_digest'] != base['reward_digest']:
+            regressions.append(f"{result['key']}: reward trajectory changed "
+                               f"({base['reward_digest']} -> {result['reward_digest']})")
+        if result['steps_per_s'] < base['steps_per_s'] * (1 - tolerance):
+            regressions.append(f"{result['key']}: steps/s {base['steps_per_s']:.1f} -> {result['steps_per_s']:.1f}")
+        if result['reset_ms'] > base['reset_ms'] * (1 + tolerance):
+            regressions.append(f"{result['key']}: reset {base['reset_ms']:.2f} ms -> {result['reset_ms']:.2f} ms")
+        if result['peak_rss_kb'] > base['peak_rss_kb'] * (1 + rss_tolerance):
+            regressions.append(f"{result['key']}: peak RSS {base['peak_rss_kb']} kB -> {result['peak_rss_kb']} kB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--devices', nargs='+', default=['ibm:ibmq_jakarta', 'ibm:mock_ibm_hummingbird'],
+                        help='provider:device_name pairs')
+    parser.add_argument('--layout-types', nargs='+', default=['rotated'])
+    parser.add_argument('--code-distances', nargs='+', type=int, default=[3])
+    parser.add_argument('--patch-counts', nargs='+', type=int, default=[1, 2])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--episodes', type=int, default=3)
+    parser.add_argument('--steps', type=int, default=100, help='actions replayed per episode')
+    parser.add_argument('--ler-mode', default='off', choices=['every_step', 'interval', 'episode_end', 'off'])
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--baseline', help='JSON report of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative slowdown')
+    parser.add_argument('--rss-tolerance', type=float, default=0.2, help='allowed relative peak RSS growth')
+    args = parser.parse_args()
+
+    cases = [{'device': device, 'layout_type': layout, 'code_distance': d, 'patch_count': p}
+             for device, layout, d, p in itertools.product(args.devices, args.layout_types,
+                                                           args.code_distances, args.patch_counts)]
+    results, failed = [], []
+    print(f"{'case':>48} {'steps/s':>10} {'reset ms':>9} {'peak RSS kB':>12} {'rewards':>17}")
+    for case in cases:
+        # A fresh process per case keeps peak RSS attributable to that case
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context('spawn')) as pool:
+            try:
+                result = pool.submit(run_case, case, args.seed, args.episodes, args.steps, args.ler_mode).result()
+            except Exception as e:
+                print(f"[WARNING] {case_key(case)} failed: {e}")
+                failed.append(case_key(case))
+                continue
+        results.append(result)
+        print(f"{result['key']:>48} {result['steps_per_s']:10.1f} {result['reset_ms']:9.2f} "
+              f"{result['peak_rss_kb']:12d} {result['reward_digest']:>17}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.rss_tolerance)
+        regressions += [f"{key}: case failed" for key in failed]
+        for regression in regressions:
+            print(f"[REGRESSION] {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"[INFO] No regressions against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+"""
+Throughput of the vectorized-environment backends (agent.vec_strategy) for SurfaceCodeEnvironment
+on the selected device: subproc (SB3 SubprocVecEnv), shared_memory (SharedMemoryVecEnv) and
+dummy (DummyVecEnv), for a range of n_envs. LER evaluation is disabled by default so the numbers
+reflect environment stepping and observation transport. Environments are built with build_vec_env,
+like training; with n_envs=1 every strategy therefore runs a single unwrapped environment.
+
+Usage:
+    python -m scode.scripts.benchmark_vec_env --n-envs 1 2 4 8 16 32 --steps 200
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import time
+
+import numpy as np
+
+from scode.rl_agent.shared_memory_vec_env import build_vec_env
+from scode.scripts.benchmark_env_step import build_environment
+
+
+def make_env(code_distance: int, layout_type: str, patch_count: int, ler_mode: str):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return build_environment(code_distance, layout_type, patch_count, {'mode': ler_mode})
+
+
+def _vec_env(strategy: str, env_fn, n_envs: int):
+    """The training environment as the API builds it; a single env is wrapped like SB3 does in learn()."""
+    from stable_baselines3.common.vec_env import DummyVecEnv, VecEnv
+    venv = build_vec_env(env_fn, n_envs, strategy)
+    if not isinstance(venv, VecEnv):
+        venv = DummyVecEnv([lambda: venv])
+    return venv
+
+
+def benchmark(strategy: str, env_fn, n_envs: int, steps: int, seed: int) -> dict:
+    """Mean vector-step latency and environment steps per second for one backend."""
+    venv = _vec_env(strategy, env_fn, n_envs)
+    try:
+        venv.seed(seed)
+        venv.action_space.seed(seed)
+        obs = venv.reset()
+        obs_bytes = sum(v.nbytes for v in obs.values()) // n_envs if isinstance(obs, dict) else obs.nbytes // n_envs
+        actions = [np.stack([venv.action_space.sample() for _ in range(n_envs)]) for _ in range(steps + 1)]
+        venv.step(actions[0])  # warm up
+        start = time.perf_counter()
+        for i in range(steps):
+            venv.step(actions[i + 1])
+        elapsed = time.perf_counter() - start
+    finally:
+        venv.close()
+    return {'strategy': strategy, 'n_envs': n_envs, 'vec_steps': steps,
+            'step_ms': 1000 * elapsed / steps, 'env_steps_per_s': n_envs * steps / elapsed,
+            'observation_bytes_per_env': int(obs_bytes)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--strategies', nargs='+', default=['subproc', 'shared_memory', 'dummy'],
+                        choices=['subproc', 'shared_memory', 'dummy'])
+    parser.add_argument('--n-envs', nargs='+', type=int, default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--code-distance', type=int, default=3)
+    parser.add_argument('--layout-type', default='rotated')
+    parser.add_argument('--patch-count', type=int, default=1)
+    parser.add_argument('--ler-mode', default='off', choices=['every_step', 'interval', 'episode_end', 'off'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    env_fn = functools.partial(make_env, args.code_distance, args.layout_type, args.patch_count, args.ler_mode)
+    results = []
+    print(f"{'strategy':>14} {'n_envs':>6} {'ms/vec-step':>12} {'env-steps/s':>12}")
+    for n_envs in args.n_envs:
+        for strategy in args.strategies:
+            result = benchmark(strategy, env_fn, n_envs, args.steps, args.seed)
+            results.append(result)
+            print(f"{strategy:>14} {n_envs:>6} {result['step_ms']:12.2f} {result['env_steps_per_s']:12.1f}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,27 @@
 # SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
 # SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
 
+import inspect
+from statistics import NormalDist
+from typing import Any, Dict, Optional, Tuple
+
 import numpy as np
 
-try:
-    import stim
-except ImportError:
-    stim = None
-try:
-    import pymatching
-except ImportError:
-    pymatching = None
+from scode.utils.lazy_import import is_available, lazy_import
+
+# Imported on first use: pymatching pulls in matplotlib at import time
+stim = lazy_import('stim') if is_available('stim') else None
+pymatching = lazy_import('pymatching') if is_available('pymatching') else None
+
+from scode.utils.decoding_cache import DecodingCache, DecodingProblem, get_decoding_cache
+from scode.utils.trace import get_trace_sink
+
+_TRACE = get_trace_sink()
+
+# Parity (popcount mod 2) of every byte value, used to reduce bit-packed shots
+_BYTE_PARITY = np.array([bin(i).count('1') & 1 for i in range(256)], dtype=np.uint8)
+# Probability of the fallback boundary edges added to non-decomposable detector error models
+_BOUNDARY_EDGE_PROBABILITY = 1e-12
 
 class DecoderInterface:
     @staticmethod
@@ -30,41 +41,27 @@ class DecoderInterface:
         return bool(np.sum(meas_outcomes[valid_indices]) % 2)
 
     @staticmethod
-    def estimate_logical_error_rate(layout, mapping, noise_model, num_trials=1000, error_prob=0.001, logical_op_type='Z'):
+    def _build_decoding_problem(layout, mapping, noise_model, error_prob=0.001, logical_op_type='Z'):
         """
-        Estimate the logical error rate (LER) for a given surface code layout and mapping using stim and pymatching.
-        Args:
-            layout: Surface code layout (SurfaceCodeObject or dict with stabilizer info)
-            mapping: logical_to_physical mapping dict
-            noise_model: dict describing noise (e.g., {'p': 0.001})
-            num_trials: Number of Monte Carlo trials
-            error_prob: Physical error probability (if not in noise_model)
-            logical_op_type: 'Z' or 'X' (which logical operator to use for LER)
+        Build the stim circuit, detector error model and logical operator used for LER estimation.
         Returns:
-            Estimated logical error rate (float)
-        Raises:
-            ImportError if stim or pymatching is not available
+            (circuit, detector_error_model, logical_op), or None if no logical operator is defined
         """
-        if stim is None or pymatching is None:
-            print('[WARNING] stim or pymatching not available! Returning LER=0.0')
-            return 0.0
-        # Build stim circuit from layout and mapping
         if hasattr(layout, 'to_stim_circuit'):
-            circuit = layout.to_stim_circuit(mapping, noise_model)
-            detector_error_model = circuit.detector_error_model(decompose_errors=True)
+            if 'basis' in inspect.signature(layout.to_stim_circuit).parameters:
+                circuit = layout.to_stim_circuit(mapping, noise_model, basis=logical_op_type)
+            else:
+                circuit = layout.to_stim_circuit(mapping, noise_model)
+            detector_error_model = DecoderInterface._detector_error_model(circuit)
             # Get logical operator indices (data qubit indices)
             logical_op = None
             if hasattr(layout, 'logical_operators') and logical_op_type in layout.logical_operators:
                 logical_op = layout.logical_operators[logical_op_type]
-            print(f'[DEBUG] LER: logical_op_type={logical_op_type}, logical_op={logical_op}, mapping={mapping}')
+            _TRACE.debug('decoder', 'LER: logical_op_type=%s, logical_op=%s, mapping=%s', logical_op_type, logical_op, mapping)
             if logical_op is None or len(logical_op) == 0:
-                print(f'[WARNING] No logical operator "{logical_op_type}" defined in layout for LER calculation! Returning LER=0.0')
-                return 0.0
-            # Get data qubit indices for measurement
-            if hasattr(layout, 'get_data_qubits'):
-                data_qubits = layout.get_data_qubits()
-            else:
-                data_qubits = list(range(len(logical_op)))
+                _TRACE.warning('decoder', 'No logical operator "%s" defined in layout for LER calculation! Returning LER=0.0',
+                               logical_op_type)
+                return None
         else:
             # Fallback: build a simple stim circuit for a distance-d repetition code
             d = layout.get('code_distance', 3) if isinstance(layout, dict) else 3
@@ -74,17 +71,127 @@ class DecoderInterface:
             circuit.append_operation("M", list(range(d)))
             detector_error_model = circuit.detector_error_model(decompose_errors=True)
             logical_op = list(range(d))  # All qubits for repetition code
-            data_qubits = list(range(d))
-        # Build pymatching decoder
-        matching = pymatching.Matching(detector_error_model)
-        # Use stim's detector sampler for Monte Carlo trials
-        sampler = circuit.compile_detector_sampler()
-        detector_samples = sampler.sample(num_trials)
-        # Use stim's sampler for measurement outcomes
-        meas_sampler = circuit.compile_sampler()
-        meas_samples = meas_sampler.sample(num_trials)
+        return circuit, detector_error_model, logical_op
+
+    @staticmethod
+    def _get_decoding_problem(layout, mapping, noise_model, error_prob=0.001, logical_op_type='Z',
+                              use_cache: bool = True) -> Optional[DecodingProblem]:
+        """
+        Return the compiled decoding problem for (layout, mapping, noise model), building it on a
+        cache miss. Returns None if no logical operator is defined.
+        """
+        cache = get_decoding_cache()
+        key = DecodingCache.make_key(layout, mapping, noise_model, error_prob, logical_op_type) if use_cache else None
+        if key is not None:
+            problem = cache.get(key)
+            if problem is not None:
+                return problem
+        built = DecoderInterface._build_decoding_problem(layout, mapping, noise_model, error_prob, logical_op_type)
+        if built is None:
+            return None
+        circuit, detector_error_model, logical_op = built
+        problem = DecodingProblem(circuit, detector_error_model, logical_op, pymatching.Matching(detector_error_model))
+        if key is not None:
+            cache.put(key, problem)
+        return problem
+
+    @staticmethod
+    def configure_cache(max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """
+        Set the limits of the process-wide decoding cache.
+        Args:
+            max_entries: Maximum number of cached decoding problems (0 disables caching)
+            max_bytes: Maximum estimated memory held by the cache
+        """
+        get_decoding_cache().configure(max_entries=max_entries, max_bytes=max_bytes)
+
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current size of the process-wide decoding cache."""
+        return get_decoding_cache().stats()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached decoding problems and reset the counters."""
+        get_decoding_cache().clear()
+
+    @staticmethod
+    def _detector_error_model(circuit):
+        """
+        Graphlike detector error model for matching. Irregular layouts can produce circuit-level
+        errors that do not decompose into edges; those are kept as-is and every detector gets a
+        negligible boundary edge so that a perfect matching always exists.
+        """
+        try:
+            return circuit.detector_error_model(decompose_errors=True)
+        except ValueError:
+            dem = circuit.detector_error_model(decompose_errors=True, ignore_decomposition_failures=True)
+            for k in range(dem.num_detectors):
+                dem.append("error", _BOUNDARY_EDGE_PROBABILITY, [stim.target_relative_detector_id(k)])
+            return dem
+
+    @staticmethod
+    def _sample(problem, num_trials, seed=None, bit_packed=False):
+        """
+        Draw detector and measurement samples. Both samplers are seeded from `seed` so that the
+        per-shot and batch paths see exactly the same shots.
+        """
+        meas_seed = None if seed is None else int(seed) + 1
+        detector_samples = problem.detector_sampler(seed).sample(num_trials, bit_packed=bit_packed)
+        meas_samples = problem.measurement_sampler(meas_seed).sample(num_trials, bit_packed=bit_packed)
+        return detector_samples, meas_samples
+
+    @staticmethod
+    def _sample_with_observables(problem, num_trials, seed=None, bit_packed=False):
+        """Draw detector samples together with the matching logical-observable flips."""
+        return problem.detector_sampler(seed).sample(num_trials, separate_observables=True, bit_packed=bit_packed)
+
+    @staticmethod
+    def _count_observable_errors_per_shot(matching, detector_samples, observable_flips) -> int:
+        """Reference path for annotated circuits: compare the predicted and actual observable flips shot by shot."""
+        num_observables = observable_flips.shape[1]
+        logical_errors = 0
+        for i in range(detector_samples.shape[0]):
+            prediction = np.zeros(num_observables, dtype=bool)
+            decoded = matching.decode(detector_samples[i, :])[:num_observables]
+            prediction[:len(decoded)] = decoded
+            if np.any(prediction != observable_flips[i, :]):
+                logical_errors += 1
+        return logical_errors
+
+    @staticmethod
+    def _count_observable_errors_batch(matching, packed_detectors, packed_observables) -> int:
+        """Vectorized path for annotated circuits: one `decode_batch` call over bit-packed shots."""
+        width = packed_observables.shape[1]
+        predictions = np.zeros_like(packed_observables)
+        if matching.num_fault_ids > 0:
+            decoded = matching.decode_batch(packed_detectors, bit_packed_shots=True, bit_packed_predictions=True)
+            predictions[:, :min(width, decoded.shape[1])] = decoded[:, :width]
+        return int(np.count_nonzero(np.any(predictions != packed_observables, axis=1)))
+
+    @staticmethod
+    def _count_logical_errors(problem, num_trials, seed=None, batch=True) -> int:
+        """
+        Count logical failures over `num_trials` shots. Circuits with OBSERVABLE_INCLUDE annotations
+        are decoded against their observables; otherwise the logical-operator parity of the raw
+        measurement record is used.
+        """
+        circuit, matching = problem.circuit, problem.matching
+        if circuit.num_observables > 0:
+            detectors, observables = DecoderInterface._sample_with_observables(problem, num_trials, seed=seed, bit_packed=batch)
+            if batch:
+                return DecoderInterface._count_observable_errors_batch(matching, detectors, observables)
+            return DecoderInterface._count_observable_errors_per_shot(matching, detectors, observables)
+        detectors, meas = DecoderInterface._sample(problem, num_trials, seed=seed, bit_packed=batch)
+        if batch:
+            return DecoderInterface._count_logical_errors_batch(matching, detectors, meas, circuit.num_measurements, problem.logical_op)
+        return DecoderInterface._count_logical_errors_per_shot(matching, detectors, meas, problem.logical_op)
+
+    @staticmethod
+    def _count_logical_errors_per_shot(matching, detector_samples, meas_samples, logical_op) -> int:
+        """Reference path: decode and check one shot at a time."""
         logical_errors = 0
-        for i in range(num_trials):
+        for i in range(detector_samples.shape[0]):
             syndrome = detector_samples[i, :]
             correction = matching.decode(syndrome)
             # Get measurement outcomes for data qubits
@@ -93,9 +200,122 @@ class DecoderInterface:
             corrected_meas = np.copy(meas_outcomes)
             # Only apply correction to data qubits (if correction is same length)
             if len(correction) == len(corrected_meas):
-                corrected_meas ^= correction
+                corrected_meas ^= correction.astype(corrected_meas.dtype)
             # Check if the parity of the logical operator is odd (logical error)
             if DecoderInterface._check_logical_error(corrected_meas, logical_op):
                 logical_errors += 1
+        return logical_errors
+
+    @staticmethod
+    def _count_logical_errors_batch(matching, packed_detectors, packed_meas, num_measurements, logical_op) -> int:
+        """
+        Vectorized path: decode every shot with one `decode_batch` call and compute the logical
+        parity of all shots as a single reduction over bit-packed measurement records.
+        """
+        valid_indices = [i for i in logical_op if 0 <= i < num_measurements]
+        if not valid_indices:
+            raise ValueError(f"No valid logical operator indices: {logical_op} for measurement outcome of length {num_measurements}")
+        # Packed mask selecting the logical-operator columns; indices repeated in the operator
+        # cancel in pairs exactly as they do in the per-shot np.sum parity.
+        mask_bits = np.zeros(num_measurements, dtype=np.uint8)
+        np.add.at(mask_bits, valid_indices, 1)
+        mask = np.packbits(mask_bits & 1, bitorder='little')
+        corrected = packed_meas
+        # Corrections are only applied when they line up with the measurement record, so the
+        # decoder is skipped entirely otherwise.
+        if matching.num_fault_ids == num_measurements:
+            predictions = matching.decode_batch(packed_detectors, bit_packed_shots=True, bit_packed_predictions=True)
+            corrected = packed_meas ^ predictions
+        parities = _BYTE_PARITY[np.bitwise_xor.reduce(corrected & mask, axis=1)]
+        return int(np.count_nonzero(parities))
+
+    @staticmethod
+    def wilson_interval(logical_errors: int, num_trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+        """
+        Wilson score confidence interval for a binomial proportion.
+        Args:
+            logical_errors: Number of shots with a logical error
+            num_trials: Number of shots
+            confidence: Two-sided confidence level (e.g. 0.95)
+        Returns:
+            (lower, upper) bounds of the interval
+        """
+        if num_trials <= 0:
+            return 0.0, 1.0
+        z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+        p = logical_errors / num_trials
+        denom = 1.0 + z * z / num_trials
+        center = (p + z * z / (2.0 * num_trials)) / denom
+        half_width = z * np.sqrt(p * (1.0 - p) / num_trials + z * z / (4.0 * num_trials * num_trials)) / denom
+        return float(max(0.0, center - half_width)), float(min(1.0, center + half_width))
+
+    @staticmethod
+    def estimate_logical_error_rate_batch(layout, mapping, noise_model, num_trials=1000, error_prob=0.001,
+                                          logical_op_type='Z', seed: Optional[int] = None,
+                                          confidence: float = 0.95, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Estimate the logical error rate with all shots decoded in one batch.
+        Args:
+            layout: Surface code layout (SurfaceCodeObject or dict with stabilizer info)
+            mapping: logical_to_physical mapping dict
+            noise_model: dict describing noise (e.g., {'p': 0.001})
+            num_trials: Number of Monte Carlo trials
+            error_prob: Physical error probability (if not in noise_model)
+            logical_op_type: 'Z' or 'X' (which logical operator to use for LER)
+            seed: Optional sampler seed; the same seed gives the same result as the per-shot path
+            confidence: Confidence level of the returned Wilson interval
+            use_cache: Reuse the compiled circuit, matching graph and samplers from the decoding cache
+        Returns:
+            Dict with 'ler', 'ci_low', 'ci_high', 'logical_errors', 'num_trials' and 'confidence'
+        """
+        result = {'ler': 0.0, 'ci_low': 0.0, 'ci_high': 0.0, 'logical_errors': 0, 'num_trials': 0, 'confidence': confidence}
+        if stim is None or pymatching is None:
+            print('[WARNING] stim or pymatching not available! Returning LER=0.0')
+            return result
+        problem = DecoderInterface._get_decoding_problem(layout, mapping, noise_model, error_prob, logical_op_type, use_cache)
+        if problem is None:
+            return result
+        logical_errors = DecoderInterface._count_logical_errors(problem, num_trials, seed=seed, batch=True)
+        ci_low, ci_high = DecoderInterface.wilson_interval(logical_errors, num_trials, confidence)
+        result.update({
+            'ler': logical_errors / num_trials,
+            'ci_low': ci_low,
+            'ci_high': ci_high,
+            'logical_errors': logical_errors,
+            'num_trials': num_trials,
+        })
+        return result
+
+    @staticmethod
+    def estimate_logical_error_rate(layout, mapping, noise_model, num_trials=1000, error_prob=0.001, logical_op_type='Z',
+                                    batch: bool = True, seed: Optional[int] = None, use_cache: bool = True):
+        """
+        Estimate the logical error rate (LER) for a given surface code layout and mapping using stim and pymatching.
+        Args:
+            layout: Surface code layout (SurfaceCodeObject or dict with stabilizer info)
+            mapping: logical_to_physical mapping dict
+            noise_model: dict describing noise (e.g., {'p': 0.001})
+            num_trials: Number of Monte Carlo trials
+            error_prob: Physical error probability (if not in noise_model)
+            logical_op_type: 'Z' or 'X' (which logical operator to use for LER)
+            batch: Decode all shots at once (default) instead of one shot at a time
+            seed: Optional sampler seed for reproducible estimates
+            use_cache: Reuse the compiled circuit, matching graph and samplers from the decoding cache
+        Returns:
+            Estimated logical error rate (float)
+        Raises:
+            ImportError if stim or pymatching is not available
+        """
+        if batch:
+            return float(DecoderInterface.estimate_logical_error_rate_batch(
+                layout, mapping, noise_model, num_trials=num_trials, error_prob=error_prob,
+                logical_op_type=logical_op_type, seed=seed, use_cache=use_cache)['ler'])
+        if stim is None or pymatching is None:
+            print('[WARNING] stim or pymatching not available! Returning LER=0.0')
+            return 0.0
+        problem = DecoderInterface._get_decoding_problem(layout, mapping, noise_model, error_prob, logical_op_type, use_cache)
+        if problem is None:
+            return 0.0
+        logical_errors = DecoderInterface._count_logical_errors(problem, num_trials, seed=seed, batch=False)
         ler = logical_errors / num_trials
-        return float(ler) 
\ No newline at end of file
+        return float(ler)
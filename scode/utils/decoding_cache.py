@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class DecodingProblem:
+    """
+    Compiled artifacts for one (layout, mapping, noise model) combination: the stim circuit, its
+    detector error model, the pymatching graph and lazily compiled unseeded samplers.
+    """
+
+    def __init__(self, circuit, detector_error_model, logical_op: List[int], matching):
+        self.circuit = circuit
+        self.detector_error_model = detector_error_model
+        self.logical_op = logical_op
+        self.matching = matching
+        self._detector_sampler = None
+        self._measurement_sampler = None
+        self.nbytes = self._estimate_nbytes()
+
+    def detector_sampler(self, seed: Optional[int] = None):
+        """Compiled detector sampler; seeded requests always get a fresh sampler so results stay reproducible."""
+        if seed is not None:
+            return self.circuit.compile_detector_sampler(seed=int(seed))
+        if self._detector_sampler is None:
+            self._detector_sampler = self.circuit.compile_detector_sampler()
+        return self._detector_sampler
+
+    def measurement_sampler(self, seed: Optional[int] = None):
+        """Compiled measurement sampler, reused across calls when no seed is given."""
+        if seed is not None:
+            return self.circuit.compile_sampler(seed=int(seed))
+        if self._measurement_sampler is None:
+            self._measurement_sampler = self.circuit.compile_sampler()
+        return self._measurement_sampler
+
+    def _estimate_nbytes(self) -> int:
+        # Rough footprint: the textual circuit and DEM track the size of their compiled forms, the
+        # samplers hold roughly one more copy of the circuit, and each matching edge costs ~64 bytes.
+        circuit_bytes = len(str(self.circuit))
+        dem_bytes = len(str(self.detector_error_model))
+        num_edges = getattr(self.matching, 'num_edges', 0) if self.matching is not None else 0
+        return 2 * circuit_bytes + dem_bytes + 64 * int(num_edges)
+
+
+class DecodingCache:
+    """
+    Thread-safe LRU cache of DecodingProblem objects bounded by entry count and estimated bytes.
+
+    Keys are canonical hashes of the stabilizer layout, the mapping and the noise model (see
+    make_key), so the same mapping revisited in a later step, episode or environment of the same
+    process reuses the compiled circuit, matching graph and samplers.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._entries: 'OrderedDict[str, DecodingProblem]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """Update the size limits, evicting entries immediately if the cache is now too large."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = int(max_entries)
+            if max_bytes is not None:
+                self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def get(self, key: str) -> Optional[DecodingProblem]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: DecodingProblem) -> None:
+        with self._lock:
+            if self.max_entries <= 0 or entry.nbytes > self.max_bytes:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._entries[key] = entry
+            self.nbytes += entry.nbytes
+            self._evict()
+
+    def clear(self, reset_stats: bool = True) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            if reset_stats:
+                self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self.nbytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self.nbytes -= entry.nbytes
+            self.evictions += 1
+
+    @staticmethod
+    def make_key(layout, mapping, noise_model, error_prob: float, logical_op_type: str) -> Optional[str]:
+        """
+        Canonical hash of everything that determines the decoding problem; dict insertion order
+        does not change the key. Returns None for layout objects that do not expose a stabilizer
+        map, since their circuit cannot be identified by content.
+        """
+        if hasattr(layout, 'to_stim_circuit'):
+            if getattr(layout, 'stabilizer_map', None) is None:
+                return None
+            layout_part = (
+                type(layout).__name__,
+                getattr(layout, 'code_distance', None),
+                getattr(layout, 'qubit_layout', None),
+                layout.stabilizer_map,
+                getattr(layout, 'logical_operators', None),
+            )
+        else:
+            layout_part = ('fallback', layout.get('code_distance', 3) if isinstance(layout, dict) else 3, float(error_prob))
+        payload = repr(_canonical((layout_part, mapping, noise_model, str(logical_op_type))))
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _canonical(obj):
+    """Recursively convert obj into a deterministic, order-independent structure of builtins."""
+    if isinstance(obj, dict):
+        return ('d', tuple(sorted(((repr(k), _canonical(v)) for k, v in obj.items()), key=lambda kv: kv[0])))
+    if isinstance(obj, (list, tuple)):
+        return ('l', tuple(_canonical(v) for v in obj))
+    if isinstance(obj, (set, frozenset)):
+        return ('s', tuple(sorted(repr(_canonical(v)) for v in obj)))
+    if isinstance(obj, np.ndarray):
+        return ('l', tuple(_canonical(v) for v in obj.tolist()))
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    return repr(obj)
+
+
+_DEFAULT_CACHE = DecodingCache()
+
+
+def get_decoding_cache() -> DecodingCache:
+    """Process-wide cache shared by every DecoderInterface caller."""
+    return _DEFAULT_CACHE
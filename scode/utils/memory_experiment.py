@@ -0,0 +1,227 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+from typing import Any, Dict, List, Optional
+
+try:
+    import stim
+except ImportError:
+    stim = None
+
+
+class NoiseParameters:
+    """
+    Resolves per-qubit and per-gate error probabilities from a noise model dict.
+
+    Recognised keys:
+        p: base error probability used when nothing more specific is known (default 0.001)
+        qubit_properties: {physical_qubit: {'readout_error': ..., 'reset_error': ..., 'idle_error': ...}}
+        gate_error_rates: {gate_name: error}, e.g. {'cx': 0.009, 'sx': 0.0003, 'id': 0.0001}
+    """
+    TWO_QUBIT_GATES = ('cx', 'cnot', 'cz', 'ecr')
+    SINGLE_QUBIT_GATES = ('h', 'sx', 'x')
+    IDLE_GATES = ('id',)
+
+    def __init__(self, noise_model: Optional[Dict[str, Any]] = None):
+        noise_model = noise_model or {}
+        self.p = float(noise_model.get('p', 0.001))
+        self.qubit_properties = noise_model.get('qubit_properties') or {}
+        self.gate_error_rates = {str(k).lower(): float(v) for k, v in (noise_model.get('gate_error_rates') or {}).items()}
+
+    def _qubit_value(self, qubit: int, key: str) -> Optional[float]:
+        props = self.qubit_properties.get(qubit, self.qubit_properties.get(str(qubit)))
+        if not isinstance(props, dict) or props.get(key) is None:
+            return None
+        return float(props[key])
+
+    def _gate_value(self, names) -> float:
+        for name in names:
+            if name in self.gate_error_rates:
+                return self.gate_error_rates[name]
+        return self.p
+
+    def readout(self, qubit: int) -> float:
+        value = self._qubit_value(qubit, 'readout_error')
+        return self.p if value is None else value
+
+    def reset(self, qubit: int) -> float:
+        value = self._qubit_value(qubit, 'reset_error')
+        return self.p if value is None else value
+
+    def idle(self, qubit: int) -> float:
+        value = self._qubit_value(qubit, 'idle_error')
+        return self._gate_value(self.IDLE_GATES) if value is None else value
+
+    def single_qubit_gate(self) -> float:
+        return self._gate_value(self.SINGLE_QUBIT_GATES)
+
+    def two_qubit_gate(self) -> float:
+        return self._gate_value(self.TWO_QUBIT_GATES)
+
+
+class MemoryExperimentBuilder:
+    """
+    Builds a multi-round memory-experiment stim circuit for a stabilizer code layout.
+
+    Each round measures every X stabilizer and then every Z stabilizer with a dedicated ancilla.
+    Detectors compare consecutive measurements of the same stabilizer, and the final data-qubit
+    readout closes the stabilizers of the memory basis and defines logical observable 0.
+    Only detectors and observables that are deterministic in the noiseless circuit are emitted,
+    so irregular layouts still yield a valid detector error model.
+    """
+
+    def __init__(self, qubit_layout: Dict[int, Dict[str, Any]], stabilizer_map: Dict[str, List],
+                 logical_operators: Dict[str, List[int]], data_qubits: List[int]):
+        self.qubit_layout = qubit_layout
+        self.stabilizer_map = stabilizer_map
+        self.logical_operators = logical_operators
+        self.data_qubits = data_qubits
+
+    def build(self, mapping: Optional[Dict[int, int]], noise_model: Optional[Dict[str, Any]] = None,
+              rounds: int = 1, basis: str = 'Z') -> 'stim.Circuit':
+        """
+        Args:
+            mapping: code-qubit to physical-qubit mapping (identity if empty)
+            noise_model: noise model dict, see NoiseParameters
+            rounds: number of syndrome-extraction rounds (at least 1)
+            basis: memory basis, 'Z' or 'X'
+        Returns:
+            stim.Circuit with DETECTOR and OBSERVABLE_INCLUDE annotations
+        """
+        if stim is None:
+            raise ImportError("stim is required to build memory-experiment circuits")
+        basis = basis.upper()
+        if basis not in ('X', 'Z'):
+            raise ValueError(f"Memory basis must be 'X' or 'Z', got {basis}")
+        rounds = max(1, int(rounds))
+        other = 'X' if basis == 'Z' else 'Z'
+        qubit_map = mapping if mapping else {q: q for q in self.qubit_layout}
+        noise = NoiseParameters(noise_model)
+
+        data = [qubit_map[q] for q in self.data_qubits if q in qubit_map]
+        observable = self._support([q for q in self.logical_operators.get(basis, []) if q in qubit_map], qubit_map)
+        stabs = {t: self._mapped_stabilizers(t, qubit_map) for t in ('X', 'Z')}
+        # Stabilizers of the other type that anticommute with the observable would randomise it
+        if observable:
+            stabs[other] = [s for s in stabs[other] if len(s['support'] & observable) % 2 == 0]
+        for t, o in (('X', 'Z'), ('Z', 'X')):
+            for s in stabs[t]:
+                s['stable'] = all(len(s['support'] & o_s['support']) % 2 == 0 for o_s in stabs[o])
+
+        circuit = stim.Circuit()
+        for q, info in self.qubit_layout.items():
+            if q in qubit_map:
+                circuit.append("QUBIT_COORDS", [qubit_map[q]], [float(info.get('x', 0.0)), float(info.get('y', 0.0))])
+        ancillas = [s['ancilla'] for t in ('X', 'Z') for s in stabs[t]]
+        self._reset(circuit, data + ancillas, noise)
+        if basis == 'X':
+            self._single_qubit_layer(circuit, "H", data, noise)
+        circuit.append("TICK")
+
+        measured = 0
+        last = {}
+        for r in range(rounds):
+            for q in data:
+                circuit.append("DEPOLARIZE1", [q], noise.idle(q))
+            for stab_type in ('X', 'Z'):
+                layer = stabs[stab_type]
+                if not layer:
+                    continue
+                anc = [s['ancilla'] for s in layer]
+                if stab_type == 'X':
+                    self._single_qubit_layer(circuit, "H", anc, noise)
+                for s in layer:
+                    for dq in s['data']:
+                        pair = [s['ancilla'], dq] if stab_type == 'X' else [dq, s['ancilla']]
+                        circuit.append("CNOT", pair)
+                        circuit.append("DEPOLARIZE2", pair, noise.two_qubit_gate())
+                if stab_type == 'X':
+                    self._single_qubit_layer(circuit, "H", anc, noise)
+                self._measure_reset(circuit, anc, noise)
+                base = measured
+                measured += len(layer)
+                for k, s in enumerate(layer):
+                    key = (stab_type, s['ancilla'])
+                    current = base + k
+                    recs = None
+                    if key in last:
+                        if s['stable']:
+                            recs = [current, last[key]]
+                    elif stab_type == basis and s['stable']:
+                        recs = [current]
+                    if recs is not None:
+                        coords = self._coords(s['ancilla_sc']) + [float(r)]
+                        circuit.append("DETECTOR", [stim.target_rec(i - measured) for i in recs], coords)
+                    last[key] = current
+            circuit.append("TICK")
+
+        # Final readout of the data qubits in the memory basis
+        if basis == 'X':
+            self._single_qubit_layer(circuit, "H", data, noise)
+        data_rec = {}
+        for q in data:
+            circuit.append("M", [q], noise.readout(q))
+            data_rec[q] = measured
+            measured += 1
+        for s in stabs[basis]:
+            if not s['stable']:
+                continue
+            key = (basis, s['ancilla'])
+            recs = [data_rec[dq] for dq in s['data']] + [last[key]]
+            coords = self._coords(s['ancilla_sc']) + [float(rounds)]
+            circuit.append("DETECTOR", [stim.target_rec(i - measured) for i in recs], coords)
+        if observable:
+            circuit.append("OBSERVABLE_INCLUDE", [stim.target_rec(data_rec[q] - measured) for q in sorted(observable)], 0)
+        return circuit
+
+    def _mapped_stabilizers(self, stab_type: str, qubit_map: Dict[int, int]) -> List[Dict[str, Any]]:
+        result = []
+        for stab in self.stabilizer_map.get(stab_type, []):
+            if not isinstance(stab, dict):
+                continue
+            anc = stab.get('ancilla')
+            dqs = stab.get('data_qubits', [])
+            if anc not in qubit_map or not dqs or any(q not in qubit_map for q in dqs):
+                continue
+            mapped = [qubit_map[q] for q in dqs]
+            result.append({
+                'ancilla': qubit_map[anc],
+                'ancilla_sc': anc,
+                'data': mapped,
+                'support': self._support(dqs, qubit_map),
+            })
+        return result
+
+    @staticmethod
+    def _support(qubits: List[int], qubit_map: Dict[int, int]) -> set:
+        # Qubits listed an even number of times cancel out of a Pauli product
+        support = set()
+        for q in qubits:
+            support ^= {qubit_map[q]}
+        return support
+
+    def _coords(self, q: int) -> List[float]:
+        info = self.qubit_layout.get(q, {})
+        return [float(info.get('x', 0.0)), float(info.get('y', 0.0))]
+
+    @staticmethod
+    def _reset(circuit, qubits: List[int], noise: NoiseParameters) -> None:
+        if not qubits:
+            return
+        circuit.append("R", qubits)
+        for q in qubits:
+            circuit.append("X_ERROR", [q], noise.reset(q))
+
+    @staticmethod
+    def _single_qubit_layer(circuit, gate: str, qubits: List[int], noise: NoiseParameters) -> None:
+        if not qubits:
+            return
+        circuit.append(gate, qubits)
+        circuit.append("DEPOLARIZE1", qubits, noise.single_qubit_gate())
+
+    @staticmethod
+    def _measure_reset(circuit, qubits: List[int], noise: NoiseParameters) -> None:
+        for q in qubits:
+            circuit.append("MR", [q], noise.readout(q))
+        for q in qubits:
+            circuit.append("X_ERROR", [q], noise.reset(q))
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import itertools
+import sys
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, TextIO
+
+LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40, 'off': 100}
+DEBUG, INFO, WARNING, ERROR = LEVELS['debug'], LEVELS['info'], LEVELS['warning'], LEVELS['error']
+_LEVEL_NAMES = {v: k.upper() for k, v in LEVELS.items()}
+
+
+class TraceSink:
+    """
+    Level-gated trace records for the RL hot path (environment, reward engine, decoder).
+
+    Records below the configured level are dropped before their message is formatted, so a
+    disabled call costs one attribute comparison. Accepted records are formatted immediately
+    (arguments such as mappings are mutated by later steps) and appended to a fixed-size ring
+    buffer; deque appends are atomic, so emitters never take a lock. Debug records can be
+    sampled per channel (keep every N-th) and every record can optionally be echoed to stdout
+    in the legacy '[LEVEL][channel] message' format. dump() writes the buffer on demand.
+    """
+
+    def __init__(self, level: str = 'warning', capacity: int = 4096, sample_every: int = 1, echo: bool = False):
+        self.threshold = LEVELS['warning']
+        self.sample_every = 1
+        self.echo = False
+        self._records: deque = deque(maxlen=capacity)
+        self._counters: Dict[str, Any] = {}
+        self.configure(level=level, capacity=capacity, sample_every=sample_every, echo=echo)
+
+    def configure(self, level: Optional[str] = None, capacity: Optional[int] = None,
+                  sample_every: Optional[int] = None, echo: Optional[bool] = None) -> None:
+        """Update the sink settings; a new capacity keeps the most recent records."""
+        if level is not None:
+            if str(level).lower() not in LEVELS:
+                raise ValueError(f"Unknown trace level '{level}'. Use one of: {list(LEVELS)}")
+            self.threshold = LEVELS[str(level).lower()]
+        if capacity is not None and int(capacity) != self._records.maxlen:
+            self._records = deque(self._records, maxlen=max(1, int(capacity)))
+        if sample_every is not None:
+            self.sample_every = max(1, int(sample_every))
+            self._counters = {}
+        if echo is not None:
+            self.echo = bool(echo)
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.threshold
+
+    def emit(self, channel: str, level: int, msg: str, *args) -> None:
+        """Record `msg % args` on `channel` if `level` passes the threshold (and the sampler)."""
+        if level < self.threshold:
+            return
+        if level == DEBUG and self.sample_every > 1:
+            counter = self._counters.get(channel)
+            if counter is None:
+                counter = self._counters.setdefault(channel, itertools.count())
+            if next(counter) % self.sample_every:
+                return
+        text = msg % args if args else msg
+        record = (time.time(), channel, level, text)
+        self._records.append(record)
+        if self.echo:
+            print(self._format(record, timestamp=False))
+
+    def debug(self, channel: str, msg: str, *args) -> None:
+        if DEBUG >= self.threshold:
+            self.emit(channel, DEBUG, msg, *args)
+
+    def info(self, channel: str, msg: str, *args) -> None:
+        if INFO >= self.threshold:
+            self.emit(channel, INFO, msg, *args)
+
+    def warning(self, channel: str, msg: str, *args) -> None:
+        if WARNING >= self.threshold:
+            self.emit(channel, WARNING, msg, *args)
+
+    def error(self, channel: str, msg: str, *args) -> None:
+        if ERROR >= self.threshold:
+            self.emit(channel, ERROR, msg, *args)
+
+    def records(self, channel: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Snapshot of the buffered records, oldest first."""
+        return [{'time': t, 'channel': c, 'level': _LEVEL_NAMES.get(lvl, str(lvl)), 'message': m}
+                for t, c, lvl, m in list(self._records) if channel is None or c == channel]
+
+    def dump(self, stream: Optional[TextIO] = None, clear: bool = False) -> int:
+        """
+        Write the buffered records to `stream` (stdout by default).
+        Returns:
+            Number of records written
+        """
+        stream = stream or sys.stdout
+        records = list(self._records)
+        for record in records:
+            stream.write(self._format(record) + '\n')
+        if clear:
+            self.clear()
+        return len(records)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    @staticmethod
+    def _format(record, timestamp: bool = True) -> str:
+        t, channel, level, text = record
+        prefix = time.strftime('%H:%M:%S', time.localtime(t)) + f'.{int((t % 1) * 1000):03d} ' if timestamp else ''
+        return f"{prefix}[{_LEVEL_NAMES.get(level, level)}][{channel}] {text}"
+
+
+_TRACE_SINK = TraceSink()
+
+
+def get_trace_sink() -> TraceSink:
+    """Process-wide trace sink (each SubprocVecEnv worker has its own)."""
+    return _TRACE_SINK
+
+
+def configure_trace(config: Optional[Dict[str, Any]]) -> TraceSink:
+    """
+    Configure the process-wide sink from a trace config section:
+        level (debug|info|warning|error|off), capacity, sample_every, echo
+    """
+    config = config or {}
+    _TRACE_SINK.configure(level=config.get('level'), capacity=config.get('capacity'),
+                          sample_every=config.get('sample_every'), echo=config.get('echo'))
+    return _TRACE_SINK
@@ -0,0 +1,20 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import pytest
+
+from hardware_abstraction.device_geometry import DeviceGeometry
+from scode.multi_patch_mapper.mapping_problem import MappingProblem
+
+# 3x3 grid device, logical path a-b-c-d
+GRID = {'max_qubits': 9, 'qubit_connectivity': {q: [n for n in (q - 3, q + 3, q - 1 if q % 3 else -1,
+                                                                q + 1 if q % 3 != 2 else -1) if 0 <= n < 9]
+                                                for q in range(9)}}
+ERRORS = {q: {'readout_error': 0.01 * q} for q in range(9)}
+NEIGHBORS = {'a': ['b'], 'b': ['a', 'c'], 'c': ['b', 'd'], 'd': ['c']}
+
+
+@pytest.fixture
+def path_problem():
+    """MappingProblem of the logical path a-b-c-d on the 3x3 grid, readout error 0.01 * qubit."""
+    return MappingProblem(list(NEIGHBORS), NEIGHBORS, list(range(9)), DeviceGeometry.build(GRID), ERRORS)
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+nx = pytest.importorskip('networkx')
+
+from scode.rl_agent.action_masks import ActionMaskBuilder
+
+MAX_QUBITS = 16
+
+
+def _setup(seed=0):
+    rng = random.Random(seed)
+    hw = nx.convert_node_labels_to_integers(nx.grid_2d_graph(4, 5))
+    connectivity = {q: list(hw.neighbors(q)) for q in hw.nodes()}
+    codes = [SimpleNamespace(adjacency_matrix=nx.cycle_graph(9)), SimpleNamespace(adjacency_matrix=nx.path_graph(6))]
+    hw_qubits = list(hw.nodes())
+    rng.shuffle(hw_qubits)
+    mappings = [dict(zip(range(9), hw_qubits[:9])), dict(zip(range(6), hw_qubits[9:15]))]
+    return hw, connectivity, codes, mappings
+
+
+def _reference(hw, codes, mappings, rule_fns):
+    masks = np.zeros((len(mappings), 3, MAX_QUBITS, MAX_QUBITS), dtype=np.float32)
+    for i, mapping in enumerate(mappings):
+        for a_type, legal in enumerate(rule_fns):
+            for q1 in mapping:
+                for q2 in mapping:
+                    if q1 != q2 and legal(hw, codes[i], mapping, q1, q2):
+                        masks[i, a_type, q1, q2] = 1.0
+    return masks.reshape(len(mappings) * 3, MAX_QUBITS, MAX_QUBITS)
+
+
+def _hw_adjacent(hw, code, mapping, q1, q2):
+    return hw.has_edge(mapping[q1], mapping[q2])
+
+
+def _code_edge(hw, code, mapping, q1, q2):
+    return code.adjacency_matrix.has_edge(q1, q2)
+
+
+def _rewire_target(hw, code, mapping, q1, q2):
+    used = set(mapping.values())
+    return any(n not in used for n in hw.neighbors(mapping[q2]))
+
+
+def test_qldpc_rules_match_reference_loops():
+    hw, connectivity, codes, mappings = _setup()
+    builder = ActionMaskBuilder(connectivity, MAX_QUBITS, rules=('hw_adjacent', 'hw_adjacent', 'code_edge'))
+    masks = builder.get(mappings, 2, codes)
+    np.testing.assert_array_equal(masks, _reference(hw, codes, mappings, (_hw_adjacent, _hw_adjacent, _code_edge)))
+
+
+def test_connectivity_rules_track_placement_changes():
+    hw, connectivity, codes, mappings = _setup(1)
+    builder = ActionMaskBuilder(connectivity, MAX_QUBITS, rules=('mapped', 'rewire_target', 'gate_edge'))
+    rules = (lambda *a: True, _rewire_target, lambda *a: _code_edge(*a) and _hw_adjacent(*a))
+    builder.get(mappings, 2, codes)
+    mappings[0][0], mappings[0][1] = mappings[0][1], mappings[0][0]
+    masks = builder.get(mappings, 2, codes)
+    np.testing.assert_array_equal(masks, _reference(hw, codes, mappings, rules))
+
+
+def test_mapped_rule_is_cached_until_mapped_set_changes():
+    hw, connectivity, codes, mappings = _setup(2)
+    builder = ActionMaskBuilder(connectivity, MAX_QUBITS)
+    masks = builder.get(mappings, 2, codes)
+    version = builder.version
+    # A swap keeps the mapped set, so nothing is rebuilt
+    mappings[1][0], mappings[1][1] = mappings[1][1], mappings[1][0]
+    assert builder.get(mappings, 2, codes) is masks and builder.version == version
+    del mappings[1][5]
+    masks = builder.get(mappings, 2, codes)
+    assert builder.version == version + 1
+    assert not masks[3:6, 5].any() and not masks[3:6, :, 5].any()
+    np.testing.assert_array_equal(masks, _reference(hw, codes, mappings, (lambda *a: True,) * 3))
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import numpy as np
+import pytest
+
+from scode.multi_patch_mapper.annealing import simulated_annealing, temperatures
+
+
+def test_cost_counts_neighbour_entries_with_hop_distance(path_problem):
+    # a..d on 0, 2, 8, 6: hops 2, 2, 2, each edge listed in both directions
+    assignment = np.array([0, 2, 8, 6])
+    assert path_problem.cost(assignment) == pytest.approx(2 * 6 + 10 * 0.01 * 16)
+    assert path_problem.costs(np.stack([assignment, assignment]))[1] == pytest.approx(path_problem.cost(assignment))
+
+
+def test_move_delta_matches_full_cost(path_problem):
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        perm = rng.permutation(9)
+        assignment = perm[:4].copy()
+        a, b = rng.choice(4, size=2, replace=False)
+        swapped = assignment.copy()
+        swapped[a], swapped[b] = assignment[b], assignment[a]
+        delta = path_problem.move_delta(assignment, a, assignment[b], exclude=b) + \
+            path_problem.move_delta(assignment, b, assignment[a], exclude=a)
+        assert delta == pytest.approx(path_problem.cost(swapped) - path_problem.cost(assignment))
+        moved = assignment.copy()
+        moved[a] = perm[5]
+        assert path_problem.move_delta(assignment, a, perm[5]) == pytest.approx(path_problem.cost(moved) - path_problem.cost(assignment))
+
+
+def test_annealing_reaches_a_nearest_neighbour_path_and_is_seeded(path_problem):
+    params = {'seed': 3, 'restarts': 2}
+    assignment, cost, stats = simulated_annealing(path_problem, params)
+    assert len(set(assignment.tolist())) == 4 and len(stats['restart_costs']) == 2
+    assert cost == pytest.approx(path_problem.cost(assignment))
+    # Three unit-hop edges counted twice, plus the readout-error term
+    assert cost < 2 * 3 + 10 * 0.01 * 16
+    again, _, _ = simulated_annealing(path_problem, params)
+    assert np.array_equal(assignment, again)
+
+
+def test_schedules():
+    assert len(temperatures(1.0, 1e-3, 0.95)) == 135
+    linear = temperatures(1.0, 0.1, 0.9, schedule='linear', num_temperatures=10)
+    assert linear[0] == 1.0 and linear[-1] == pytest.approx(0.1)
+    with pytest.raises(ValueError):
+        temperatures(1.0, 0.1, 0.9, schedule='cosine')
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import json
+import os
+
+import numpy as np
+
+from scode.rl_agent.artifact_index import INDEX_FILENAME, ArtifactIndex, parse_artifact_name
+
+
+def _artifact(directory, name, payload=b'policy'):
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(payload)
+    return path
+
+
+def test_register_and_lookup_exact_fields(tmp_path):
+    index = ArtifactIndex(str(tmp_path))
+    d3 = _artifact(str(tmp_path), 'a.zip')
+    d33 = _artifact(str(tmp_path), 'b.zip')
+    index.register(d3, 'IBM', 'ibm_hummingbird', 'rotated', 3, patch_count=2, metrics={'final_reward': np.float32(0.5)})
+    index.register(d33, 'ibm', 'ibm_hummingbird', 'rotated', 33, patch_count=2)
+    entry = index.lookup('ibm', 'ibm_hummingbird', 'rotated', 3, patch_count=2, curriculum_stage=1, code_family='surface')
+    assert entry['path'] == d3 and entry['metrics']['final_reward'] == 0.5 and len(entry['sha256']) == 64
+    assert index.lookup(device='ibm_hummingbird', code_distance=33)['path'] == d33
+    assert index.lookup(device='ibm_hummingbird', code_distance=5) is None
+    # The manifest is persisted and shared by new instances
+    assert json.load(open(tmp_path / INDEX_FILENAME))['version'] == 1
+    assert len(ArtifactIndex(str(tmp_path)).entries()) == 2
+
+
+def test_highest_stage_and_newest_version_win(tmp_path):
+    index = ArtifactIndex(str(tmp_path))
+    for name, stage in (('s1.zip', 1), ('s2_old.zip', 2), ('s2_new.zip', 2)):
+        index.register(_artifact(str(tmp_path), name), 'ibm', 'dev', 'planar', 3, curriculum_stage=stage)
+    assert os.path.basename(index.lookup(device='dev', layout_type='planar')['path']) == 's2_new.zip'
+    assert os.path.basename(index.lookup(device='dev', curriculum_stage=1)['path']) == 's1.zip'
+
+
+def test_verify_skips_modified_artifacts(tmp_path):
+    index = ArtifactIndex(str(tmp_path))
+    path = _artifact(str(tmp_path), 'x.zip')
+    index.register(path, 'ibm', 'dev', 'rotated', 3)
+    _artifact(str(tmp_path), 'x.zip', b'tampered')
+    assert index.lookup(device='dev')['path'] == path
+    assert index.lookup(device='dev', verify=True) is None
+
+
+def test_unindexed_artifacts_are_picked_up_from_names(tmp_path):
+    name = 'ibm_mock_ibm_falcon_surface_rotated_d5_patches2_stage3_sb3_ppo_20250610_153447.zip'
+    assert parse_artifact_name(name) == {'provider': 'ibm', 'device': 'mock_ibm_falcon', 'code_family': 'surface',
+                                         'layout_type': 'rotated', 'code_distance': 5, 'patch_count': 2,
+                                         'curriculum_stage': 3}
+    assert parse_artifact_name('ibm_ibmq_jakarta_planar_d3_sb3_ppo_surface_code.zip')['patch_count'] == 1
+    assert parse_artifact_name('notes.zip') is None
+    _artifact(str(tmp_path), name)
+    index = ArtifactIndex(str(tmp_path))
+    assert index.lookup(device='mock_ibm_falcon', code_distance=5)['curriculum_stage'] == 3
+
+
+def test_caller_lookups_use_secondary_index_and_misses_sync_once(tmp_path, monkeypatch):
+    index = ArtifactIndex(str(tmp_path))
+    for name, stage, family in (('q.zip', 4, 'qldpc'), ('s1.zip', 1, 'surface'), ('s2.zip', 2, 'surface')):
+        index.register(_artifact(str(tmp_path), name), 'ibm', 'dev', 'rotated', 3, patch_count=2,
+                       curriculum_stage=stage, code_family=family)
+    index.register(_artifact(str(tmp_path), 'p1.zip'), 'ibm', 'dev', 'rotated', 3, patch_count=1)
+    # No full scan of the manifest for the partial keys the mapper and the API look up
+    monkeypatch.setattr(index, '_entries', _NoIteration(index._entries))
+    assert os.path.basename(index.lookup('ibm', 'dev', 'rotated', 3, patch_count=2, code_family='surface')['path']) == 's2.zip'
+    assert os.path.basename(index.lookup(provider=None, device='dev', layout_type='rotated', code_distance=3,
+                                         patch_count=1)['path']) == 'p1.zip'
+    monkeypatch.undo()
+    calls = []
+    original_sync = index.sync
+    monkeypatch.setattr(index, 'sync', lambda: calls.append(1) or original_sync())
+    assert index.lookup('ibm', 'dev', 'rotated', 5, patch_count=2) is None
+    assert index.lookup('ibm', 'dev', 'rotated', 5, patch_count=2) is None
+    assert len(calls) == 1
+    os.utime(str(tmp_path), ns=(1, 1))  # make the change visible on filesystems with coarse timestamps
+    _artifact(str(tmp_path), 'ibm_dev_surface_rotated_d5_patches2_stage1_sb3_ppo_20250101_000000.zip')
+    assert index.lookup('ibm', 'dev', 'rotated', 5, patch_count=2)['code_distance'] == 5
+    assert len(calls) == 2
+
+
+class _NoIteration(dict):
+    def values(self):
+        raise AssertionError('manifest scanned')
+
+    def items(self):
+        raise AssertionError('manifest scanned')
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import pytest
+
+pytest.importorskip('networkx')
+pytest.importorskip('stim')
+
+from scode.scripts.benchmark_replay import compare, run_case
+
+CASE = {'device': 'ibm:ibmq_jakarta', 'layout_type': 'rotated', 'code_distance': 3, 'patch_count': 1}
+
+
+def test_replay_is_deterministic():
+    first = run_case(CASE, seed=7, episodes=2, steps=10, ler_mode='off')
+    second = run_case(CASE, seed=7, episodes=2, steps=10, ler_mode='off')
+    assert first['rewards'] == second['rewards']
+    assert first['reward_digest'] == second['reward_digest']
+    assert first['steps'] == 20 and first['reset_ms'] > 0
+
+
+def test_compare_flags_regressions():
+    base = {'key': 'k', 'seed': 0, 'reward_digest': 'abc', 'steps_per_s': 100.0, 'reset_ms': 10.0,
+            'peak_rss_kb': 1000}
+    assert compare([dict(base, steps_per_s=90.0)], [base], 0.2, 0.2) == []
+    regressions = compare([dict(base, steps_per_s=50.0, reward_digest='def')], [base], 0.2, 0.2)
+    assert len(regressions) == 2
+    assert compare([dict(base, key='other', steps_per_s=1.0)], [base], 0.2, 0.2) == []
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import os
+
+import pytest
+
+sb3 = pytest.importorskip('stable_baselines3')
+import gymnasium as gym
+
+from scode.rl_agent.checkpointing import (PeriodicCheckpointCallback, checkpoint_steps, find_latest_checkpoint,
+                                          resolve_resume_checkpoint)
+
+
+def _model(env):
+    return sb3.PPO('MlpPolicy', env, n_steps=32, batch_size=32, n_epochs=1, seed=0, device='cpu')
+
+
+def test_periodic_checkpoints_and_resume(tmp_path):
+    env = gym.make('CartPole-v1')
+    callback = PeriodicCheckpointCallback(str(tmp_path), save_interval=64, keep_last=2)
+    model = _model(env)
+    model.learn(total_timesteps=256, callback=callback)
+    saved = sorted(os.listdir(tmp_path))
+    assert len(saved) == 2 and not any(name.endswith('.tmp') for name in saved)
+    latest = find_latest_checkpoint(str(tmp_path))
+    assert latest == resolve_resume_checkpoint('latest', str(tmp_path))
+    assert checkpoint_steps(latest) == 256
+
+    resumed = sb3.PPO.load(latest, env=env, device='cpu')
+    assert resumed.num_timesteps == 256
+    resumed.learn(total_timesteps=64, callback=PeriodicCheckpointCallback(str(tmp_path), 64, keep_last=2),
+                  reset_num_timesteps=False)
+    assert checkpoint_steps(find_latest_checkpoint(str(tmp_path))) == 320
+
+
+def test_resolve_resume_checkpoint(tmp_path):
+    assert resolve_resume_checkpoint(None, str(tmp_path)) is None
+    assert resolve_resume_checkpoint('latest', str(tmp_path)) is None
+    with pytest.raises(FileNotFoundError):
+        resolve_resume_checkpoint(str(tmp_path / 'missing.zip'), str(tmp_path))
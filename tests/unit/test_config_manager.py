@@ -66,3 +66,55 @@ def test_save_config_fallback_to_user_dir(tmp_path, monkeypatch):
     with real_open(user_path, 'r') as f:
         loaded = f.read()
     assert ('__test_marker__' in loaded) or (json.loads(loaded).get('__test_marker__') is True if user_path.endswith('.json') else True)
+
+
+def test_parsed_config_cache_reuses_until_file_changes(tmp_path):
+    path = tmp_path / 'module.yaml'
+    path.write_text('a: 1\nnested: {items: [1, 2]}\n')
+    before = ConfigManager.cache_stats()
+    first = ConfigManager.load_config('module', config_path=str(path))
+    first['a'] = 99  # callers get their own copy
+    view = ConfigManager.get_config_view('module', config_path=str(path))
+    assert view['a'] == 1 and view['nested']['items'] == (1, 2)
+    with pytest.raises(TypeError):
+        view['a'] = 2
+    stats = ConfigManager.cache_stats()
+    assert stats['reloads'] == before['reloads'] + 1 and stats['hits'] >= before['hits'] + 1
+
+    path.write_text('a: 2\n')
+    os.utime(path, ns=(0, 1))  # mtime change is what invalidates, even with a coarse clock
+    assert ConfigManager.load_config('module', config_path=str(path)) == {'a': 2}
+    assert ConfigManager.cache_stats()['reloads'] == before['reloads'] + 2
+
+
+def test_hot_reload_and_validation_run_once_per_content(monkeypatch):
+    ConfigManager.load_registry()
+    ConfigManager.hot_reload_config('multi_patch_rl_agent')
+    reloads = ConfigManager.cache_stats()['reloads']
+    ConfigManager.get_config('multi_patch_rl_agent')
+    assert ConfigManager.cache_stats()['reloads'] == reloads
+    ConfigManager.hot_reload_config('multi_patch_rl_agent')
+    assert ConfigManager.cache_stats()['reloads'] == reloads + 1
+
+    monkeypatch.setattr(ConfigManager, '_validated', {})
+    first = ConfigManager.validate_config('multi_patch_rl_agent')
+    validations = ConfigManager.cache_stats()['validations']
+    assert ConfigManager.validate_config('multi_patch_rl_agent') == first
+    assert ConfigManager.cache_stats()['validations'] == validations
+
+
+def test_validation_cache_follows_schema_file_and_schema_path(tmp_path, monkeypatch):
+    ConfigManager.load_registry()
+    monkeypatch.setattr(ConfigManager, '_validated', {})
+    schema = tmp_path / 'multi_patch_rl_agent.schema.yaml'
+    schema.write_text('type: object\n')
+    monkeypatch.setattr(ConfigManager, '_schema_file', classmethod(lambda cls, module_name: str(schema)))
+    assert ConfigManager.validate_config('multi_patch_rl_agent') is True
+    validations = ConfigManager.cache_stats()['validations']
+    ConfigManager.validate_config('multi_patch_rl_agent', schema_path=str(tmp_path / 'other.schema.yaml'))
+    assert ConfigManager.cache_stats()['validations'] == validations + 1
+    # Editing the schema re-validates instead of returning the cached result
+    schema.write_text('type: object\nrequired: [missing_section]\n')
+    os.utime(schema, ns=(1, 1))
+    assert not ConfigManager.validate_config('multi_patch_rl_agent')
+    assert ConfigManager.cache_stats()['validations'] == validations + 2
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import pytest
+
+stim = pytest.importorskip('stim')
+pytest.importorskip('pymatching')
+
+from scode.utils.decoder_interface import DecoderInterface
+
+
+class _CircuitLayout:
+    """Minimal layout wrapping a fixed stim circuit."""
+    def __init__(self, circuit, logical_op):
+        self._circuit = circuit
+        self.logical_operators = {'Z': logical_op}
+
+    def to_stim_circuit(self, mapping, noise_model):
+        return self._circuit
+
+
+def test_batch_matches_per_shot_for_fixed_seed():
+    layout = {'code_distance': 5}
+    per_shot = DecoderInterface.estimate_logical_error_rate(layout, {}, {}, num_trials=3000, error_prob=0.05, batch=False, seed=11)
+    batch = DecoderInterface.estimate_logical_error_rate(layout, {}, {}, num_trials=3000, error_prob=0.05, batch=True, seed=11)
+    assert per_shot == batch
+
+
+def test_batch_matches_per_shot_for_annotated_circuit():
+    # Observables are decoded against the detector samples rather than raw measurements.
+    circuit = stim.Circuit("""
+        X_ERROR(0.2) 0 1 2
+        M 0 1
+        DETECTOR rec[-1] rec[-2]
+        OBSERVABLE_INCLUDE(0) rec[-2]
+        OBSERVABLE_INCLUDE(1) rec[-1]
+    """)
+    layout = _CircuitLayout(circuit, [0, 1])
+    per_shot = DecoderInterface.estimate_logical_error_rate(layout, {}, {}, num_trials=2000, batch=False, seed=4)
+    batch = DecoderInterface.estimate_logical_error_rate(layout, {}, {}, num_trials=2000, batch=True, seed=4)
+    assert per_shot == batch
+
+
+def test_batch_result_reports_confidence_interval():
+    result = DecoderInterface.estimate_logical_error_rate_batch({'code_distance': 3}, {}, {}, num_trials=2000, error_prob=0.1, seed=2)
+    assert result['num_trials'] == 2000
+    assert result['ler'] == result['logical_errors'] / 2000
+    assert 0.0 <= result['ci_low'] <= result['ler'] <= result['ci_high'] <= 1.0
+
+
+def test_wilson_interval_bounds():
+    low, high = DecoderInterface.wilson_interval(0, 100)
+    assert low == 0.0 and 0.0 < high < 0.1
+    low, high = DecoderInterface.wilson_interval(50, 100, confidence=0.99)
+    assert low < 0.5 < high
+
+
+def test_decoding_cache_reuses_compiled_problem():
+    DecoderInterface.clear_cache()
+    layout = {'code_distance': 3}
+    first = DecoderInterface.estimate_logical_error_rate(layout, {}, {}, num_trials=500, error_prob=0.1, seed=5)
+    second = DecoderInterface.estimate_logical_error_rate(layout, {}, {}, num_trials=500, error_prob=0.1, seed=5)
+    stats = DecoderInterface.cache_stats()
+    assert first == second
+    assert stats['misses'] == 1 and stats['hits'] == 1 and stats['entries'] == 1
+    # A different noise level is a different decoding problem
+    DecoderInterface.estimate_logical_error_rate(layout, {}, {}, num_trials=10, error_prob=0.2)
+    assert DecoderInterface.cache_stats()['entries'] == 2
+
+
+def test_decoding_cache_evicts_least_recently_used():
+    DecoderInterface.clear_cache()
+    DecoderInterface.configure_cache(max_entries=2)
+    try:
+        for p in (0.1, 0.2, 0.1, 0.3):
+            DecoderInterface.estimate_logical_error_rate({'code_distance': 3}, {}, {}, num_trials=10, error_prob=p)
+        stats = DecoderInterface.cache_stats()
+        assert stats['entries'] == 2 and stats['evictions'] == 1 and stats['hits'] == 1
+        # 0.1 was used more recently than 0.2, so it survives the eviction
+        DecoderInterface.estimate_logical_error_rate({'code_distance': 3}, {}, {}, num_trials=10, error_prob=0.1)
+        assert DecoderInterface.cache_stats()['hits'] == 2
+    finally:
+        DecoderInterface.configure_cache(max_entries=256)
+        DecoderInterface.clear_cache()
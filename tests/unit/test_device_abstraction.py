@@ -43,3 +43,30 @@ def test_validate_circuit_for_device_native_and_non_native():
     assert DeviceAbstraction.validate_circuit_for_device(native, provider, device) is True
     non_native = {'qubits': [0], 'gates': [{'name': 'h', 'qubits': [0]}]}
     assert DeviceAbstraction.validate_circuit_for_device(non_native, provider, device) is False
+
+
+def test_device_profile_is_memoized_and_frozen():
+    import numpy as np
+    import pytest
+    ConfigManager.load_registry()
+    hw = ConfigManager.load_hardware_json()
+    profile = DeviceAbstraction.get_device_profile(hw['provider_name'], hw['device_name'])
+    assert DeviceAbstraction.get_device_profile(hw['provider_name'], hw['device_name']) is profile
+    with pytest.raises(AttributeError):
+        profile.device_name = 'other'
+    with pytest.raises(TypeError):
+        profile.config['max_qubits'] = 1
+    n = len(profile.qubits)
+    assert profile.readout_error.shape == profile.t1.shape == profile.t2.shape == (n,)
+    assert not profile.readout_error.flags.writeable
+    assert profile.edge_index.shape[1] == 2 and (profile.edge_index[:, 0] < profile.edge_index[:, 1]).all()
+    conn = profile.config['qubit_connectivity']
+    u, v = profile.qubits[profile.edge_index[0]]
+    assert int(v) in conn[int(u)]
+    if 'qubit_properties' in profile.config:
+        assert np.isfinite(profile.readout_error).all()
+
+    # Every caller gets its own mutable copy of the same profile
+    first = DeviceAbstraction.load_selected_device(ConfigManager.config_registry['hardware'])
+    first['max_qubits'] = -1
+    assert DeviceAbstraction.load_selected_device(ConfigManager.config_registry['hardware'])['max_qubits'] == profile.config['max_qubits']
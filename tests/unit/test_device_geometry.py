@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import os
+
+import numpy as np
+
+from hardware_abstraction.device_geometry import DeviceGeometry, _bfs_all_pairs, geometry_key
+
+# Path 0-1-2-3 (declared in one direction only) plus an isolated pair 10-11
+DEVICE = {'max_qubits': 6, 'qubit_connectivity': {'0': [1], '1': [2], '2': [3], '10': [11]}}
+
+
+def test_distances_adjacency_and_csr():
+    geometry = DeviceGeometry.build(DEVICE)
+    assert list(geometry.nodes) == [0, 1, 2, 3, 10, 11]
+    assert geometry.distance(0, 3) == 3 and geometry.distance(3, 0) == 3
+    assert geometry.distance(0, 10) == geometry.unreachable == 6
+    assert geometry.are_adjacent(2, 1) and not geometry.are_adjacent(0, 2)
+    assert sorted(geometry.neighbors(1)) == [0, 2]
+    assert list(geometry.indptr) == [0, 1, 3, 5, 6, 7, 8]
+
+
+def test_bfs_fallback_matches_scipy():
+    geometry = DeviceGeometry.build(DEVICE)
+    bfs = _bfs_all_pairs(geometry.indptr, geometry.indices, geometry.num_qubits)
+    assert np.array_equal(np.where(bfs < 0, geometry.unreachable, bfs), geometry.distances)
+
+
+def test_for_device_uses_memo_and_disk_cache(tmp_path):
+    DeviceGeometry.clear_memo()
+    first = DeviceGeometry.for_device(DEVICE, cache_dir=str(tmp_path))
+    assert DeviceGeometry.for_device(dict(DEVICE), cache_dir=str(tmp_path)) is first
+    assert os.path.exists(tmp_path / f"{geometry_key(DEVICE)}.npz")
+    DeviceGeometry.clear_memo()
+    loaded = DeviceGeometry.for_device(DEVICE, cache_dir=str(tmp_path))
+    assert loaded is not first and np.array_equal(loaded.distances, first.distances)
+    assert np.array_equal(loaded.adjacency, first.adjacency)
+    # A different coupling map is a different geometry
+    assert geometry_key({'max_qubits': 6, 'qubit_connectivity': {'0': [2]}}) != geometry_key(DEVICE)
+    DeviceGeometry.clear_memo()
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import pytest
+
+pytest.importorskip('networkx')
+
+from scode.heuristic_layer.surface_code import SurfaceCode
+
+# Synthetic LER per distance: not monotonic, so "lowest LER" and "first below target" differ
+LER_BY_DISTANCE = {3: 0.08, 5: 0.02, 7: 0.03, 9: 0.001, 11: 0.002}
+
+
+def _device(side=16):
+    n = side * side
+    conn = {str(q): [q2 for q2 in (q - side, q + side, q - 1 if q % side else -1, q + 1 if q % side < side - 1 else -1)
+                     if 0 <= q2 < n] for q in range(n)}
+    return {'device_name': 'grid', 'max_qubits': n, 'topology_type': 'grid', 'qubit_connectivity': conn}
+
+
+class _SyntheticSurfaceCode(SurfaceCode):
+    """Replaces code generation, mapping and LER estimation with a fixed LER table."""
+
+    def _evaluate_distance(self, d, layout_type, num_patches, mapping_constraints, sweep):
+        self.evaluated = getattr(self, 'evaluated', []) + [d]
+        if d == 7:
+            return None, None  # invalid distance is skipped
+        return LER_BY_DISTANCE[d], {'logical_to_physical': {0: d}}
+
+    def get_codes(self, code_distance, layout_type, num_patches=1):
+        return []
+
+
+def _select(workers, target_ler=None):
+    surface_code = _SyntheticSurfaceCode.from_configs({}, _device())
+    mapping = surface_code.get_multi_patch_mapping(None, 'rotated', {
+        'num_logical_qubits': 1, 'distance_sweep': {'workers': workers, 'target_ler': target_ler}})
+    return surface_code, (mapping['selected_code_distance'], mapping['selected_ler'], mapping['logical_to_physical'])
+
+
+def test_sequential_sweep_bounds_by_device_size_and_stops_at_target():
+    surface_code, selected = _select(workers=1)
+    # 2 * d^2 - 1 <= 256 admits d <= 11
+    assert surface_code.evaluated == [3, 5, 7, 9, 11]
+    assert selected == (9, 0.001, {0: 9})
+    surface_code, selected = _select(workers=1, target_ler=0.025)
+    assert surface_code.evaluated == [3, 5]
+    assert selected == (5, 0.02, {0: 5})
+
+
+@pytest.mark.parametrize('target_ler', [None, 0.025, 0.0])
+def test_parallel_sweep_matches_sequential(target_ler):
+    assert _select(workers=3, target_ler=target_ler)[1] == _select(workers=1, target_ler=target_ler)[1]
+
+
+def test_real_sweep_in_process_pool_matches_sequential(tmp_path):
+    """Real codes, RL-agent mapping (tiny freshly trained policy) and seeded LER, with and without workers."""
+    pytest.importorskip('stable_baselines3')
+    pytest.importorskip('stim')
+    pytest.importorskip('pymatching')
+    import contextlib
+    import io
+    import random
+
+    import numpy as np
+    from stable_baselines3 import PPO
+
+    from scode.scripts.benchmark_env_step import build_environment
+    with contextlib.redirect_stdout(io.StringIO()):
+        env = build_environment(3, 'rotated', 1, ler_evaluation={'mode': 'off'})
+        device = env.hardware_graph
+        PPO('MultiInputPolicy', env, n_steps=16, batch_size=16, n_epochs=1, seed=0).learn(16)\
+            .save(str(tmp_path / f"{device['provider_name'].lower()}_{device['device_name'].lower()}"
+                                 f"_surface_rotated_d3_patches1_stage1_sb3_ppo_test.zip"))
+        env.close()
+    overrides = {'multi_patch_rl_agent': {'training_artifacts': {'output_dir': str(tmp_path)},
+                                          'inference': {'num_rollouts': 1}}}
+    selections = []
+    for workers in (1, 2):
+        random.seed(123)
+        np.random.seed(123)
+        with contextlib.redirect_stdout(io.StringIO()):
+            mapping = SurfaceCode(config_overrides=overrides).get_multi_patch_mapping(
+                None, 'rotated', {'num_logical_qubits': 1,
+                                  'distance_sweep': {'workers': workers, 'seed': 5, 'num_trials': 500}})
+        # The caller's global RNG streams are left untouched by the seeded sweep
+        assert random.random() == random.Random(123).random()
+        assert np.random.random() == np.random.RandomState(123).random_sample()
+        selections.append((mapping['selected_code_distance'], mapping['selected_ler'], mapping['logical_to_physical']))
+    assert selections[0] == selections[1]
+    assert selections[0][0] == 3 and selections[0][2][0]
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import numpy as np
+import pytest
+
+from scode.multi_patch_mapper.genetic import genetic_algorithm, order_crossover, pmx_crossover
+
+
+@pytest.mark.parametrize('crossover', [order_crossover, pmx_crossover])
+def test_crossovers_return_permutations_keeping_the_segment(crossover):
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        p1, p2 = rng.permutation(9), rng.permutation(9)
+        c1, c2 = sorted(rng.integers(0, 10, size=2))
+        child = crossover(p1, p2, c1, c2)
+        assert sorted(child.tolist()) == list(range(9))
+        assert np.array_equal(child[c1:c2], p1[c1:c2])
+
+
+def test_pmx_keeps_parent_positions_outside_conflicts():
+    p1, p2 = np.array([0, 1, 2, 3, 4]), np.array([4, 3, 2, 1, 0])
+    assert pmx_crossover(p1, p2, 1, 3).tolist() == [4, 1, 2, 3, 0]
+    assert order_crossover(p1, p2, 1, 3).tolist() == [4, 1, 2, 3, 0]
+
+
+@pytest.mark.parametrize('crossover', ['order', 'pmx'])
+def test_genetic_algorithm_is_seeded_and_improves(crossover, path_problem):
+    params = {'seed': 5, 'pop_size': 20, 'generations': 30, 'crossover': crossover}
+    assignment, cost, stats = genetic_algorithm(path_problem, params)
+    assert len(set(assignment.tolist())) == 4
+    assert cost == pytest.approx(path_problem.cost(assignment))
+    history = stats['best_cost_per_generation']
+    assert len(history) == 30 and history[-1] <= history[0]
+    again, _, _ = genetic_algorithm(path_problem, params)
+    assert np.array_equal(assignment, again)
+
+
+def test_genetic_algorithm_process_pool_matches_in_process(path_problem):
+    params = {'seed': 2, 'pop_size': 12, 'generations': 5}
+    serial = genetic_algorithm(path_problem, params)
+    pooled = genetic_algorithm(path_problem, dict(params, workers=2))
+    assert np.array_equal(serial[0], pooled[0]) and serial[1] == pytest.approx(pooled[1])
+
+
+def test_genetic_algorithm_rejects_unknown_crossover(path_problem):
+    with pytest.raises(ValueError):
+        genetic_algorithm(path_problem, {'crossover': 'uniform'})
@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import random
+
+import pytest
+
+nx = pytest.importorskip("networkx")
+
+from scode.graph_transformer.graph_transformer import ConnectivityAwareGraphTransformer
+
+
+def _transformer(config=None):
+    return ConnectivityAwareGraphTransformer(config or {}, {}, [], {'cx': 0.01}, {})
+
+
+def _line(n, errors=None):
+    hw = nx.path_graph(n)
+    for q in hw.nodes:
+        hw.nodes[q]['error_rate'] = (errors or {}).get(q, 0.01)
+    return hw
+
+
+def test_optimize_adjacency_moves_onto_free_neighbour():
+    sc = nx.Graph([('a', 'b'), ('b', 'c')])
+    mapping = _transformer()._optimize_adjacency(sc, _line(5), {'a': 0, 'b': 4, 'c': 2})
+    assert mapping == {'a': 0, 'b': 1, 'c': 2}
+
+
+def test_optimize_adjacency_skips_high_error_qubits():
+    transformer = _transformer({'advanced_constraints': {'max_error_rate': 0.05}})
+    sc = nx.Graph([('a', 'b'), ('b', 'c')])
+    hw = _line(5, errors={1: 0.1})
+    mapping = transformer._optimize_adjacency(sc, hw, {'a': 0, 'b': 4, 'c': 2})
+    assert 1 not in mapping.values()
+    assert transformer._count_broken_edges(sc, hw, mapping) == 0
+
+
+def test_optimize_adjacency_improves_large_grid_and_stays_injective():
+    transformer = _transformer()
+    sc = nx.grid_2d_graph(21, 21)  # 441 qubits
+    hw = nx.grid_2d_graph(23, 23)
+    for q in hw.nodes:
+        hw.nodes[q]['error_rate'] = 0.01
+    hw_nodes = list(hw.nodes)
+    random.Random(0).shuffle(hw_nodes)
+    initial = dict(zip(sc.nodes, hw_nodes))
+    mapping = transformer._optimize_adjacency(sc, hw, initial)
+    assert len(set(mapping.values())) == len(mapping) == sc.number_of_nodes()
+    before = transformer._count_broken_edges(sc, hw, initial)
+    assert transformer._count_broken_edges(sc, hw, mapping) < 0.7 * before
+
+
+def test_annotated_graph_marks_used_edges_and_exports_arrays():
+    from scode.heuristic_layer.surface_code_object import SurfaceCodeObject
+    layout = {0: {'type': 'data', 'x': 0, 'y': 0}, 1: {'type': 'data', 'x': 1, 'y': 0},
+              2: {'type': 'ancilla_Z', 'x': 0.5, 'y': 0.5}}
+    code = SurfaceCodeObject(layout, {'X': [], 'Z': [{'ancilla': 2, 'data_qubits': [0, 1]}]},
+                             {'X': [0, 1], 'Z': [0, 1]}, nx.Graph(), 1, 'rotated')
+    transformer = _transformer()
+    graph = transformer._create_annotated_graph(_line(4), {0: 0, 2: 1, 1: 2}, code)
+    assert [graph.edges[e]['used'] for e in [(0, 1), (1, 2), (2, 3)]] == [True, True, False]
+    assert graph.nodes[1]['qubit_type'] == 'ancilla_Z'
+
+    arrays = transformer.annotated_graph_arrays(graph)
+    assert arrays['nodes'].tolist() == [0, 1, 2, 3]
+    assert arrays['mapped'].tolist() == [True, True, True, False]
+    assert arrays['qubit_type'].tolist() == ['data', 'ancilla_Z', 'data', 'unmapped']
+    assert arrays['edge_index'].shape == (3, 2) and arrays['used'].tolist() == [True, True, False]
+    assert arrays['original_x'][1] == 0.5 and arrays['original_x'][3] != arrays['original_x'][3]
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from scode.utils.lazy_import import LazyModule, is_available, lazy_import
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+HEAVY = ('torch', 'stable_baselines3', 'matplotlib', 'qiskit', 'pymatching', 'scipy')
+# Cumulative `python -X importtime` budget per entry point (ms); QCRAFT_IMPORT_BUDGET_MS overrides
+BUDGET_MS = float(os.environ.get('QCRAFT_IMPORT_BUDGET_MS', 600))
+
+
+def _import_in_subprocess(module):
+    code = f"import sys, json, {module}; print(json.dumps(sorted(m for m in {HEAVY!r} if m in sys.modules)))"
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    cumulative_us = None
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module and parts[2] == ' ' + module:
+            cumulative_us = int(parts[1])
+    return json.loads(proc.stdout.strip().splitlines()[-1]), cumulative_us
+
+
+@pytest.mark.parametrize('module', ['scode.api', 'orchestration_controller.orchestrator'])
+def test_entry_points_import_without_heavy_dependencies(module):
+    loaded, cumulative_us = _import_in_subprocess(module)
+    assert loaded == []
+    assert cumulative_us is not None and cumulative_us / 1000 < BUDGET_MS
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    proxy = lazy_import('json')
+    assert isinstance(proxy, LazyModule) and 'not loaded' in repr(proxy)
+    assert proxy.dumps([1]) == '[1]'
+    assert 'loaded' in repr(proxy) and 'not' not in repr(proxy)
+    assert is_available('json') and not is_available('qcraft_missing_module_xyz')
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import copy
+
+import pytest
+
+pytest.importorskip('networkx')
+
+import scode.heuristic_layer.surface_code  # noqa: F401  (import order of the heuristic layer package)
+from scode.heuristic_layer.heuristic_initialization_layer import HeuristicInitializationLayer
+from scode.heuristic_layer.layout_cache import LayoutCache
+
+
+def _device(n=25, side=5):
+    conn = {}
+    for q in range(n):
+        r, c = divmod(q, side)
+        conn[str(q)] = [q2 for q2 in (q - side, q + side, q - 1 if c else -1, q + 1 if c < side - 1 else -1)
+                        if 0 <= q2 < n]
+    return {'device_name': 'grid', 'max_qubits': n, 'topology_type': 'grid', 'qubit_connectivity': conn}
+
+
+def _layer(device, **cache_cfg):
+    config = {'multi_patch_rl_agent': {'environment': {'layout_cache': cache_cfg}}}
+    return HeuristicInitializationLayer(config, device)
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_cache():
+    LayoutCache.shared().clear()
+    yield
+    LayoutCache.shared().clear()
+
+
+def test_generate_returns_shared_frozen_code_per_content():
+    device = _device()
+    code = _layer(device).generate_surface_code(3, 'rotated')
+    assert code.frozen
+    assert _layer(copy.deepcopy(device)).generate_surface_code(3, 'rotated') is code
+    other = dict(device, qubit_properties={'0': {'readout_error': 0.05}})
+    assert _layer(other).generate_surface_code(3, 'rotated') is not code
+    with pytest.raises(TypeError):
+        code.qubit_layout[0] = {}
+    with pytest.raises(AttributeError):
+        code.code_distance = 5
+    code.is_valid = code.is_valid  # no-op re-assignment is allowed (environment reset path)
+
+
+def test_mutable_copy_and_disabled_cache_match_cached_layout():
+    device = _device()
+    cached = _layer(device).generate_surface_code(3, 'rotated')
+    clone = copy.deepcopy(cached)
+    assert not clone.frozen and clone.to_dict() == cached.to_dict()
+    clone.qubit_layout[0] = {}
+    clone.adjacency_matrix.add_edge(0, 1)
+    fresh = _layer(device, max_entries=0).generate_surface_code(3, 'rotated')
+    assert not fresh.frozen and fresh.to_dict() == cached.to_dict()
+
+
+def test_disk_cache_round_trip(tmp_path):
+    device = _device()
+    code = _layer(device, disk_cache=True, cache_dir=str(tmp_path)).generate_surface_code(3, 'rotated')
+    assert len(list(tmp_path.glob('*.json'))) == 1
+    LayoutCache.shared().clear()
+    misses = LayoutCache.shared().stats['misses']
+    loaded = _layer(device, disk_cache=True, cache_dir=str(tmp_path)).generate_surface_code(3, 'rotated')
+    assert LayoutCache.shared().stats['misses'] == misses
+    assert loaded is not code and loaded.frozen
+    assert loaded.to_dict() == code.to_dict()
+    assert sorted(loaded.adjacency_matrix.edges()) == sorted(code.adjacency_matrix.edges())
+
+
+def test_disk_hit_recomputes_supported_logical_gates(tmp_path):
+    import json
+    device = _device()
+    code = _layer(device, disk_cache=True, cache_dir=str(tmp_path)).generate_surface_code(3, 'rotated')
+    (path,) = tmp_path.glob('*.json')
+    data = json.loads(path.read_text())
+    data['supported_logical_gates'] = ['STALE']
+    path.write_text(json.dumps(data))
+    LayoutCache.shared().clear()
+    loaded = _layer(device, disk_cache=True, cache_dir=str(tmp_path)).generate_surface_code(3, 'rotated')
+    assert loaded.frozen and list(loaded.supported_logical_gates) == list(code.supported_logical_gates)
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import pytest
+
+pytest.importorskip('stim')
+pytest.importorskip('pymatching')
+
+from scode.rl_agent.ler_evaluator import LEREvaluator
+
+# Repetition-code fallback layout understood by DecoderInterface
+LAYOUT = {'code_distance': 3}
+MAPPING = {0: 0, 1: 1, 2: 2}
+
+
+def test_interval_mode_evaluates_every_n_steps():
+    evaluator = LEREvaluator(mode='interval', interval=3, num_trials=20)
+    reported = [evaluator.after_step(i, False, [LAYOUT], [MAPPING], {'p': 0.01}) for i in range(1, 10)]
+    assert [bool(r) for r in reported] == [False, False, True] * 3
+    assert reported[2]['ler_step'] == 3 and reported[-1]['ler'] == evaluator.latest
+
+
+def test_episode_end_mode_in_process_pool():
+    evaluator = LEREvaluator(mode='episode_end', use_async=True, num_trials=20)
+    try:
+        assert evaluator.after_step(1, False, [LAYOUT], [MAPPING], {'p': 0.01}) == {}
+        evaluator.after_step(2, True, [LAYOUT], [MAPPING], {'p': 0.01})
+        result = evaluator.drain(timeout=60)
+        assert result['ler_episode'] == 0 and result['ler_step'] == 2
+        assert 0.0 <= result['logical_error_rate'] <= 1.0
+    finally:
+        evaluator.close()
+
+
+def _evaluate_in_daemon(queue):
+    evaluator = LEREvaluator(mode='episode_end', use_async=True, max_workers=4, num_trials=20)
+    try:
+        result = evaluator.after_step(1, True, [LAYOUT], [MAPPING], {'p': 0.01}) or evaluator.drain(timeout=60)
+        queue.put((type(evaluator._pool).__name__, evaluator._pool._max_workers, result.get('ler')))
+    except BaseException as e:
+        queue.put((type(e).__name__, None, str(e)))
+    finally:
+        evaluator.close()
+
+
+def test_async_mode_inside_daemonic_vec_env_worker():
+    import multiprocessing
+    ctx = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+    queue = ctx.Queue()
+    worker = ctx.Process(target=_evaluate_in_daemon, args=(queue,), daemon=True)
+    worker.start()
+    pool_type, workers, ler = queue.get(timeout=120)
+    worker.join(timeout=30)
+    assert pool_type == 'ThreadPoolExecutor', ler
+    # Cached matchers and samplers are not thread-safe: a single background thread only
+    assert workers == 1
+    assert 0.0 <= ler <= 1.0
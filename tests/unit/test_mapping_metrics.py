@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+nx = pytest.importorskip('networkx')
+
+from scode.rl_agent.mapping_metrics import MappingMetrics
+
+
+def _code(n, offset=0):
+    adj = nx.grid_2d_graph(n, n)
+    adj = nx.convert_node_labels_to_integers(adj)
+    return SimpleNamespace(adjacency_matrix=adj, qubit_layout={q: {} for q in adj.nodes()},
+                           logical_operators={'X': [0, 1, 2], 'Z': [0, n, 2 * n]})
+
+
+def _hardware(size=8):
+    hw = nx.convert_node_labels_to_integers(nx.grid_2d_graph(size, size))
+    for q in hw.nodes():
+        hw.nodes[q]['error_rate'] = 0.001 * (q % 7)
+    return hw
+
+
+def _reference(hw, codes, mappings):
+    adj = codes[0].adjacency_matrix
+    preserved = sum(1 for a, b in adj.edges() if a in mappings[0] and b in mappings[0]
+                    and hw.has_edge(mappings[0][a], mappings[0][b]))
+    mapped_graph = nx.Graph()
+    for code, mapping in zip(codes, mappings):
+        mapped_graph.add_nodes_from(mapping.values())
+        mapped_graph.add_edges_from((mapping[a], mapping[b]) for a, b in code.adjacency_matrix.edges()
+                                    if a in mapping and b in mapping)
+    errors = [hw.nodes[q]['error_rate'] for m in mappings for q in m.values()]
+    return {
+        'connectivity': preserved / adj.number_of_edges(),
+        'components': nx.number_connected_components(mapped_graph),
+        'used': len({q for m in mappings for q in m.values()}),
+        'avg_error': sum(errors) / len(errors),
+    }
+
+
+def test_incremental_metrics_match_full_recompute():
+    rng = random.Random(3)
+    hw = _hardware()
+    codes = [_code(3), _code(3)]
+    hw_qubits = list(hw.nodes())
+    rng.shuffle(hw_qubits)
+    mappings = [dict(zip(range(9), hw_qubits[:9])), dict(zip(range(7), hw_qubits[9:16]))]
+    metrics = MappingMetrics(hw)
+    metrics.reset(codes, mappings)
+    for _ in range(300):
+        p = rng.randrange(2)
+        q1, q2 = rng.sample(list(mappings[p]), 2)
+        if rng.random() < 0.5:
+            def swap():
+                mappings[p][q1], mappings[p][q2] = mappings[p][q2], mappings[p][q1]
+                return True
+            metrics.apply(p, (q1, q2), swap)
+        else:
+            free = [q for q in hw.nodes() if q not in metrics.usage]
+            target = rng.choice(free)
+            metrics.apply(p, (q1, q2), lambda: mappings[p].__setitem__(q1, target))
+        ref = _reference(hw, codes, mappings)
+        assert metrics.connectivity_score(0) == pytest.approx(ref['connectivity'])
+        assert metrics.num_components() == ref['components']
+        assert metrics.num_nodes() == ref['used']
+        assert metrics.avg_error_rate() == pytest.approx(ref['avg_error'])
+        assert not metrics.has_overlap
+
+
+def test_overlap_is_detected_and_cleared():
+    hw = _hardware(4)
+    codes = [_code(2), _code(2)]
+    mappings = [{0: 0, 1: 1, 2: 4, 3: 5}, {0: 10, 1: 11, 2: 14, 3: 15}]
+    metrics = MappingMetrics(hw)
+    metrics.reset(codes, mappings)
+    assert metrics.num_components() == 2
+    metrics.apply(1, (0,), lambda: mappings[1].__setitem__(0, 0))
+    assert metrics.has_overlap and metrics.num_nodes() == 7
+    # Sharing hardware qubit 0 merges the two patches into one component
+    assert metrics.num_components() == 1
+    metrics.apply(1, (0,), lambda: mappings[1].__setitem__(0, 10))
+    assert not metrics.has_overlap and metrics.num_components() == 2
+    assert metrics.logical_operator_score() == pytest.approx(_logical_score(codes, mappings))
+
+
+def _logical_score(codes, mappings):
+    scores = []
+    for code, mapping in zip(codes, mappings):
+        ratios = [sum(q in mapping for q in ops) / len(ops) for ops in code.logical_operators.values()]
+        scores.append(sum(ratios) / 2.0)
+    return sum(scores) / len(scores)
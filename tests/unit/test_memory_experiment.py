@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import pytest
+
+stim = pytest.importorskip('stim')
+pytest.importorskip('pymatching')
+nx = pytest.importorskip('networkx')
+
+from scode.heuristic_layer.surface_code_object import SurfaceCodeObject
+from scode.utils.decoder_interface import DecoderInterface
+
+
+def _rotated_code(d):
+    """Standard rotated surface code with data qubits on odd coordinates."""
+    layout, data = {}, {}
+    for r in range(d):
+        for c in range(d):
+            q = len(layout)
+            layout[q] = {'x': 2 * c + 1, 'y': 2 * r + 1, 'type': 'data'}
+            data[(2 * c + 1, 2 * r + 1)] = q
+    stabilizers = {'X': [], 'Z': []}
+    for x in range(0, 2 * d + 1, 2):
+        for y in range(0, 2 * d + 1, 2):
+            stab_type = 'X' if ((x + y) // 2) % 2 == 0 else 'Z'
+            support = [data[(x + dx, y + dy)] for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1)) if (x + dx, y + dy) in data]
+            boundary = (stab_type == 'X' and y in (0, 2 * d)) or (stab_type == 'Z' and x in (0, 2 * d))
+            if len(support) == 4 or (len(support) == 2 and boundary):
+                q = len(layout)
+                layout[q] = {'x': x, 'y': y, 'type': f'ancilla_{stab_type}'}
+                stabilizers[stab_type].append({'ancilla': q, 'data_qubits': support})
+    logical = {'X': [data[(1, 2 * r + 1)] for r in range(d)], 'Z': [data[(2 * c + 1, 1)] for c in range(d)]}
+    graph = nx.Graph()
+    graph.add_nodes_from(layout)
+    return SurfaceCodeObject(layout, stabilizers, logical, graph, d, 'rotated')
+
+
+def test_memory_circuit_has_detectors_and_observable():
+    code = _rotated_code(3)
+    circuit = code.to_stim_circuit(None, {'p': 0.001}, rounds=3, basis='Z')
+    # 4 Z detectors in the first round, 8 per later round, 4 closing the final readout
+    assert circuit.num_detectors == 4 + 2 * 8 + 4
+    assert circuit.num_observables == 1
+    dem = circuit.detector_error_model(decompose_errors=True)
+    assert dem.num_errors > 0
+
+
+def test_noiseless_memory_has_no_logical_errors():
+    code = _rotated_code(3)
+    for basis in ('X', 'Z'):
+        result = DecoderInterface.estimate_logical_error_rate_batch(code, None, {'p': 0.0}, num_trials=500, seed=1, logical_op_type=basis)
+        assert result['ler'] == 0.0
+
+
+def test_device_noise_is_taken_from_qubit_properties_and_gate_error_rates():
+    code = _rotated_code(3)
+    mapping = {q: q + 10 for q in code.qubit_layout}
+    noise = {'p': 0.0, 'qubit_properties': {'10': {'readout_error': 0.25}}, 'gate_error_rates': {'cx': 0.02}}
+    text = str(code.to_stim_circuit(mapping, noise, rounds=1))
+    assert 'M(0.25) 10' in text
+    assert 'DEPOLARIZE2(0.02)' in text
+
+
+def test_per_shot_and_batch_agree_on_memory_circuit():
+    code = _rotated_code(3)
+    per_shot = DecoderInterface.estimate_logical_error_rate(code, None, {'p': 0.01}, num_trials=1000, batch=False, seed=5)
+    batch = DecoderInterface.estimate_logical_error_rate(code, None, {'p': 0.01}, num_trials=1000, batch=True, seed=5)
+    assert per_shot == batch
+    assert 0.0 < batch < 0.5
+
+
+@pytest.mark.parametrize('basis', ['Z', 'X'])
+def test_irregular_layout_closes_only_stable_stabilizers(basis):
+    # The X stabilizer on {0, 1} and the Z stabilizer on {1, 2} anticommute, so neither is deterministic
+    layout = {q: {'x': q, 'y': 0, 'type': 'data'} for q in range(4)}
+    layout[4] = {'x': 0, 'y': 1, 'type': 'ancilla_X'}
+    layout[5] = {'x': 1, 'y': 1, 'type': 'ancilla_Z'}
+    stabilizers = {'X': [{'ancilla': 4, 'data_qubits': [0, 1]}], 'Z': [{'ancilla': 5, 'data_qubits': [1, 2]}]}
+    graph = nx.Graph()
+    graph.add_nodes_from(layout)
+    code = SurfaceCodeObject(layout, stabilizers, {'X': [3], 'Z': [3]}, graph, 2, 'irregular')
+    circuit = code.to_stim_circuit(None, {'p': 0.001}, rounds=2, basis=basis)
+    assert circuit.num_detectors == 0
+    assert circuit.num_observables == 1
+    circuit.detector_error_model(decompose_errors=True)
@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+nx = pytest.importorskip('networkx')
+
+from scode.rl_agent.observation_builder import ObservationBuilder
+
+MAX_PATCHES, MAX_QUBITS, NUM_FEATURES = 3, 20, 5
+ROLES = {'data': 1, 'ancilla_X': 2, 'ancilla_Z': 3}
+
+
+def _hardware():
+    hw = nx.convert_node_labels_to_integers(nx.grid_2d_graph(4, 5))
+    for q in hw.nodes():
+        hw.nodes[q]['error_rate'] = 0.01 * (q % 4)
+    return hw
+
+
+def _code(n):
+    types = ['data', 'ancilla_X', 'ancilla_Z', 'flag']
+    return SimpleNamespace(qubit_layout={q: {'type': types[q % 4]} for q in range(n)})
+
+
+def _reference(hw, codes, mappings):
+    features = np.zeros((MAX_PATCHES * MAX_QUBITS, NUM_FEATURES), dtype=np.float32)
+    adjacency = np.zeros((MAX_PATCHES * MAX_QUBITS, MAX_QUBITS), dtype=np.float32)
+    for i, (code, mapping) in enumerate(zip(codes, mappings)):
+        base = i * MAX_QUBITS
+        for q in hw.nodes():
+            features[base + q, 0] = hw.nodes[q]['error_rate']
+        for sc_q, hw_q in mapping.items():
+            features[base + hw_q, ROLES.get(code.qubit_layout[sc_q]['type'], 4)] = 1.0
+        for u, v in hw.edges():
+            adjacency[base + u, v] = adjacency[base + v, u] = 1.0
+    return features, adjacency
+
+
+def test_incremental_roles_match_full_rebuild():
+    rng = random.Random(7)
+    hw = _hardware()
+    codes = [_code(6), _code(5)]
+    hw_qubits = list(hw.nodes())
+    rng.shuffle(hw_qubits)
+    mappings = [dict(zip(range(6), hw_qubits[:6])), dict(zip(range(5), hw_qubits[6:11]))]
+    builder = ObservationBuilder(hw, MAX_PATCHES, MAX_QUBITS, NUM_FEATURES)
+    builder.reset(codes, mappings, patch_count=2)
+    obs = builder.build()
+    for _ in range(100):
+        p = rng.randrange(2)
+        q1, q2 = rng.sample(list(mappings[p]), 2)
+        previous = {q1: mappings[p][q1], q2: mappings[p][q2]}
+        if rng.random() < 0.5:
+            mappings[p][q1], mappings[p][q2] = mappings[p][q2], mappings[p][q1]
+        else:
+            used = {hw_q for m in mappings for hw_q in m.values()}
+            mappings[p][q1] = rng.choice([q for q in hw.nodes() if q not in used])
+        builder.update(p, (q1, q2), previous)
+        assert builder.build() is obs
+        features, adjacency = _reference(hw, codes, mappings)
+        np.testing.assert_array_equal(obs['node_features'], features)
+        np.testing.assert_array_equal(obs['adjacency'], adjacency)
+
+
+def test_action_mask_rows_are_cleared_when_patch_count_shrinks():
+    hw = _hardware()
+    builder = ObservationBuilder(hw, MAX_PATCHES, MAX_QUBITS, NUM_FEATURES)
+    builder.reset([_code(4), _code(4)], [{}, {}], patch_count=2)
+    builder.build(np.ones((6, MAX_QUBITS, MAX_QUBITS), dtype=np.float32))
+    obs = builder.build(np.ones((3, MAX_QUBITS, MAX_QUBITS), dtype=np.float32))
+    assert obs['action_mask'][:3].all() and not obs['action_mask'][3:].any()
+
+
+def test_edge_list_format_matches_device_and_space():
+    hw = _hardware()
+    builder = ObservationBuilder(hw, MAX_PATCHES, MAX_QUBITS, NUM_FEATURES, observation_format='edge_list')
+    builder.reset([_code(4)], [{q: q for q in range(4)}], patch_count=1)
+    masks = np.zeros((3, MAX_QUBITS, MAX_QUBITS), dtype=np.float32)
+    masks[0, 1, 2] = masks[2, 3, 0] = 1.0
+    obs = builder.build(masks)
+    edges = obs['edge_index'][:, obs['edge_mask'] > 0].T
+    assert {tuple(e) for e in edges} == {(u, v) for a, b in hw.edges() for u, v in ((a, b), (b, a))}
+    np.testing.assert_array_equal(obs['qubit_mask'][:3], masks.any(axis=2))
+    assert 'adjacency' not in obs and 'action_mask' not in obs
+    assert builder.observation_space().contains(obs)
+
+
+def test_resolve_observation_dims_from_device_and_curriculum():
+    from scode.rl_agent.env_constants import resolve_observation_dims
+    hardware = {'max_qubits': 16, 'qubit_connectivity': {0: [1], 1: [0, 20], 20: [1]}}
+    config = {
+        'multi_patch_rl_agent': {'environment': {'patch_count': 1}},
+        'curriculum_learning': {'stages': [{'patch_count': 1}, {'patch_count': 4}]},
+    }
+    dims = resolve_observation_dims(config, hardware)
+    assert dims['max_qubits'] == 21 and dims['max_patches'] == 4 and dims['format'] == 'dense'
+    config['multi_patch_rl_agent']['environment']['observation'] = {'max_qubits': 65, 'max_patches': 3}
+    dims = resolve_observation_dims(config, hardware)
+    assert (dims['max_qubits'], dims['max_patches']) == (65, 3)
+    with pytest.raises(ValueError):
+        config['multi_patch_rl_agent']['environment']['observation'] = {'format': 'sparse'}
+        resolve_observation_dims(config, hardware)
+
+
+@pytest.mark.parametrize('observation_format', ['dense', 'edge_list'])
+def test_reset_does_not_overwrite_terminal_observation(observation_format):
+    hw = _hardware()
+    builder = ObservationBuilder(hw, MAX_PATCHES, MAX_QUBITS, NUM_FEATURES, observation_format=observation_format)
+    builder.reset([_code(4)], [{q: q for q in range(4)}], patch_count=1)
+    terminal = builder.build(np.ones((3, MAX_QUBITS, MAX_QUBITS), dtype=np.float32))
+    snapshot = {k: v.copy() for k, v in terminal.items()}
+    builder.reset([_code(4)], [{q: q + 10 for q in range(4)}], patch_count=1)
+    fresh = builder.build(np.zeros((3, MAX_QUBITS, MAX_QUBITS), dtype=np.float32))
+    assert fresh is not terminal
+    for key, value in snapshot.items():
+        np.testing.assert_array_equal(terminal[key], value)
+    assert not np.shares_memory(fresh['node_features'], terminal['node_features'])
+
+
+def test_environment_terminal_observation_survives_reset():
+    import contextlib
+    import io
+    from scode.scripts.benchmark_env_step import build_environment
+    with contextlib.redirect_stdout(io.StringIO()):
+        env = build_environment(3, 'rotated', 1, ler_evaluation={'mode': 'off'})
+        obs, _ = env.reset(seed=0)
+        sc_qubits = list(env.current_mappings[0])
+        obs = env.step([0, 0, sc_qubits[0], sc_qubits[1], 0, 0.0])[0]
+        snapshot = {k: v.copy() for k, v in obs.items()}
+        env.reset(seed=1)
+    for key, value in snapshot.items():
+        np.testing.assert_array_equal(obs[key], value)
+    env.close()
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import os
+
+import numpy as np
+import pytest
+
+from scode.rl_agent.policy_inference import clear_policy_cache, load_policy, run_batched_rollouts, select_best_rollout
+
+
+class CountdownEnv:
+    """Episode of `length` steps whose reward is the reset seed; the action is recorded in the mapping."""
+
+    def __init__(self, length):
+        self.length = length
+        self.current_mappings = [{}]
+
+    def reset(self, seed=None):
+        self.seed, self.t = seed, 0
+        self.current_mappings = [{}]
+        return {'obs': np.array([seed], dtype=np.float32)}, {}
+
+    def step(self, action):
+        self.t += 1
+        self.current_mappings[0][self.t] = int(action)
+        return {'obs': np.array([self.seed], dtype=np.float32)}, float(self.seed), self.t >= self.length, False, {}
+
+
+class BatchModel:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, obs, deterministic=True):
+        self.batch_sizes.append(len(obs['obs']))
+        return obs['obs'][:, 0].astype(int), None
+
+
+def test_rollouts_share_one_predict_per_step():
+    model = BatchModel()
+    envs = [CountdownEnv(2), CountdownEnv(4), CountdownEnv(3)]
+    rollouts = run_batched_rollouts(model, envs, [5, 7, 6])
+    assert model.batch_sizes == [3, 3, 2, 1]
+    assert [r['steps'] for r in rollouts] == [2, 4, 3]
+    assert rollouts[1]['mappings'] == [{1: 7, 2: 7, 3: 7, 4: 7}]
+    assert select_best_rollout(rollouts, 'reward')['seed'] == 7
+    with pytest.raises(ValueError):
+        select_best_rollout(rollouts, 'fastest')
+
+
+def test_load_policy_is_cached_per_file(tmp_path):
+    pytest.importorskip('stable_baselines3')
+    import gymnasium as gym
+    from stable_baselines3 import PPO
+    path = str(tmp_path / 'policy.zip')
+    PPO('MlpPolicy', gym.make('CartPole-v1'), n_steps=8, batch_size=8).save(path)
+    clear_policy_cache()
+    first = load_policy(path, device='cpu')
+    assert load_policy(path, device='cpu') is first
+    # A rewritten artifact is loaded again
+    PPO('MlpPolicy', gym.make('CartPole-v1'), n_steps=8, batch_size=8).save(path)
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+    assert load_policy(path, device='cpu') is not first
+    clear_policy_cache()
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import random
+
+import numpy as np
+
+from scode.rl_agent.reward_engine import MultiPatchRewardEngine
+from scode.rl_agent.reward_history import RewardHistory
+
+
+def test_history_is_bounded_with_exact_window_and_welford_stats():
+    rng = random.Random(3)
+    rewards = [rng.gauss(0.0, 2.0) for _ in range(5000)]
+    history = RewardHistory(capacity=250, window=100)
+    for i, r in enumerate(rewards, 1):
+        history.push(r)
+        if i >= 100 and i % 97 == 0:
+            window = sorted(rewards[i - 100:i])
+            assert (history.window_rank(4), history.window_rank(94)) == (window[4], window[94])
+    assert history.values().shape == (250,)
+    np.testing.assert_array_equal(history.values(), rewards[-250:])
+    assert np.isclose(history.mean, np.mean(rewards)) and np.isclose(history.std, np.std(rewards, ddof=1))
+
+
+def test_percentile_normalization_matches_sorted_window():
+    engine = MultiPatchRewardEngine({'reward_function': {'normalization': 'percentile', 'history_size': 100}})
+    rng = random.Random(5)
+    seen = []
+    for _ in range(400):
+        r = rng.uniform(-10.0, 10.0)
+        seen.append(r)
+        out = engine._normalize_reward(r)
+        if len(seen) > 100:
+            window = sorted(seen[-100:])
+            expected = min(1.0, max(0.0, (r - window[4]) / (window[94] - window[4])))
+            assert out == expected
+    assert len(engine.reward_history.values()) == 100
+
+
+def test_running_mean_std_normalization_uses_welford_stats():
+    engine = MultiPatchRewardEngine({'reward_function': {'normalization': 'running_mean_std'}})
+    rng = random.Random(7)
+    seen = []
+    for _ in range(300):
+        r = rng.gauss(1.0, 3.0) if rng.random() < 0.95 else rng.uniform(-100.0, 100.0)
+        seen.append(r)
+        out = engine._normalize_reward(r)
+        std = max(0.1, np.std(seen, ddof=1)) if len(seen) > 1 else 0.1
+        expected = np.clip((r - np.mean(seen)) / std, -5.0, 5.0)
+        assert np.isclose(out, expected)
+    assert engine._normalize_reward(1e6) == 5.0
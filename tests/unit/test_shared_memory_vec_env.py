@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import numpy as np
+import pytest
+
+pytest.importorskip('stable_baselines3')
+import gymnasium as gym
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from scode.rl_agent.shared_memory_vec_env import SharedMemoryVecEnv, build_vec_env
+
+
+class _CountingEnv(gym.Env):
+    """Dict observations that depend on the seed, the step and the action; episodes last 3 steps."""
+
+    def __init__(self):
+        self.observation_space = spaces.Dict({
+            'features': spaces.Box(low=0, high=100, shape=(4, 2), dtype=np.float32),
+            'mask': spaces.Box(low=0, high=1, shape=(3,), dtype=np.int8),
+        })
+        self.action_space = spaces.Discrete(3)
+        self.t = 0
+
+    def _obs(self):
+        rng = self.np_random
+        return {'features': rng.uniform(0, 100, (4, 2)).astype(np.float32) + self.t,
+                'mask': (np.arange(3) == self.t % 3).astype(np.int8)}
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self.t = 0
+        return self._obs(), {}
+
+    def step(self, action):
+        self.t += 1
+        return self._obs(), float(action) + self.t, self.t >= 3, False, {'t': self.t}
+
+
+def test_matches_dummy_vec_env():
+    shared = SharedMemoryVecEnv([_CountingEnv for _ in range(3)], start_method='fork')
+    dummy = DummyVecEnv([_CountingEnv for _ in range(3)])
+    try:
+        for venv in (shared, dummy):
+            venv.seed(11)
+        obs_s, obs_d = shared.reset(), dummy.reset()
+        for step in range(7):
+            for key in obs_d:
+                np.testing.assert_array_equal(obs_s[key], obs_d[key])
+            actions = np.array([step % 3, 1, 2])
+            obs_s, rew_s, done_s, info_s = shared.step(actions)
+            obs_d, rew_d, done_d, info_d = dummy.step(actions)
+            np.testing.assert_array_equal(rew_s, rew_d)
+            np.testing.assert_array_equal(done_s, done_d)
+            assert [i['t'] for i in info_s] == [i['t'] for i in info_d]
+            if done_s.any():
+                np.testing.assert_array_equal(info_s[0]['terminal_observation']['features'],
+                                              info_d[0]['terminal_observation']['features'])
+        # Returned observations are copies, not views of the shared buffers
+        previous = obs_s['features'].copy()
+        shared.step(np.zeros(3, dtype=np.int64))
+        dummy.step(np.zeros(3, dtype=np.int64))
+        np.testing.assert_array_equal(obs_s['features'], previous)
+        assert shared.get_attr('t') == dummy.get_attr('t')
+    finally:
+        shared.close()
+        dummy.close()
+
+
+def test_build_vec_env_rejects_unknown_strategy():
+    assert isinstance(build_vec_env(_CountingEnv, 1, 'shared_memory'), _CountingEnv)
+    with pytest.raises(ValueError):
+        build_vec_env(_CountingEnv, 2, 'threads')
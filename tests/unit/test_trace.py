@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: PolyForm-Noncommercial-1.0.0
+# SPDX-FileCopyrightText: 2025 Dr. Debasis Mondal <deba10106@gmail.com>
+
+import io
+
+import pytest
+
+from scode.utils.trace import TraceSink
+
+
+class _Unformattable:
+    def __repr__(self):
+        raise AssertionError('disabled records must not be formatted')
+
+
+def test_disabled_levels_are_not_formatted_or_recorded():
+    sink = TraceSink(level='warning')
+    sink.debug('env', 'mapping=%r', _Unformattable())
+    sink.warning('env', 'no logical operators for %s', 'Z')
+    assert [r['message'] for r in sink.records()] == ['no logical operators for Z']
+    sink.configure(level='off')
+    sink.error('env', 'dropped')
+    assert len(sink.records()) == 1
+
+
+def test_ring_buffer_sampling_and_dump():
+    sink = TraceSink(level='debug', capacity=3, sample_every=2)
+    for i in range(10):
+        sink.debug('reward', 'step %d', i)
+    sink.error('decoder', 'failed')
+    assert [r['message'] for r in sink.records()] == ['step 6', 'step 8', 'failed']
+    assert [r['channel'] for r in sink.records('decoder')] == ['decoder']
+    out = io.StringIO()
+    assert sink.dump(out, clear=True) == 3
+    assert '[ERROR][decoder] failed' in out.getvalue()
+    assert sink.records() == []
+    with pytest.raises(ValueError):
+        sink.configure(level='verbose')